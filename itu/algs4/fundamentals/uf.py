@@ -17,9 +17,10 @@ through n-1. The is-connected-to relation must be an equivalence relation:
 
 """
 import sys
-from typing import List
+from array import array
+from typing import List, MutableSequence, Optional, Sequence, Tuple
 
-from itu.algs4.stdlib import stdio
+from itu.algs4.errors.errors import UnsupportedOperationException
 
 
 class UF:
@@ -33,19 +34,44 @@ class UF:
     and the count operation takes constant time. Moreover, the amortized time per union,
     find, and connected operation has inverse Ackermann complexity.
 
+    The sites can be stored in a typed array instead of a list, which takes 4 or 8
+    bytes per site instead of about 36. The union_many and find_many operations
+    process a whole sequence of sites at once, validating the sites once and without
+    a method call per pair. An undoable structure does not compress paths, so its
+    union and find operations take logarithmic time, but checkpoint() marks the
+    current state and rollback() undoes the unions made since, in time proportional
+    to their number.
+
     For additional documentation, see Section 1.5 of Algorithms, 4th Edition by Robert Sedgewick and Kevin Wayne.
     """
 
-    def __init__(self, n: int) -> None:
+    def __init__(
+        self, n: int, typecode: Optional[str] = None, undoable: bool = False
+    ) -> None:
         """Initializes an empty union-find data structure with n sites, 0
         through n-1. Each site is initially in its own component.
 
         :param n: the number of sites
+        :param typecode: the typecode of an array to store the sites in, such as "i"
+                         or "q", or None to store them in a list
+        :param undoable: True to support checkpoint and rollback, in which case
+                         paths are not compressed
 
         """
         self._count: int = n
-        self._parent: List[int] = list(range(n))
-        self._rank: List[int] = [0] * n
+        self._parent: MutableSequence[int]
+        self._rank: MutableSequence[int]
+        if typecode is None:
+            self._parent = list(range(n))
+            self._rank = [0] * n
+        else:
+            self._parent = array(typecode, range(n))
+            self._rank = bytearray(n)  # ranks are at most lg n
+        self._undoable: bool = undoable
+        # every union of an undoable structure since it was created, as pairs of
+        # the root that was linked below another root and whether the rank of
+        # the other root grew; checkpoint() is an index into this list
+        self._history: List[Tuple[int, bool]] = []
 
     def _validate(self, p: int) -> None:
         # validate that p is a valid index
@@ -53,6 +79,12 @@ class UF:
         if p < 0 or p >= n:
             raise ValueError("index {} is not between 0 and {}".format(p, n - 1))
 
+    def _validate_all(self, ps: Sequence[int]) -> None:
+        # validate that all of ps are valid indices
+        if len(ps) > 0:
+            self._validate(min(ps))
+            self._validate(max(ps))
+
     def union(self, p: int, q: int) -> None:
         """Merges the component containing site p with the component containing
         site q.
@@ -68,15 +100,72 @@ class UF:
 
         # make root of smaller rank point to root of larger rank
         if self._rank[root_p] < self._rank[root_q]:
-            self._parent[root_p] = root_q
-        elif self._rank[root_p] > self._rank[root_q]:
-            self._parent[root_q] = root_p
-        else:
-            self._parent[root_q] = root_p
+            root_p, root_q = root_q, root_p
+        self._parent[root_q] = root_p
+        grown = self._rank[root_p] == self._rank[root_q]
+        if grown:
             self._rank[root_p] += 1
+        if self._undoable:
+            self._history.append((root_q, grown))
 
         self._count -= 1
 
+    def union_many(
+        self, ps: Sequence[int], qs: Sequence[int], stop_at: Optional[int] = None
+    ) -> bytearray:
+        """Merges the components containing sites ps[i] and qs[i], for each i
+        in turn. This is equivalent to calling union for each pair, but faster.
+
+        :param ps: the integers representing one site of each pair
+        :param qs: the integers representing the other site of each pair
+        :param stop_at: if given, the pairs after the one that brings the number
+                        of components down to stop_at are skipped, and all of
+                        them are if there are stop_at components or fewer already
+        :return: a bytearray whose entry i is 1 if pair i merged two components,
+                 and 0 if its sites were already connected or it was skipped
+        :raises ValueError: if ps and qs have different lengths
+
+        """
+        if len(ps) != len(qs):
+            raise ValueError("ps and qs must have the same length")
+        self._validate_all(ps)
+        self._validate_all(qs)
+        parent = self._parent
+        rank = self._rank
+        compress = not self._undoable
+        history = self._history
+        merged = bytearray(len(ps))
+        count = self._count
+        if stop_at is not None and count <= stop_at:
+            return merged
+        for i, (p, q) in enumerate(zip(ps, qs)):
+            if compress:
+                while p != parent[p]:
+                    parent[p] = p = parent[parent[p]]
+                while q != parent[q]:
+                    parent[q] = q = parent[parent[q]]
+            else:
+                while p != parent[p]:
+                    p = parent[p]
+                while q != parent[q]:
+                    q = parent[q]
+            if p == q:
+                continue
+            if rank[p] < rank[q]:
+                p, q = q, p
+            parent[q] = p
+            grown = rank[p] == rank[q]
+            if grown:
+                rank[p] += 1
+            if not compress:
+                history.append((q, grown))
+            merged[i] = 1
+            count -= 1
+            if stop_at is not None and count <= stop_at:
+                break
+        self._count = count
+        return merged
+
     def find(self, p: int) -> int:
         """Returns the component identifier for the component containing site
         p.
@@ -86,13 +175,39 @@ class UF:
 
         """
         self._validate(p)
-        while p != self._parent[p]:
-            self._parent[p] = self._parent[
-                self._parent[p]
-            ]  # path compression by halving
-            p = self._parent[p]
+        parent = self._parent
+        if self._undoable:
+            while p != parent[p]:
+                p = parent[p]
+            return p
+        while p != parent[p]:
+            parent[p] = p = parent[parent[p]]  # path compression by halving
         return p
 
+    def find_many(self, ps: Sequence[int]) -> List[int]:
+        """Returns the component identifiers for the components containing
+        the sites ps. This is equivalent to calling find for each site, but
+        faster.
+
+        :param ps: the integers representing the sites
+        :return: the list of the component identifiers of the sites, in order
+
+        """
+        self._validate_all(ps)
+        parent = self._parent
+        roots = []
+        if self._undoable:
+            for p in ps:
+                while p != parent[p]:
+                    p = parent[p]
+                roots.append(p)
+            return roots
+        for p in ps:
+            while p != parent[p]:
+                parent[p] = p = parent[parent[p]]
+            roots.append(p)
+        return roots
+
     def connected(self, p: int, q: int) -> bool:
         """Returns true if the two sites are in the same component.
 
@@ -106,6 +221,41 @@ class UF:
     def count(self) -> int:
         return self._count
 
+    def checkpoint(self) -> int:
+        """Marks the current state of an undoable structure, so that
+        rollback() can return to it.
+
+        :return: the checkpoint, to pass to rollback
+        :raises UnsupportedOperationException: unless the structure is undoable
+
+        """
+        if not self._undoable:
+            raise UnsupportedOperationException("union-find is not undoable")
+        return len(self._history)
+
+    def rollback(self, checkpoint: int) -> None:
+        """Undoes the unions made since checkpoint, most recent first. The
+        checkpoints taken after it are no longer valid.
+
+        :param checkpoint: a checkpoint returned by checkpoint()
+        :raises UnsupportedOperationException: unless the structure is undoable
+        :raises ValueError: if checkpoint is not a valid checkpoint
+
+        """
+        if not self._undoable:
+            raise UnsupportedOperationException("union-find is not undoable")
+        history = self._history
+        if checkpoint < 0 or checkpoint > len(history):
+            raise ValueError("invalid checkpoint {}".format(checkpoint))
+        parent = self._parent
+        rank = self._rank
+        while len(history) > checkpoint:
+            q, grown = history.pop()
+            if grown:
+                rank[parent[q]] -= 1
+            parent[q] = q
+            self._count += 1
+
 
 class QuickUnionUF:
     """
@@ -346,6 +496,8 @@ class QuickFindUF:
 # in the pair represents some site; if the sites are in different
 # components, merge the two components and print the pair to standard output.
 if __name__ == "__main__":
+    from itu.algs4.stdlib import stdio
+
     if len(sys.argv) > 1:
         try:
             sys.stdin = open(sys.argv[1])
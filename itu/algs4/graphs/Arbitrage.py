@@ -5,7 +5,7 @@
 import math
 import sys
 
-from itu.algs4.graphs.bellman_ford_sp import BellmanFordSP
+from itu.algs4.graphs.bellman_ford_array_sp import BellmanFordArraySP
 from itu.algs4.graphs.directed_edge import DirectedEdge
 from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
 from itu.algs4.stdlib import stdio
@@ -16,7 +16,8 @@ if __name__ == "__main__":
     representation of the exchange table and then finding a negative cycle in
     the digraph.
 
-    This implementation uses the Bellman-Ford algorithm to find a negative cycle in
+    This implementation uses the Bellman-Ford algorithm (BellmanFordArraySP, which
+    detects negative cycles by subtree disassembly) to find a negative cycle in
     the complete digraph. The running time is proportional to V3 in the worst case,
     where V is the number of currencies.
 
@@ -43,10 +44,12 @@ if __name__ == "__main__":
             graph.add_edge(edge)
 
     # find negative cycle
-    spt = BellmanFordSP(graph, 0)
+    spt = BellmanFordArraySP(graph, 0)
     if spt.has_negative_cycle():
         stake = 1000.0
         for edge in spt.negative_cycle():
-            print("{} {}", stake, name[edge.from_vertex()])
+            print("{:10.5f} {} ".format(stake, name[edge.from_vertex()]), end="")
             stake *= math.exp(-edge.weight())
-            print("{} {}")
+            print("= {:10.5f} {}".format(stake, name[edge.to_vertex()]))
+    else:
+        print("No arbitrage opportunity")
@@ -0,0 +1,255 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements the Bellman-Ford-Moore algorithm with subtree
+disassembly (Tarjan, 1981) on the flat edge arrays of a CSR digraph.
+
+The algorithm keeps the current shortest-paths tree as a preorder thread: a
+doubly-linked list of its vertices in depth-first order, with the depth of
+each vertex. When the distance to a vertex w decreases, the paths to all its
+descendants in the tree are no longer shortest, so the whole subtree of w is
+cut out of the thread and its vertices are deactivated; they will be reached
+again through w. If the tail of the improving edge lies in that subtree, the
+edge closes a cycle of the tree whose weight is negative, and the algorithm
+stops at once. This finds a negative cycle as soon as the tree contains one,
+instead of searching the predecessor graph every V relaxations.
+
+"""
+
+import sys
+from array import array
+
+from itu.algs4.errors.errors import (
+    IllegalArgumentException,
+    UnsupportedOperationException,
+)
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.csr_edge_weighted_digraph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.stdlib.instream import InStream
+
+
+class BellmanFordArraySP:
+    """The BellmanFordArraySP class represents a data type for solving the
+    single-source shortest paths problem in edge-weighted digraphs with no
+    negative cycles, with the same API as BellmanFordSP. The edge weights can
+    be positive, negative, or zero. This class finds either a shortest path
+    from the source vertex s to every other vertex or a negative cycle
+    reachable from the source vertex.
+
+    This implementation stores the edges as parallel target and weight
+    arrays grouped by their tail (the CSR form of the digraph), relaxes the
+    edges of the vertices whose distance changed in passes over a flat list
+    of active vertices, and detects negative cycles by subtree disassembly.
+    The constructor takes time proportional to V E in the worst case, and
+    usually far less. Each call to dist_to(), has_path_to() and
+    has_negative_cycle() takes constant time; each call to path_to() and
+    negative_cycle() takes time proportional to the length of the path
+    returned.
+
+    """
+
+    def __init__(self, G, s):
+        """Computes a shortest paths tree from s to every other vertex in the
+        edge-weighted digraph G, or finds a negative cycle reachable from s.
+
+        :param G: the edge-weighted digraph, or a CSREdgeWeightedDigraph
+        :param s: the source vertex
+        :raises IllegalArgumentException: unless 0 <= s < V
+
+        """
+        if isinstance(G, CSREdgeWeightedDigraph):
+            csr = G
+        else:
+            csr = CSREdgeWeightedDigraph.from_graph(G)
+        V = csr.V()
+        self._G = csr
+        self._dist_to = array("d", [float("inf")]) * V
+        self._edge_to = array("q", [-1]) * V  # index of the last edge in CSR
+        self._pred = array("i", [-1]) * V  # tail of that edge
+        self._cycle = None  # negative cycle (or None if no such cycle)
+        self._validate_vertex(s)
+        self._bellman_ford(csr, s)
+
+    def _bellman_ford(self, G, s):
+        V = G.V()
+        offsets, targets, weights = G.arrays()
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        pred = self._pred
+        # the tree as a circular preorder thread; depth -1 means not in it
+        succ = array("i", [-1]) * V
+        prev = array("i", [-1]) * V
+        depth = array("i", [-1]) * V
+        active = bytearray(V)  # is the vertex waiting to be scanned?
+
+        dist_to[s] = 0.0
+        succ[s] = prev[s] = s
+        depth[s] = 0
+        active[s] = 1
+        frontier = [s]
+        while frontier:
+            following = []
+            for v in frontier:
+                if not active[v]:
+                    continue  # cut out of the tree since it was queued
+                active[v] = 0
+                dist_v = dist_to[v]
+                for i in range(offsets[v], offsets[v + 1]):
+                    w = targets[i]
+                    d = dist_v + weights[i]
+                    if d >= dist_to[w]:
+                        continue
+                    if depth[w] != -1:
+                        # cut the subtree of w, which follows w in the
+                        # thread, out of the tree
+                        top = depth[w]
+                        before = prev[w]
+                        x = w
+                        while True:
+                            if x == v:
+                                self._cycle = self._close_cycle(v, w, i)
+                                return
+                            active[x] = 0
+                            depth[x] = -1
+                            x = succ[x]
+                            if depth[x] <= top:
+                                break
+                        succ[before] = x
+                        prev[x] = before
+                    dist_to[w] = d
+                    edge_to[w] = i
+                    pred[w] = v
+                    # w becomes a leaf right after v in preorder
+                    after = succ[v]
+                    succ[v] = w
+                    prev[w] = v
+                    succ[w] = after
+                    prev[after] = w
+                    depth[w] = depth[v] + 1
+                    if not active[w]:
+                        active[w] = 1
+                        following.append(w)
+            frontier = following
+
+    def _close_cycle(self, v, w, i):
+        # returns the negative cycle formed by the tree path from w to v and
+        # the edge i from v to w
+        weights = self._G.arrays()[2]
+        cycle = Stack()
+        cycle.push(DirectedEdge(v, w, weights[i]))
+        x = v
+        while x != w:
+            u = self._pred[x]
+            cycle.push(DirectedEdge(u, x, weights[self._edge_to[x]]))
+            x = u
+        return cycle
+
+    def has_negative_cycle(self):
+        """Is there a negative cycle reachable from the source vertex s?
+
+        :return: True if there is a negative cycle reachable from the source
+                 vertex s, and False otherwise
+
+        """
+        return self._cycle is not None
+
+    def negative_cycle(self):
+        """Returns a negative cycle reachable from the source vertex s, or
+        None if there is no such cycle.
+
+        :return: a negative cycle reachable from the source vertex s as an
+                 iterable of edges, and None if there is no such cycle
+
+        """
+        return self._cycle
+
+    def dist_to(self, v):
+        """Returns the length of a shortest path from the source vertex s to
+        vertex v.
+
+        :param v: the destination vertex
+        :return: the length of a shortest path from the source vertex s to vertex v;
+                 float('inf') if no such path
+        :raises UnsupportedOperationException: if there is a negative cost cycle
+                                               reachable from the source vertex s
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        if self.has_negative_cycle():
+            raise UnsupportedOperationException("Negative cost cycle exists")
+        return self._dist_to[v]
+
+    def has_path_to(self, v):
+        """Is there a path from the source s to vertex v?
+
+        :param v: the destination vertex
+        :return: True if there is a path from the source vertex s to vertex v,
+                 and False otherwise
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._dist_to[v] < float("inf")
+
+    def path_to(self, v):
+        """Returns a shortest path from the source s to vertex v.
+
+        :param v: the destination vertex
+        :return: a shortest path from the source s to vertex v as an iterable
+                 of edges, and None if no such path
+        :raises UnsupportedOperationException: if there is a negative cost cycle
+                                               reachable from the source vertex s
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        if self.has_negative_cycle():
+            raise UnsupportedOperationException("Negative cost cycle exists")
+        if not self.has_path_to(v):
+            return None
+        weights = self._G.arrays()[2]
+        path = Stack()
+        w = v
+        while self._edge_to[w] != -1:
+            u = self._pred[w]
+            path.push(DirectedEdge(u, w, weights[self._edge_to[w]]))
+            w = u
+        return path
+
+    def _validate_vertex(self, v):
+        # raise an IllegalArgumentException unless 0 <= v < V
+        V = len(self._dist_to)
+        if v < 0 or v >= V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, V - 1)
+            )
+
+
+def main(args):
+    stream = InStream(args[0])
+    s = int(args[1])
+    G = EdgeWeightedDigraph.from_stream(stream)
+    sp = BellmanFordArraySP(G, s)
+
+    # print negative cycle
+    if sp.has_negative_cycle():
+        for e in sp.negative_cycle():
+            print(e)
+    # print shortest paths
+    else:
+        for v in range(G.V()):
+            if sp.has_path_to(v):
+                print("{} to {} ({})  ".format(s, v, sp.dist_to(v)))
+                for e in sp.path_to(v):
+                    print("{}\t".format(e), end="")
+                print()
+            else:
+                print("{} to {} no path".format(s, v))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,271 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+import sys
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.stdlib.instream import InStream
+
+_FORWARD = 0
+_REVERSE = 1
+
+
+class BidirectionalDijkstraSP:
+    """The BidirectionalDijkstraSP class represents a data type for answering
+    point-to-point shortest path queries in an edge-weighted digraph where the
+    edge weights are nonnegative.
+
+    Unlike DijkstraSP, no work is done for a source vertex up front. Each
+    query runs bidirectional Dijkstra: one search grows from the source along
+    the edges of the digraph, another grows from the target along the edges
+    of its reverse, and the query ends as soon as the sum of the smallest keys
+    of the two priority queues reaches the length of the shortest path seen so
+    far. If a potential function is given, each query instead runs A*, a
+    Dijkstra search from the source that orders the vertices by their
+    distance plus their potential and stops as soon as the target is settled.
+    Either way, a query typically settles only the vertices near a shortest
+    path, not the whole digraph.
+
+    The constructor takes time proportional to V + E. A query takes time
+    proportional to E log V in the worst case, but only to the number of
+    edges of the vertices it reaches in practice; the state of the previous
+    query is reset in time proportional to its size. The result of the last
+    query is kept, so asking for dist(), has_path() and path() of the same
+    pair of vertices runs one search.
+
+    """
+
+    def __init__(self, G, potential=None):
+        """Prepares point-to-point shortest path queries in the edge-weighted
+        digraph G.
+
+        :param G: the edge-weighted digraph
+        :param potential: None for bidirectional Dijkstra, or a function
+                          potential(v, t) returning a lower bound on the length
+                          of a shortest path from v to t for A*. It must be
+                          consistent: for every edge e from v to w,
+                          potential(v, t) <= e.weight() + potential(w, t).
+        :raises IllegalArgumentException: if an edge weight is negative
+
+        """
+        V = G.V()
+        reverse = [[] for _ in range(V)]  # edges into each vertex
+        for e in G.edges():
+            if e.weight() < 0:
+                raise IllegalArgumentException("edge {} has negative weight".format(e))
+            reverse[e.to_vertex()].append(e)
+        self._G = G
+        self._reverse = reverse
+        self._potential = potential
+
+        # per-query state, indexed by direction and reused between queries
+        self._dist_to = [[float("inf")] * V, [float("inf")] * V]
+        self._edge_to = [[None] * V, [None] * V]
+        self._pq = [IndexMinPQ(V), IndexMinPQ(V)]
+        self._touched = []  # vertices whose state must be reset
+        self._query = None  # (s, t) of the last query
+        self._dist = float("inf")  # length of a shortest path of the last query
+        self._meet = None  # vertex on that path reached by both searches
+
+    def dist(self, source, target):
+        """Returns the length of a shortest path from the source vertex to the
+        target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: the length of a shortest path from the source vertex to the target vertex;
+                  float('inf') if no such path
+        :raises IllegalArgumentException: unless 0 <= source < V and 0 <= target < V
+
+        """
+        self._search(source, target)
+        return self._dist
+
+    def has_path(self, source, target):
+        """Is there a path from the source vertex to the target vertex?
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: True if there is a path from the source to the target, and False otherwise
+        :raises IllegalArgumentException: unless 0 <= source < V and 0 <= target < V
+
+        """
+        return self.dist(source, target) < float("inf")
+
+    def path(self, source, target):
+        """Returns a shortest path from the source vertex to the target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+        :returns: a shortest path from the source vertex to the target vertex as an iterable of edges,
+                  and None if no such path
+        :raises IllegalArgumentException: unless 0 <= source < V and 0 <= target < V
+
+        """
+        if not self.has_path(source, target):
+            return None
+        forward, reverse = self._edge_to
+        path = Stack()
+        # the part from the meeting vertex to the target, pushed last edge first
+        tail = []
+        e = reverse[self._meet]
+        while e is not None:
+            tail.append(e)
+            e = reverse[e.to_vertex()]
+        for e in reversed(tail):
+            path.push(e)
+        # the part from the source to the meeting vertex
+        e = forward[self._meet]
+        while e is not None:
+            path.push(e)
+            e = forward[e.from_vertex()]
+        return path
+
+    def _search(self, s, t):
+        # answers the query from s to t, unless it was the last one
+        self._validate_vertex(s)
+        self._validate_vertex(t)
+        if self._query == (s, t):
+            return
+        self._reset()
+        self._query = (s, t)
+        if self._potential is None:
+            self._bidirectional(s, t)
+        else:
+            self._a_star(s, t)
+
+    def _reset(self):
+        # undoes the changes of the last query to the per-query state
+        inf = float("inf")
+        for direction in (_FORWARD, _REVERSE):
+            dist_to = self._dist_to[direction]
+            edge_to = self._edge_to[direction]
+            for v in self._touched:
+                dist_to[v] = inf
+                edge_to[v] = None
+            pq = self._pq[direction]
+            while not pq.is_empty():
+                pq.del_min()
+        self._touched = []
+        self._dist = inf
+        self._meet = None
+
+    def _bidirectional(self, s, t):
+        dist_f, dist_r = self._dist_to
+        pq_f, pq_r = self._pq
+        dist_f[s] = 0.0
+        dist_r[t] = 0.0
+        self._touched.extend((s, t))
+        pq_f.insert(s, 0.0)
+        pq_r.insert(t, 0.0)
+        if s == t:
+            self._dist = 0.0
+            self._meet = s
+            return
+
+        # once one queue is empty, every path through its side is known
+        while not pq_f.is_empty() and not pq_r.is_empty():
+            key_f = pq_f.min_key()
+            key_r = pq_r.min_key()
+            if key_f + key_r >= self._dist:
+                break
+            if key_f <= key_r:
+                v = pq_f.del_min()
+                for e in self._G.adj(v):
+                    self._relax(_FORWARD, v, e.to_vertex(), e)
+            else:
+                v = pq_r.del_min()
+                for e in self._reverse[v]:
+                    self._relax(_REVERSE, v, e.from_vertex(), e)
+
+    def _relax(self, direction, v, w, e):
+        # relaxes the edge e, which leads from v to w in the given direction,
+        # and records a shorter path through w if both searches reached it
+        dist_to = self._dist_to[direction]
+        d = dist_to[v] + e.weight()
+        if d >= dist_to[w]:
+            return
+        if dist_to[w] == float("inf"):
+            self._touched.append(w)
+        dist_to[w] = d
+        self._edge_to[direction][w] = e
+        pq = self._pq[direction]
+        if pq.contains(w):
+            pq.decrease_key(w, d)
+        else:
+            pq.insert(w, d)
+        d += self._dist_to[1 - direction][w]
+        if d < self._dist:
+            self._dist = d
+            self._meet = w
+
+    def _a_star(self, s, t):
+        potential = self._potential
+        dist_to = self._dist_to[_FORWARD]
+        edge_to = self._edge_to[_FORWARD]
+        pq = self._pq[_FORWARD]
+        dist_to[s] = 0.0
+        self._touched.append(s)
+        pq.insert(s, potential(s, t))
+        while not pq.is_empty():
+            v = pq.del_min()
+            if v == t:
+                self._dist = dist_to[t]
+                self._meet = t
+                return
+            for e in self._G.adj(v):
+                w = e.to_vertex()
+                d = dist_to[v] + e.weight()
+                if d >= dist_to[w]:
+                    continue
+                if dist_to[w] == float("inf"):
+                    self._touched.append(w)
+                dist_to[w] = d
+                edge_to[w] = e
+                key = d + potential(w, t)
+                if not pq.contains(w):
+                    pq.insert(w, key)
+                elif key < pq.key_of(w):  # adding the potential may round
+                    pq.decrease_key(w, key)
+
+    def _validate_vertex(self, v):
+        """Raises an IllegalArgumentException unless 0 <= v < V.
+
+        :param v: the vertex to be validated
+
+        """
+        V = len(self._reverse)
+        if v < 0 or v >= V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, V - 1)
+            )
+
+
+def main():
+    """Creates an EdgeWeightedDigraph from input file and prints a shortest
+    path between the given source and target vertices.
+
+    python bidirectional_dijkstra_sp.py tinyEWD.txt 0 6
+
+    """
+    if len(sys.argv) == 4:
+        stream = InStream(sys.argv[1])
+        G = EdgeWeightedDigraph.from_stream(stream)
+        s = int(sys.argv[2])
+        t = int(sys.argv[3])
+        sp = BidirectionalDijkstraSP(G)
+        if sp.has_path(s, t):
+            print("{} to {} ({:.2f})  ".format(s, t, sp.dist(s, t)), end="")
+            for e in sp.path(s, t):
+                print(e, end="   ")
+            print()
+        else:
+            print("{} to {}         no path\n".format(s, t))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,8 +2,11 @@
 # see README.md for details
 # This is python3
 
+import sys
+
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
 
 
 class Bipartite:
@@ -13,7 +16,8 @@ class Bipartite:
     color operation determines a bipartition if not, the oddCycle operation
     determines a cycle with an odd number of edges.
 
-    This implementation uses depth-first search. The constructor takes
+    This implementation uses depth-first search with an explicit stack
+    (see iterative_dfs). The constructor takes
     time proportional to V + E (in the worst case), where V is the
     number of vertices and E is the number of edges. Afterwards, the
     isBipartite and color operations take constant time the oddCycle
@@ -42,38 +46,41 @@ class Bipartite:
         self._cycle = None  # odd-length cycle
 
         for v in range(G.V()):
-            if not self._marked[v]:
-                self._dfs(G, v)
+            if not self._marked[v] and self._dfs(G, v):
+                break
 
         assert self._check(G)
 
-    def _dfs(self, G, v):
-        self._marked[v] = True
-
-        for w in G.adj(v):
-            # short circuit if odd-length cycle found
-            if self._cycle is not None:
-                return
-
-            # found uncolored vertex, so recur
-            if not self._marked[w]:
-                self._edge_to[w] = v
-                self._color[w] = not self._color[v]
-                self._dfs(G, w)
-
-            # if v-w create an odd-length cycle, find it
-            elif self._color[w] == self._color[v]:
-                self._is_bipartite = False
-                self._cycle = Stack()
-                self._cycle.push(
-                    w
-                )  # don't need this unless you want to include start vertex twice
-                x = v
-                while x != w:
-                    self._cycle.push(x)
-                    x = self._edge_to[x]
-
-                self._cycle.push(w)
+    def _dfs(self, G, s):
+        # returns True if an odd-length cycle is found in the component of s
+        color = self._color
+        edge_to = self._edge_to
+
+        # found uncolored vertex, so color it
+        def tree_edge(v, w, e):
+            edge_to[w] = v
+            color[w] = not color[v]
+
+        # if v-w create an odd-length cycle, find it
+        def non_tree_edge(v, w, e):
+            if color[w] != color[v]:
+                return False
+            self._is_bipartite = False
+            self._cycle = Stack()
+            self._cycle.push(
+                w
+            )  # don't need this unless you want to include start vertex twice
+            x = v
+            while x != w:
+                self._cycle.push(x)
+                x = edge_to[x]
+
+            self._cycle.push(w)
+            return True
+
+        return iterative_dfs(
+            G, s, self._marked, tree_edge=tree_edge, non_tree_edge=non_tree_edge
+        )
 
     def is_bipartite(self):
         """Returns True if the graph is bipartite.
@@ -0,0 +1,138 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module computes the transitive closure of a digraph on its
+condensation, with one bitset of reachable strong components per component.
+
+All vertices of a strong component reach the same vertices, so the closure
+only has to be stored once per component. TarjanSCC numbers the
+components in reverse topological order (an edge between two components
+always leads to one with a smaller id), so a single pass in increasing order
+of id finds the bitset of each component as the union of the bitsets of its
+successors. The bitsets are built as Python ints and then packed into one
+bytearray, which takes C^2 / 8 bytes for C components instead of the V^2
+list entries of TransitiveClosure.
+
+"""
+
+import sys
+from array import array
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.tarjan_scc import TarjanSCC
+from itu.algs4.stdlib.instream import InStream
+
+
+class BitsetTransitiveClosure:
+    """The BitsetTransitiveClosure class represents a data type for computing
+    the transitive closure of a digraph and answering reachability queries,
+    like TransitiveClosure.
+
+    This implementation condenses the digraph into its strong components
+    with TarjanSCC and propagates the sets of reachable components
+    through the condensation in reverse topological order, as bitsets. The
+    constructor takes time proportional to V + E plus C / 64 word operations
+    for each edge between two components, and uses C^2 / 8 bytes for the
+    closure, where C is the number of strong components. Each reachable()
+    query takes constant time.
+
+    """
+
+    def __init__(self, G):
+        """Computes the transitive closure of the digraph G.
+
+        :param G: the digraph
+
+        """
+        scc = TarjanSCC(G)
+        V = G.V()
+        C = scc.count()
+        id_ = array("i", (scc.id(v) for v in range(V)))
+
+        # the vertices of each component, by counting sort on the id
+        start = array("q", bytes(8 * (C + 1)))
+        for c in id_:
+            start[c + 1] += 1
+        for c in range(C):
+            start[c + 1] += start[c]
+        members = array("i", bytes(4 * V))
+        fill = start[:-1]
+        for v in range(V):
+            c = id_[v]
+            members[fill[c]] = v
+            fill[c] += 1
+
+        # reach[c] has bit d set iff component c reaches component d; the
+        # successors of c all have smaller ids, so their bitsets are done
+        reach = [0] * C
+        last = array("i", [-1]) * C  # last component that merged in d
+        for c in range(C):
+            r = 1 << c
+            for i in range(start[c], start[c + 1]):
+                for w in G.adj(members[i]):
+                    d = id_[w]
+                    if d != c and last[d] != c:
+                        last[d] = c
+                        r |= reach[d]
+            reach[c] = r
+
+        row = (C + 7) // 8
+        closure = bytearray(C * row)
+        for c in range(C):
+            closure[c * row : (c + 1) * row] = reach[c].to_bytes(row, "little")
+            reach[c] = None
+        self._id = id_
+        self._row = row
+        self._closure = closure
+
+    def reachable(self, v, w):
+        """Is there a directed path from vertex v to vertex w in the digraph?
+
+        :param v: the source vertex
+        :param w: the target vertex
+        :returns: True if there is a directed path from v to w, False otherwise
+        :raises IllegalArgumentException: unless 0 <= v < V and 0 <= w < V
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        d = self._id[w]
+        return bool(self._closure[self._id[v] * self._row + (d >> 3)] >> (d & 7) & 1)
+
+    def _validate_vertex(self, v):
+        # throw an IllegalArgumentException unless 0 <= v < V
+        V = len(self._id)
+        if v < 0 or v >= V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, V - 1)
+            )
+
+
+def main(args):
+    stream = InStream(args[0])
+    G = Digraph.from_stream(stream)
+
+    tc = BitsetTransitiveClosure(G)
+
+    # print header
+    print("     ", end="")
+    for v in range(G.V()):
+        print("{x:3d}".format(x=v), end="")
+    print()
+    print("--------------------------------------------")
+
+    # print transitive closure
+    for v in range(G.V()):
+        print("{x:3d}: ".format(x=v), end="")
+        for w in range(G.V()):
+            if tc.reachable(v, w):
+                print("  T", end="")
+            else:
+                print("   ", end="")
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
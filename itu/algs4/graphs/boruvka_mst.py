@@ -0,0 +1,200 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements Boruvka's algorithm for minimum spanning trees,
+with the search for the cheapest edges of each round split across a pool of
+worker processes.
+
+The edges are sorted once by weight, with ties broken by their position in
+the input, so that the rank of an edge in that order is a total order on the
+edges and no round can close a cycle. Every round, each worker scans a range
+of ranks against the current component of every vertex and reports, for each
+component, the first crossing edge it sees, which is the cheapest one in its
+range. The cheapest edge of each component over all ranges is then added to
+the tree, and the components are contracted with union-find. Each round at
+least halves the number of components, so there are at most log V rounds.
+
+"""
+
+import multiprocessing
+import os
+import sys
+from array import array
+from itertools import compress
+
+from itu.algs4.fundamentals.queue import Queue
+from itu.algs4.fundamentals.uf import UF
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.stdlib.instream import InStream
+
+_PARALLEL_CUTOFF = 1 << 15  # fewest edges for which the rounds use the pool
+
+_either = None  # the endpoints of the edges in the worker process, by rank
+_other = None
+
+
+def _load(either, other):
+    # initializer of the worker processes
+    global _either, _other
+    _either = array("i")
+    _either.frombytes(either)
+    _other = array("i")
+    _other.frombytes(other)
+
+
+def _cheapest(either, other, comp, lo, hi, count):
+    # returns a dict from each component to the rank of the cheapest edge in
+    # the range [lo, hi) of ranks that leaves it; stops early once all count
+    # components have one
+    best = {}
+    for r in range(lo, hi):
+        c = comp[either[r]]
+        d = comp[other[r]]
+        if c == d:
+            continue
+        if c not in best:
+            best[c] = r
+        if d not in best:
+            best[d] = r
+        if len(best) == count:
+            break
+    return best
+
+
+def _run_ranks(task):
+    # finds the cheapest edges of the range of ranks in the worker
+    comp, lo, hi, count = task
+    labels = array("i")
+    labels.frombytes(comp)
+    return _cheapest(_either, _other, labels, lo, hi, count)
+
+
+class BoruvkaMST:
+    """The BoruvkaMST class represents a data type for computing a minimum
+    spanning tree in an edge-weighted graph, with the same API as
+    KruskalMST.
+
+    The edge weights can be positive, zero, or negative and need not be
+    distinct. If the graph is not connected, it computes a minimum spanning
+    forest, which is the union of minimum spanning trees in each connected
+    component. This implementation uses Boruvka's algorithm: the selection
+    of the cheapest edge leaving each component runs in a pool of worker
+    processes, and the components are contracted with UF on integer arrays,
+    through union_many and find_many. A graph with fewer than cutoff edges,
+    for which the pool costs more than the rounds themselves, is handled in
+    this process. The constructor takes time
+    proportional to E log E for the initial sort plus E log V for the rounds,
+    divided by the number of processes, and extra space proportional to
+    E + V. Afterwards, the weight method takes constant time and the edges
+    method takes time proportional to V.
+
+    """
+
+    def __init__(self, G, processes=None, chunk_size=None, cutoff=None):
+        """Computes a minimum spanning tree (or forest) of an edge-weighted
+        graph.
+
+        :param G: the edge-weighted graph
+        :param processes: the number of worker processes; defaults to the
+                          number of CPUs, and 1 runs all rounds in this process
+        :param chunk_size: the number of edges scanned per task; by default,
+                           each process gets about four tasks per round
+        :param cutoff: the fewest edges for which the rounds are split over
+                       the worker processes; a graph with fewer edges is
+                       handled without starting any
+
+        """
+        edges = list(G.edges())
+        order = sorted(range(len(edges)), key=lambda i: edges[i].weight())
+        either = array("i")
+        other = array("i")
+        for i in order:
+            v = edges[i].either()
+            either.append(v)
+            other.append(edges[i].other(v))
+        edges = [edges[i] for i in order]
+
+        E = len(edges)
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, -(-E // (4 * processes)))
+        self._weight = 0
+        self._mst = Queue()
+
+        chunks = [(lo, min(lo + chunk_size, E)) for lo in range(0, E, chunk_size)]
+        if cutoff is None:
+            cutoff = _PARALLEL_CUTOFF
+        if processes == 1 or len(chunks) <= 1 or E < cutoff:
+            self._boruvka(G.V(), edges, either, other, None, chunks)
+            return
+        initargs = (either.tobytes(), other.tobytes())
+        with multiprocessing.Pool(processes, _load, initargs) as pool:
+            self._boruvka(G.V(), edges, either, other, pool, chunks)
+
+    def _boruvka(self, V, edges, either, other, pool, chunks):
+        uf = UF(V, "i")
+        comp = array("i", range(V))
+        while uf.count() > 1:
+            count = uf.count()
+            # the cheapest edge leaving each component, as its rank
+            if pool is None:
+                parts = [_cheapest(either, other, comp, 0, len(edges), count)]
+            else:
+                comp_bytes = comp.tobytes()
+                tasks = [(comp_bytes, lo, hi, count) for lo, hi in chunks]
+                parts = pool.map(_run_ranks, tasks)
+            best = {}
+            for part in parts:
+                for c, r in part.items():
+                    if r < best.get(c, len(edges)):
+                        best[c] = r
+            if not best:
+                break  # every component is a connected component of G
+
+            # add those edges to the tree and contract along them
+            ranks = sorted(set(best.values()))
+            ps = array("i", [either[r] for r in ranks])
+            qs = array("i", [other[r] for r in ranks])
+            for r in compress(ranks, uf.union_many(ps, qs)):
+                self._mst.enqueue(edges[r])
+                self._weight += edges[r].weight()
+
+            # relabel every vertex with the root of its component
+            comp = array("i", uf.find_many(range(V)))
+
+    def edges(self):
+        """Returns the edges in a minimum spanning tree (or forest).
+
+        :return: the edges in a minimum spanning tree (or forest)
+
+        """
+        return self._mst
+
+    def weight(self):
+        """Returns the sum of the edge weights in a minimum spanning tree (or
+        forest).
+
+        :return: the sum of the edge weights in a minimum spanning tree (or forest)
+
+        """
+        return self._weight
+
+
+def main():
+    """Creates an edge-weighted graph from an input file, runs Boruvka's
+    algorithm on it, and prints the edges of the MST and the sum of the edge
+    weights."""
+    if len(sys.argv) > 1:
+        stream = InStream(sys.argv[1])
+        G = EdgeWeightedGraph.from_stream(stream)
+        mst = BoruvkaMST(G)
+        for e in mst.edges():
+            print(e)
+        print("{:.5f}".format(mst.weight()))
+
+
+if __name__ == "__main__":
+    main()
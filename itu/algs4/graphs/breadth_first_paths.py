@@ -39,18 +39,24 @@ class BreadthFirstPaths:
 
         assert self._check(G, s)
 
-    # @staticmethod
-    # def from_multiple_sources(G, sources):
-    #     """
-    #     Computes the shortest path between any one of the source vertices in sources
-    #     and every other vertex in graph G.
-
-    #     :param G the graph
-    #     :param sources the source vertices
-    #     :raises ValueError: unless 0 <= s < V for each vertex
-    #                         s in sources
-    #     """
-    #     pass
+    @staticmethod
+    def from_multiple_sources(G, sources):
+        """Computes the shortest path between any one of the source vertices
+        in sources and every other vertex in graph G.
+
+        :param G: the graph
+        :param sources: the source vertices
+        :raises ValueError: unless 0 <= s < V for each vertex s in sources
+
+        """
+        bfs = BreadthFirstPaths.__new__(BreadthFirstPaths)
+        bfs._marked = [False] * G.V()
+        bfs._dist_to = [math.inf] * G.V()
+        bfs._edgeTo = [0] * G.V()
+        sources = list(sources)
+        bfs._validateVertices(sources)
+        bfs._bfs_multiple_sources(G, sources)
+        return bfs
 
     def _bfs(self, G, s):
         # breadth-first search from a single source
@@ -68,9 +74,23 @@ class BreadthFirstPaths:
                     self._marked[w] = True  # mark it because path is known,
                     queue.enqueue(w)  # and add it to the queue.
 
-    # def _bfs_multiple_sources(self, G, sources):
-    #     # breadth-first search from multiple sources
-    #     pass
+    def _bfs_multiple_sources(self, G, sources):
+        # breadth-first search from multiple sources
+        queue = Queue()
+        for s in sources:
+            if not self._marked[s]:
+                self._dist_to[s] = 0
+                self._marked[s] = True
+                queue.enqueue(s)
+
+        while not queue.is_empty():
+            v = queue.dequeue()
+            for w in G.adj(v):
+                if not self._marked[w]:
+                    self._edgeTo[w] = v
+                    self._dist_to[w] = self._dist_to[v] + 1
+                    self._marked[w] = True
+                    queue.enqueue(w)
 
     def has_path_to(self, v):
         """Is there a path between the source vertex s (or sources) and vertex
@@ -158,9 +178,14 @@ class BreadthFirstPaths:
         if v < 0 or v >= V:
             raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
 
-    # def _validateVertices(self, vertices):
-    #     # throw an ValueError unless 0 <= v < V
-    #     pass
+    def _validateVertices(self, vertices):
+        # throw an ValueError unless there is a vertex and 0 <= v < V for each
+        if vertices is None:
+            raise ValueError("argument is None")
+        if len(vertices) == 0:
+            raise ValueError("zero vertices")
+        for v in vertices:
+            self._validateVertex(v)
 
 
 class BreadthFirstPathsBook:
@@ -2,6 +2,8 @@
 # see README.md for details
 # This is python3
 
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
+
 
 class CC:
     """The CC class represents a data type for determining the connected
@@ -16,7 +18,8 @@ class CC:
     vertices in the connected component: two vertices have the same component
     identifier if and only if they are in the same connected component.
 
-    This implementation uses depth-first search.
+    This implementation uses depth-first search with an explicit stack
+    (see iterative_dfs).
     The constructor takes time proportional to V + E
     (in the worst case),
     where V is the number of vertices and E is the number of edges.
@@ -41,14 +44,17 @@ class CC:
                 self._dfs(G, v)
                 self._count += 1
 
-    def _dfs(self, G, v):
+    def _dfs(self, G, s):
         # depth-first search for a Graph
-        self._marked[v] = True
-        self._id[v] = self._count
-        self._size[self._count] += 1
-        for w in G.adj(v):
-            if not self._marked[w]:
-                self._dfs(G, w)
+        id_ = self._id
+        size = self._size
+        count = self._count
+
+        def pre(v):
+            id_[v] = count
+            size[count] += 1
+
+        iterative_dfs(G, s, self._marked, pre=pre)
 
     def id(self, v):
         """Returns the component id of the connected component containing
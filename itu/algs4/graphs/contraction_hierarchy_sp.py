@@ -0,0 +1,429 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements contraction hierarchies, an index for answering
+shortest path queries between arbitrary pairs of vertices in edge-weighted
+digraphs where the edge weights are nonnegative.
+
+The index is built once, takes space close to that of the digraph, and can
+be saved to and loaded from a binary file. It sits between running a
+point-to-point search per query (see BidirectionalDijkstraSP) and storing all
+V^2 distances (see DijkstraAllPairsSP).
+
+"""
+
+import heapq
+import struct
+import sys
+from array import array
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.stdlib.instream import InStream
+
+_MAGIC = b"ALGS4CHS"
+_VERSION = 1
+_BYTE_ORDER_MARK = 0x01020304
+_HEADER = struct.Struct("=8sIIqqq")  # magic, version, byte order mark, V, up, down
+
+# a witness search gives up after settling this many vertices; the shortcut
+# it was looking for is then added, which is never wrong, only wasteful
+_WITNESS_LIMIT = 50
+
+
+def _witness_search(out, source, avoid, targets, bound):
+    # returns the distances from source within the remaining graph, without
+    # entering the vertex avoid, for the vertices settled before all targets
+    # are settled, the search passes bound, or _WITNESS_LIMIT vertices are
+    # settled; the searches are small and many, so they use heapq with
+    # dictionaries instead of V-sized arrays
+    dist = {source: 0.0}
+    heap = [(0.0, source)]
+    left = len(targets)
+    settled = 0
+    while heap and settled < _WITNESS_LIMIT:
+        d, v = heapq.heappop(heap)
+        if d > dist[v]:
+            continue
+        if d > bound:
+            break
+        if v in targets:
+            left -= 1
+            if left == 0:
+                break
+        settled += 1
+        for w, weight in out[v].items():
+            if w == avoid:
+                continue
+            nd = d + weight
+            if nd < dist.get(w, float("inf")):
+                dist[w] = nd
+                heapq.heappush(heap, (nd, w))
+    return dist
+
+
+def _shortcuts(out, into, v):
+    # returns the shortcuts (u, w, weight) needed to keep all shortest paths
+    # between the remaining neighbours of v when v is removed
+    shortcuts = []
+    targets = out[v]
+    if not targets:
+        return shortcuts
+    max_out = max(targets.values())
+    for u, weight_in in into[v].items():
+        dist = _witness_search(out, u, v, targets, weight_in + max_out)
+        for w, weight_out in targets.items():
+            if w == u:
+                continue
+            weight = weight_in + weight_out
+            if dist.get(w, float("inf")) > weight:
+                shortcuts.append((u, w, weight))
+    return shortcuts
+
+
+def _flatten(V, lists, via, forward):
+    # turns V dictionaries {w: weight} into CSR arrays, with the vertex each
+    # edge bypasses taken from via; the edges are v->w if forward, else w->v
+    offsets = array("q", [0])
+    targets = array("i")
+    weights = array("d")
+    mids = array("i")
+    for v in range(V):
+        for w in sorted(lists[v]):
+            targets.append(w)
+            weights.append(lists[v][w])
+            mids.append(via.get((v, w) if forward else (w, v), -1))
+        offsets.append(len(targets))
+    return offsets, targets, weights, mids
+
+
+class ContractionHierarchySP:
+    """The ContractionHierarchySP class represents a data type for solving the
+    all-pairs shortest paths problem in edge-weighted digraphs where the edge
+    weights are nonnegative, by answering each query from a precomputed index.
+
+    This implementation contracts the vertices one at a time, least important
+    first. The importance of a vertex is twice the difference between the
+    number of shortcut edges its removal needs and the number of edges it
+    removes, plus the number of its neighbours already contracted, plus its
+    level: one more than the highest level of a contracted neighbour. The
+    importance is recomputed when a vertex reaches the top of the priority
+    queue, and the vertex is put back if it has grown. When a vertex v is
+    removed, a shortcut u->w with the weight of u->v->w is added for every
+    pair of remaining neighbours unless a local search finds another path
+    from u to w that is no longer. Every edge of the result leads upward, to a vertex
+    contracted later, either from its tail (the upward graph) or from its
+    head (the downward graph). A query runs Dijkstra's algorithm from the
+    source in the upward graph and from the target in the reverse of the
+    downward graph; a shortest path is found where the two searches meet.
+    Shortcuts are expanded back into the edges of the digraph by path().
+
+    Building the index is slow: each contraction runs a bounded search from
+    every in-neighbour of the vertex. The index uses space proportional to V
+    plus the number of edges and shortcuts. A query explores only the upward
+    search spaces of its two vertices, which are a small part of the digraph
+    on road-like networks. The result of
+    the last query is kept, so asking for dist(), has_path() and path() of the
+    same pair of vertices runs one search.
+
+    """
+
+    def __init__(self, G):
+        """Builds a contraction hierarchy for the edge-weighted digraph G.
+
+        :param G: the edge-weighted digraph
+        :raises IllegalArgumentException: if an edge weight is negative
+
+        """
+        V = G.V()
+        # the remaining graph: out[v][w] = into[w][v] = weight of v->w, where
+        # only the lightest of parallel edges is kept; via[(v, w)] is the
+        # contracted vertex the shortcut v->w bypasses
+        out = [{} for _ in range(V)]
+        into = [{} for _ in range(V)]
+        via = {}
+        for e in G.edges():
+            v = e.from_vertex()
+            w = e.to_vertex()
+            weight = e.weight()
+            if weight < 0:
+                raise IllegalArgumentException("edge {} has negative weight".format(e))
+            if v != w and weight < out[v].get(w, float("inf")):
+                out[v][w] = into[w][v] = weight
+
+        deleted = [0] * V  # number of contracted neighbours of each vertex
+        level = [0] * V  # 1 + the highest level of a contracted neighbour
+        up = [None] * V
+        down = [None] * V
+
+        def priority(v, shortcuts):
+            removed = len(out[v]) + len(into[v])
+            return 2 * (len(shortcuts) - removed) + deleted[v] + level[v]
+
+        pq = IndexMinPQ(V)
+        for v in range(V):
+            pq.insert(v, priority(v, _shortcuts(out, into, v)))
+        while not pq.is_empty():
+            # the priorities are updated lazily: the vertex on top is
+            # contracted only if its fresh priority keeps it on top
+            v = pq.min_index()
+            shortcuts = _shortcuts(out, into, v)
+            p = priority(v, shortcuts)
+            if p > pq.min_key():
+                pq.change_key(v, p)
+                continue
+            pq.del_min()
+            up[v] = out[v]
+            down[v] = into[v]
+            for w in out[v]:
+                del into[w][v]
+                deleted[w] += 1
+                level[w] = max(level[w], level[v] + 1)
+            for u in into[v]:
+                del out[u][v]
+                deleted[u] += 1
+                level[u] = max(level[u], level[v] + 1)
+            for u, w, weight in shortcuts:
+                if weight < out[u].get(w, float("inf")):
+                    out[u][w] = into[w][u] = weight
+                    via[(u, w)] = v
+            out[v] = {}
+            into[v] = {}
+
+        self._V = V
+        self._up = _flatten(V, up, via, True)
+        self._down = _flatten(V, down, via, False)
+        self._query = None
+
+    @staticmethod
+    def load(filename):
+        """Reads a contraction hierarchy from a binary file written by save.
+
+        :param filename: the name of the file
+        :return: the contraction hierarchy stored in the file
+        :rtype: ContractionHierarchySP
+        :raises ValueError: if the file is not a contraction hierarchy file
+                            written on a machine with the same byte order
+
+        """
+        with open(filename, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError("{} is not a contraction hierarchy".format(filename))
+            magic, version, mark, V, n_up, n_down = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("{} is not a contraction hierarchy".format(filename))
+            if mark != _BYTE_ORDER_MARK:
+                raise ValueError(
+                    "{} was written with another byte order".format(filename)
+                )
+            ch = ContractionHierarchySP.__new__(ContractionHierarchySP)
+            ch._V = V
+            graphs = []
+            for n in (n_up, n_down):
+                graph = (array("q"), array("i"), array("d"), array("i"))
+                for a, length in zip(graph, (V + 1, n, n, n)):
+                    data = f.read(length * a.itemsize)
+                    if len(data) < length * a.itemsize:
+                        raise ValueError("{} is truncated".format(filename))
+                    a.frombytes(data)
+                graphs.append(graph)
+        ch._up, ch._down = graphs
+        ch._query = None
+        return ch
+
+    def save(self, filename):
+        """Writes this contraction hierarchy to a binary file that can be read
+        with load.
+
+        :param filename: the name of the file to write
+
+        """
+        with open(filename, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    _MAGIC,
+                    _VERSION,
+                    _BYTE_ORDER_MARK,
+                    self._V,
+                    len(self._up[1]),
+                    len(self._down[1]),
+                )
+            )
+            for graph in (self._up, self._down):
+                for a in graph:
+                    f.write(a.tobytes())
+
+    def dist(self, source, target):
+        """Returns the length of a shortest path from the source vertex to the
+        target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: the length of a shortest path from the source vertex to the target vertex;
+                  float('inf') if no such path
+
+        """
+        return self._search(source, target)[0]
+
+    def has_path(self, source, target):
+        """Is there a path from the source vertex to the target vertex?
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: True if there is a path from the source to the target, and False otherwise
+
+        """
+        return self.dist(source, target) < float("inf")
+
+    def path(self, source, target):
+        """Returns a shortest path from source vertex to the target vertex.
+
+        :param source: the source vertex
+        :param target: the destination vertex
+
+        :returns: a shortest path from the source vertex to the target vertex as an iterable of edges,
+                  and None if no such path
+
+        """
+        dist, meet, edge_to_up, edge_to_down = self._search(source, target)
+        if dist == float("inf"):
+            return None
+        # edges of the hierarchy on the path, as (tail, head, weight, mid)
+        _, targets, weights, mids = self._up
+        edges = []
+        v = meet
+        while v != source:
+            u, i = edge_to_up[v]
+            edges.append((u, v, weights[i], mids[i]))
+            v = u
+        edges.reverse()
+        _, targets, weights, mids = self._down
+        v = meet
+        while v != target:
+            w, i = edge_to_down[v]
+            edges.append((v, w, weights[i], mids[i]))
+            v = w
+
+        # expand the shortcuts, and push the edges of G last one first
+        path = Stack()
+        stack = edges
+        while stack:
+            u, w, weight, mid = stack.pop()
+            if mid == -1:
+                path.push(DirectedEdge(u, w, weight))
+                continue
+            # mid was contracted before u and w, so u->mid is stored with mid
+            # in the downward graph, and mid->w in the upward graph
+            i = self._find(self._down, mid, u)
+            stack.append((u, mid, self._down[2][i], self._down[3][i]))
+            i = self._find(self._up, mid, w)
+            stack.append((mid, w, self._up[2][i], self._up[3][i]))
+        return path
+
+    @staticmethod
+    def _find(graph, v, w):
+        # returns the index of the edge between v and w stored with v
+        offsets, targets, _, _ = graph
+        for i in range(offsets[v], offsets[v + 1]):
+            if targets[i] == w:
+                return i
+        raise AssertionError("missing edge {}-{}".format(v, w))
+
+    def _search(self, source, target):
+        # returns the distance, the meeting vertex and the search trees of
+        # the query from source to target, which is cached
+        self._validateVertex(source)
+        self._validateVertex(target)
+        if self._query is None or self._query[0] != (source, target):
+            self._query = ((source, target), self._upward(source, target))
+        return self._query[1]
+
+    def _upward(self, s, t):
+        # runs Dijkstra's algorithm from s in the upward graph and from t in
+        # the downward graph, always advancing the search with the smaller
+        # key; a search stops once its smallest key is no less than the
+        # shortest path found so far. The searches are small, so they use
+        # heapq with dictionaries instead of V-sized arrays.
+        graphs = (self._up, self._down)
+        dist = ({s: 0.0}, {t: 0.0})
+        edge_to = ({s: None}, {t: None})  # (vertex, edge index) leading to each
+        heaps = ([(0.0, s)], [(0.0, t)])
+        best = 0.0 if s == t else float("inf")
+        meet = s if s == t else None
+        while heaps[0] or heaps[1]:
+            if not heaps[1] or (heaps[0] and heaps[0][0][0] <= heaps[1][0][0]):
+                side = 0
+            else:
+                side = 1
+            heap = heaps[side]
+            d, v = heapq.heappop(heap)
+            if d >= best:
+                heap.clear()
+                continue
+            if d > dist[side][v]:
+                continue
+            if v in dist[1 - side] and d + dist[1 - side][v] < best:
+                best = d + dist[1 - side][v]
+                meet = v
+            # stall-on-demand: if a higher vertex u reached by this search has
+            # an edge to v that gives a shorter path, v is not on a shortest
+            # path and need not be expanded
+            offsets, targets, weights, _ = graphs[1 - side]
+            stalled = False
+            for i in range(offsets[v], offsets[v + 1]):
+                u = targets[i]
+                if u in dist[side] and dist[side][u] + weights[i] < d:
+                    stalled = True
+                    break
+            if stalled:
+                continue
+            offsets, targets, weights, _ = graphs[side]
+            for i in range(offsets[v], offsets[v + 1]):
+                w = targets[i]
+                nd = d + weights[i]
+                if nd < dist[side].get(w, float("inf")):
+                    dist[side][w] = nd
+                    edge_to[side][w] = (v, i)
+                    heapq.heappush(heap, (nd, w))
+        return best, meet, edge_to[0], edge_to[1]
+
+    # throw a ValueError unless 0 <= v < V
+    def _validateVertex(self, v):
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, (V - 1)))
+
+
+def main():
+    """Builds a contraction hierarchy for an edge-weighted digraph in text
+    format and saves it, or loads a saved one and prints a shortest path.
+
+    python contraction_hierarchy_sp.py tinyEWD.txt tinyEWD.ch
+    python contraction_hierarchy_sp.py tinyEWD.ch 0 6
+
+    """
+    if len(sys.argv) == 3:
+        G = EdgeWeightedDigraph.from_stream(InStream(sys.argv[1]))
+        ContractionHierarchySP(G).save(sys.argv[2])
+    elif len(sys.argv) == 4:
+        ch = ContractionHierarchySP.load(sys.argv[1])
+        s = int(sys.argv[2])
+        t = int(sys.argv[3])
+        if ch.has_path(s, t):
+            print("{} to {} ({:.2f})  ".format(s, t, ch.dist(s, t)), end="")
+            for e in ch.path(s, t):
+                print(e, end="   ")
+            print()
+        else:
+            print("{} to {}         no path".format(s, t))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a frozen edge-weighted digraph stored in compressed
+sparse row (CSR) form, together with a compact binary file format for it.
+
+A binary graph file consists of a 32-byte header, the V + 1 vertex offsets
+(int64), the E edge targets (int32), padding up to the next multiple of 8
+bytes, and the E edge weights (float64). All numbers are stored in the byte
+order of the machine that wrote the file. The loader memory-maps the file, so
+a graph can be queried right after opening it, without parsing and without
+creating an object per edge, and several processes that load the same file
+share one page-cached copy of it.
+
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.stdlib.instream import InStream
+
+_MAGIC = b"ALGS4EWD"
+_VERSION = 1
+_BYTE_ORDER_MARK = 0x01020304
+_HEADER = struct.Struct("=8sIIqq")  # magic, version, byte order mark, V, E
+
+
+def _compress(V, tails, heads, weights):
+    # builds offset, target and weight arrays from parallel arrays of edges
+    # with a counting sort on the tail vertex; the edges leaving each vertex
+    # keep the order in which they were given
+    offsets = array("q", bytes(8 * (V + 1)))
+    for v in tails:
+        offsets[v + 1] += 1
+    for v in range(V):
+        offsets[v + 1] += offsets[v]
+
+    nxt = array("q", offsets)  # next free slot in each adjacency list
+    E = len(tails)
+    targets = array("i", bytes(4 * E))
+    sorted_weights = array("d", bytes(8 * E))
+    for i in range(E):
+        v = tails[i]
+        k = nxt[v]
+        targets[k] = heads[i]
+        sorted_weights[k] = weights[i]
+        nxt[v] = k + 1
+    return offsets, targets, sorted_weights
+
+
+def _typed(typecode, values):
+    # returns values as an array of the given typecode, copying only if it
+    # is not one already, e.g. a memoryview of a mapped file
+    if isinstance(values, array) and values.typecode == typecode:
+        return values
+    copy = array(typecode)
+    if isinstance(values, memoryview) and values.format == typecode:
+        copy.frombytes(values.cast("B"))
+    else:
+        copy.extend(values)
+    return copy
+
+
+class CSREdgeWeightedDigraph:
+    """The CSREdgeWeightedDigraph class represents a frozen edge-weighted
+    digraph of vertices named 0 through V-1, where each directed edge has a
+    real-valued weight.
+
+    It supports the read-only part of the EdgeWeightedDigraph API: iterating
+    over the edges incident from a vertex, the outdegree and indegree of a
+    vertex, all edges, and the numbers of vertices V and edges E. It can
+    therefore be passed to DijkstraSP, BellmanFordSP, AcyclicSP and the other
+    shortest-path clients unchanged.
+
+    This implementation stores the graph in compressed sparse row form:
+    an array of V + 1 offsets into flat arrays of E targets and E weights.
+    DirectedEdge objects are created only while a client iterates over an
+    adjacency list. The graph can be saved to and memory-mapped from a
+    binary file with save and load. Loading takes constant time; outdegree
+    takes constant time, and iterating over the edges incident from a given
+    vertex takes time proportional to the number of such edges.
+
+    """
+
+    def __init__(self, V, edges=()):
+        """Initializes an edge-weighted digraph with V vertices and the given
+        edges.
+
+        :param V: the number of vertices
+        :param edges: an iterable of DirectedEdge objects
+        :raises IllegalArgumentException: if V < 0
+        :raises IllegalArgumentException: unless endpoints of every edge are between 0 and V-1
+
+        """
+        if V < 0:
+            raise IllegalArgumentException(
+                "Number of vertices in a Digraph must be nonnegative"
+            )
+        self._V = V
+        tails = array("i")
+        heads = array("i")
+        weights = array("d")
+        for e in edges:
+            v = e.from_vertex()
+            w = e.to_vertex()
+            self._validate_vertex(v)
+            self._validate_vertex(w)
+            tails.append(v)
+            heads.append(w)
+            weights.append(e.weight())
+        self._E = len(tails)
+        self._offsets, self._targets, self._weights = _compress(
+            V, tails, heads, weights
+        )
+        self._indegree = None  # computed on first use
+        self._map = None  # memory map backing the arrays, if loaded from a file
+
+    @staticmethod
+    def from_graph(G):
+        """Initializes a frozen copy of the edge-weighted digraph G. The edges
+        incident from every vertex keep the iteration order they have in G.
+
+        :param G: the edge-weighted digraph to copy
+        :return: a copy of graph G
+        :rtype: CSREdgeWeightedDigraph
+
+        """
+        g = CSREdgeWeightedDigraph(G.V())
+        offsets = array("q", [0])
+        targets = array("i")
+        weights = array("d")
+        for v in range(G.V()):
+            for e in G.adj(v):
+                targets.append(e.to_vertex())
+                weights.append(e.weight())
+            offsets.append(len(targets))
+        g._E = len(targets)
+        g._offsets, g._targets, g._weights = offsets, targets, weights
+        return g
+
+    @staticmethod
+    def from_arrays(V, offsets, targets, weights):
+        """Initializes an edge-weighted digraph from its arrays in compressed
+        sparse row form, as returned by arrays(). The edges incident from
+        vertex v are targets[i] with weight weights[i], for offsets[v] <= i
+        < offsets[v + 1]. Arrays of the right type are shared, not copied.
+
+        :param V: the number of vertices
+        :param offsets: the V + 1 offsets into targets and weights
+        :param targets: the target vertex of each edge
+        :param weights: the weight of each edge
+        :return: the edge-weighted digraph
+        :rtype: CSREdgeWeightedDigraph
+        :raises IllegalArgumentException: if the arrays do not describe a digraph
+                                          with V vertices
+
+        """
+        g = CSREdgeWeightedDigraph(V)
+        offsets = _typed("q", offsets)
+        targets = _typed("i", targets)
+        weights = _typed("d", weights)
+        E = len(targets)
+        if len(offsets) != V + 1 or offsets[0] != 0 or offsets[V] != E:
+            raise IllegalArgumentException(
+                "offsets must run from 0 to E in V + 1 steps"
+            )
+        if len(weights) != E:
+            raise IllegalArgumentException(
+                "targets and weights must have the same length"
+            )
+        if E > 0 and (min(targets) < 0 or max(targets) >= V):
+            raise IllegalArgumentException(
+                "targets must be between 0 and {}".format(V - 1)
+            )
+        g._E = E
+        g._offsets, g._targets, g._weights = offsets, targets, weights
+        return g
+
+    @staticmethod
+    def from_stream(stream):
+        """Initializes an edge-weighted digraph from the specified input
+        stream. The format is the number of vertices V, followed by the number
+        of edges E, followed by E pairs of vertices and edge weights, with each
+        entry seperated by whitespace.
+
+        :param stream: the input stream
+        :raises IllegalArgumentException: if the endpoints of any edge are not in prescribed range
+        :raises IllegalArgumentException: if the number of vertices or edges is negative
+        :return: the edge-weighted digraph
+        :rtype: CSREdgeWeightedDigraph
+
+        """
+        g = CSREdgeWeightedDigraph(stream.readInt())
+        E = stream.readInt()
+        if E < 0:
+            raise IllegalArgumentException("Number of edges must be nonnegative")
+        tails = array("i")
+        heads = array("i")
+        weights = array("d")
+        for _ in range(E):
+            v = stream.readInt()
+            w = stream.readInt()
+            g._validate_vertex(v)
+            g._validate_vertex(w)
+            tails.append(v)
+            heads.append(w)
+            weights.append(stream.readFloat())
+        g._E = E
+        g._offsets, g._targets, g._weights = _compress(g._V, tails, heads, weights)
+        return g
+
+    @staticmethod
+    def load(filename):
+        """Memory-maps an edge-weighted digraph from a binary graph file
+        written by save. The file stays mapped for the lifetime of the
+        returned digraph, which is read-only.
+
+        :param filename: the name of the binary graph file
+        :return: the edge-weighted digraph stored in the file
+        :rtype: CSREdgeWeightedDigraph
+        :raises ValueError: if the file is not a binary graph file written on a
+                            machine with the same byte order
+
+        """
+        with open(filename, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(mm) < _HEADER.size:
+                raise ValueError("{} is not a binary graph file".format(filename))
+            magic, version, mark, V, E = _HEADER.unpack_from(mm, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("{} is not a binary graph file".format(filename))
+            if mark != _BYTE_ORDER_MARK:
+                raise ValueError(
+                    "{} was written with another byte order".format(filename)
+                )
+
+            start = _HEADER.size
+            end_offsets = start + 8 * (V + 1)
+            end_targets = end_offsets + 4 * E
+            start_weights = end_targets + (-end_targets) % 8
+            end_weights = start_weights + 8 * E
+            if len(mm) < end_weights:
+                raise ValueError("{} is truncated".format(filename))
+        except ValueError:
+            mm.close()
+            raise
+
+        view = memoryview(mm)
+        g = CSREdgeWeightedDigraph(0)
+        g._V = V
+        g._E = E
+        g._offsets = view[start:end_offsets].cast("q")
+        g._targets = view[end_offsets:end_targets].cast("i")
+        g._weights = view[start_weights:end_weights].cast("d")
+        g._map = mm
+        return g
+
+    def save(self, filename):
+        """Writes this edge-weighted digraph to a binary graph file that can
+        be memory-mapped with load.
+
+        :param filename: the name of the file to write
+
+        """
+        with open(filename, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, _BYTE_ORDER_MARK, self._V, self._E))
+            f.write(self._offsets)
+            f.write(self._targets)
+            f.write(bytes((-4 * self._E) % 8))
+            f.write(self._weights)
+
+    def V(self):
+        """Returns the number of vertices in this edge-weighted digraph.
+
+        :return: the number of vertices in this edge-weighted digraph
+        :rtype: int
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in this edge-weighted digraph.
+
+        :return: the number of edges in this edge-weighted digraph
+        :rtype: int
+
+        """
+        return self._E
+
+    def arrays(self):
+        """Returns the arrays of this edge-weighted digraph in compressed
+        sparse row form: the V + 1 offsets, the E targets and the E weights,
+        where the edges incident from vertex v are targets[i] with weight
+        weights[i], for offsets[v] <= i < offsets[v + 1]. They are arrays, or
+        read-only memoryviews for a loaded digraph, and must not be modified.
+
+        :return: the offsets, targets and weights
+        :rtype: tuple
+
+        """
+        return self._offsets, self._targets, self._weights
+
+    def lightest_edge(self, v, w):
+        """Returns the lightest of the directed edges from v to w.
+
+        :param v: the tail vertex
+        :param w: the head vertex
+        :return: a directed edge v->w of least weight, or None if there is none
+        :rtype: DirectedEdge
+        :raises IllegalArgumentException: unless 0 <= v < V and 0 <= w < V
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        targets = self._targets
+        weights = self._weights
+        weight = None
+        for i in range(self._offsets[v], self._offsets[v + 1]):
+            if targets[i] == w and (weight is None or weights[i] < weight):
+                weight = weights[i]
+        return None if weight is None else DirectedEdge(v, w, weight)
+
+    def _validate_vertex(self, v):
+        """Raises an IllegalArgumentException unless 0 <= v < V.
+
+        :param v: the vertex to validate
+
+        """
+        if v < 0 or v >= self._V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, self._V - 1)
+            )
+
+    def adj(self, v):
+        """Returns the directed edges incident from vertex v.
+
+        :param v: the vertex
+        :return: the directed edges incident from vertex v.
+        :rtype: collections.iterable[DirectedEdge]
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        targets = self._targets
+        weights = self._weights
+        return [
+            DirectedEdge(v, targets[i], weights[i])
+            for i in range(self._offsets[v], self._offsets[v + 1])
+        ]
+
+    def outdegree(self, v):
+        """Returns the number of directed edges incident from vertex v. This is
+        known as the outdegree of vertex v.
+
+        :param v: the vertex
+        :return: the outdegree of vertex v
+        :rtype: int
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def indegree(self, v):
+        """Returns the number of directed edges incident to vertex v. This is
+        known as the indegree of vertex v.
+
+        :param v: the vertex
+        :return: the indegree of vertex v
+        :rtype: int
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        if self._indegree is None:
+            indegree = array("q", bytes(8 * self._V))
+            for w in self._targets:
+                indegree[w] += 1
+            self._indegree = indegree
+        return self._indegree[v]
+
+    def edges(self):
+        """Returns all directed edges in this edge-weighted digraph. The edges
+        are created one at a time while the result is iterated over.
+
+        :return: all edges in this edge-weighted digraph
+        :rtype: collections.iterable[DirectedEdge]
+
+        """
+        offsets = self._offsets
+        targets = self._targets
+        weights = self._weights
+        for v in range(self._V):
+            for i in range(offsets[v], offsets[v + 1]):
+                yield DirectedEdge(v, targets[i], weights[i])
+
+    def __repr__(self):
+        """Returns a string representation of this edge-weighted digraph.
+
+        :return: the number of vertices V, followed by the number of edges E,
+        followed by the V adjacency lists of edges.
+        :rtype: str
+
+        """
+        s = ["{} {} \n".format(self._V, self._E)]
+        for v in range(self._V):
+            s.append("{}: ".format(v))
+            for e in self.adj(v):
+                s.append("{}  ".format(e))
+            s.append("\n")
+        return "".join(s)
+
+
+def main():
+    """Converts an edge-weighted digraph in text format to a binary graph file,
+    or prints the edge-weighted digraph stored in a binary graph file.
+
+    python csr_edge_weighted_digraph.py tinyEWD.txt tinyEWD.bin
+    python csr_edge_weighted_digraph.py tinyEWD.bin
+
+    """
+    if len(sys.argv) > 2:
+        G = CSREdgeWeightedDigraph.from_stream(InStream(sys.argv[1]))
+        G.save(sys.argv[2])
+    elif len(sys.argv) > 1:
+        print(CSREdgeWeightedDigraph.load(sys.argv[1]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements frozen graphs and digraphs stored in compressed
+sparse row (CSR) form: an offset array indexed by vertex and one flat array
+holding all the adjacency lists back to back.
+
+Both classes offer the read-only part of the Graph and Digraph API (V, E,
+adj, degree, and reverse for digraphs), so the search clients in this package
+(DepthFirstSearch, BreadthFirstPaths, CC, KosarajuSharirSCC, ...) accept them
+unchanged. A vertex costs 8 bytes and an edge endpoint 4 bytes, instead of
+one Node object per endpoint for the Bag-based representations.
+
+"""
+
+from array import array
+
+# typecodes of the offset array (64 bit) and of the neighbour array (32 bit)
+_OFFSET = "q"
+_VERTEX = "i"
+
+
+def _compress(V, tails, heads, both_ways):
+    # builds the offset and neighbour arrays from parallel arrays of edge
+    # endpoints with a counting sort on the tail vertex; the adjacency list of
+    # each vertex keeps the order in which its edges were given
+    offsets = array(_OFFSET, bytes(8 * (V + 1)))
+    for v in tails:
+        offsets[v + 1] += 1
+    if both_ways:
+        for w in heads:
+            offsets[w + 1] += 1
+    for v in range(V):
+        offsets[v + 1] += offsets[v]
+
+    nxt = array(_OFFSET, offsets)  # next free slot in each adjacency list
+    adj = array(_VERTEX, bytes(4 * offsets[V]))
+    for i in range(len(tails)):
+        v = tails[i]
+        w = heads[i]
+        adj[nxt[v]] = w
+        nxt[v] += 1
+        if both_ways:
+            adj[nxt[w]] = v
+            nxt[w] += 1
+    return offsets, adj
+
+
+def _read_edges(stream):
+    # reads V, E and E pairs of vertices from the stream, in the format used
+    # by Graph.from_stream and Digraph.from_stream
+    V = stream.readInt()
+    if V < 0:
+        raise ValueError("Number of vertices must be nonnegative")
+    E = stream.readInt()
+    if E < 0:
+        raise ValueError("Number of edges must be nonnegative")
+    tails = array(_VERTEX)
+    heads = array(_VERTEX)
+    for _ in range(E):
+        v = stream.readInt()
+        w = stream.readInt()
+        tails.append(v)
+        heads.append(w)
+    return V, tails, heads
+
+
+def _split_edges(V, edges):
+    # turns an iterable of (v, w) pairs into two validated endpoint arrays
+    tails = array(_VERTEX)
+    heads = array(_VERTEX)
+    for v, w in edges:
+        tails.append(v)
+        heads.append(w)
+    _validate_endpoints(V, tails)
+    _validate_endpoints(V, heads)
+    return tails, heads
+
+
+def _validate_endpoints(V, vertices):
+    # throw a ValueError unless 0 <= v < V for every v in vertices
+    if len(vertices) == 0:
+        return
+    for v in (min(vertices), max(vertices)):
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
+
+
+class CSRGraph:
+    """The CSRGraph class represents a frozen undirected graph of vertices
+    named 0 through V - 1.
+
+    It supports iterating over the vertices adjacent to a vertex, and
+    returning the number of vertices V and the number of edges E. Edges
+    cannot be added once the graph is built. Parallel edges and
+    self-loops are permitted; as in Graph, a self-loop v-v appears in the
+    adjacency list of v twice and contributes two to the degree of v.
+
+    This implementation uses a compressed sparse row representation: an
+    array of V + 1 offsets into one flat array of 2E neighbours. The
+    adjacency list of v is the slice between offsets[v] and offsets[v + 1].
+    Construction takes time proportional to V + E; the degree operation
+    takes constant time and iterating over the vertices adjacent to a
+    given vertex takes time proportional to the number of such vertices.
+
+    """
+
+    def __init__(self, V, edges=()):
+        """Initializes a graph with V vertices and the given edges.
+
+        :param V: number of vertices
+        :param edges: an iterable of pairs (v, w), one per undirected edge
+        :raises ValueError: if V < 0
+        :raises ValueError: unless 0 <= v < V and 0 <= w < V for every edge
+
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative")
+        tails, heads = _split_edges(V, edges)
+        self._V = V
+        self._E = len(tails)
+        self._offsets, self._adj = _compress(V, tails, heads, True)
+
+    @staticmethod
+    def from_stream(stream):
+        """Initializes a graph from the specified input stream. The format is
+        the number of vertices V, followed by the number of edges E, followed
+        by E pairs of vertices, with each entry separated by whitespace.
+
+        :param stream: the input stream
+        :returns: new graph from stream
+        :raises ValueError: if the endpoints of any edge are not in prescribed range
+        :raises ValueError: if the number of vertices or edges is negative
+        :raises ValueError: if the input stream is in the wrong format
+
+        """
+        V, tails, heads = _read_edges(stream)
+        _validate_endpoints(V, tails)
+        _validate_endpoints(V, heads)
+        g = CSRGraph(V)
+        g._E = len(tails)
+        g._offsets, g._adj = _compress(V, tails, heads, True)
+        return g
+
+    @staticmethod
+    def from_graph(G):
+        """Initializes a frozen copy of the graph G. The adjacency list of
+        every vertex keeps the iteration order it has in G, so searches give
+        the same results on both graphs.
+
+        :param G: the graph to copy
+        :returns: copy of G in compressed sparse row form
+
+        """
+        g = CSRGraph(G.V())
+        g._E = G.E()
+        offsets = array(_OFFSET, [0])
+        adj = array(_VERTEX)
+        for v in range(G.V()):
+            adj.extend(G.adj(v))
+            offsets.append(len(adj))
+        g._offsets = offsets
+        g._adj = adj
+        return g
+
+    def V(self):
+        """Returns the number of vertices in this graph.
+
+        :returns: the number of vertices in this graph.
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in this graph.
+
+        :returns: the number of edges in this graph.
+
+        """
+        return self._E
+
+    def _validateVertex(self, v):
+        # throw a ValueError unless 0 <= v < V
+        if v < 0 or v >= self._V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, self._V))
+
+    def adj(self, v):
+        """Returns the vertices adjacent to vertex v.
+
+        :param v: the vertex
+        :returns: the vertices adjacent to vertex v, as an array
+        :raises ValueError: unless  0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._adj[self._offsets[v] : self._offsets[v + 1]]
+
+    def degree(self, v):
+        """Returns the degree of vertex v.
+
+        :param v: the vertex
+        :returns: the degree of vertex v
+        :raises ValueError:  unless 0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def __repr__(self):
+        """Returns a string representation of this graph.
+
+        :returns: the number of vertices V, followed by the number of edges E,
+                    followed by the V adjacency lists
+
+        """
+        s = ["{} vertices, {} edges\n".format(self._V, self._E)]
+        for v in range(self._V):
+            s.append("%d : " % v)
+            for w in self.adj(v):
+                s.append("%d " % w)
+            s.append("\n")
+
+        return "".join(s)
+
+
+class CSRDigraph:
+    """The CSRDigraph class represents a frozen directed graph of vertices
+    named 0 through V - 1.
+
+    It supports iterating over the vertices adjacent from a vertex, and
+    returning the number of vertices V and the number of edges E. Edges
+    cannot be added once the digraph is built. Parallel edges and
+    self-loops are permitted.
+
+    This implementation uses a compressed sparse row representation: an
+    array of V + 1 offsets into one flat array of E neighbours. The
+    adjacency list of v is the slice between offsets[v] and offsets[v + 1].
+    Construction and the reverse operation take time proportional to
+    V + E; the degree operation takes constant time and iterating over
+    the vertices adjacent from a given vertex takes time proportional to
+    the number of such vertices.
+
+    """
+
+    def __init__(self, V, edges=()):
+        """Initializes a digraph with V vertices and the given edges.
+
+        :param V: number of vertices
+        :param edges: an iterable of pairs (v, w), one per directed edge v->w
+        :raises ValueError: if V < 0
+        :raises ValueError: unless 0 <= v < V and 0 <= w < V for every edge
+
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative")
+        tails, heads = _split_edges(V, edges)
+        self._V = V
+        self._E = len(tails)
+        self._offsets, self._adj = _compress(V, tails, heads, False)
+
+    @staticmethod
+    def from_stream(stream):
+        """Initializes a digraph from the specified input stream. The format
+        is the number of vertices V, followed by the number of edges E,
+        followed by E pairs of vertices, with each entry separated by
+        whitespace.
+
+        :param stream: the input stream
+        :returns: new digraph from stream
+        :raises ValueError: if the endpoints of any edge are not in prescribed range
+        :raises ValueError: if the number of vertices or edges is negative
+        :raises ValueError: if the input stream is in the wrong format
+
+        """
+        V, tails, heads = _read_edges(stream)
+        _validate_endpoints(V, tails)
+        _validate_endpoints(V, heads)
+        g = CSRDigraph(V)
+        g._E = len(tails)
+        g._offsets, g._adj = _compress(V, tails, heads, False)
+        return g
+
+    @staticmethod
+    def from_graph(G):
+        """Initializes a frozen copy of the digraph G. The adjacency list of
+        every vertex keeps the iteration order it has in G, so searches give
+        the same results on both digraphs.
+
+        :param G: the digraph to copy
+        :returns: copy of G in compressed sparse row form
+
+        """
+        g = CSRDigraph(G.V())
+        g._E = G.E()
+        offsets = array(_OFFSET, [0])
+        adj = array(_VERTEX)
+        for v in range(G.V()):
+            adj.extend(G.adj(v))
+            offsets.append(len(adj))
+        g._offsets = offsets
+        g._adj = adj
+        return g
+
+    def V(self):
+        """Returns the number of vertices in this digraph.
+
+        :returns: the number of vertices in this digraph.
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in this digraph.
+
+        :returns: the number of edges in this digraph.
+
+        """
+        return self._E
+
+    def _validateVertex(self, v):
+        # throw a ValueError unless 0 <= v < V
+        if v < 0 or v >= self._V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, self._V))
+
+    def adj(self, v):
+        """Returns the vertices adjacent from vertex v.
+
+        :param v: the vertex
+        :returns: the vertices adjacent from vertex v, as an array
+        :raises ValueError: unless  0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._adj[self._offsets[v] : self._offsets[v + 1]]
+
+    def degree(self, v):
+        """Returns the number of edges leaving vertex v.
+
+        :param v: the vertex
+        :returns: the outdegree of vertex v
+        :raises ValueError:  unless 0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def reverse(self):
+        """Returns the reverse of the digraph.
+
+        :returns: the reverse of the digraph, in compressed sparse row form
+
+        """
+        tails = array(_VERTEX)
+        offsets = self._offsets
+        for v in range(self._V):
+            tails.extend([v] * (offsets[v + 1] - offsets[v]))
+        rev = CSRDigraph(self._V)
+        rev._E = self._E
+        rev._offsets, rev._adj = _compress(self._V, self._adj, tails, False)
+        return rev
+
+    def __repr__(self):
+        """Returns a string representation of this digraph.
+
+        :returns: the number of vertices V, followed by the number of edges E,
+                    followed by the V adjacency lists
+
+        """
+        s = ["{} vertices, {} edges\n".format(self._V, self._E)]
+        for v in range(self._V):
+            s.append("%d : " % v)
+            for w in self.adj(v):
+                s.append("%d " % w)
+            s.append("\n")
+
+        return "".join(s)
+
+
+if __name__ == "__main__":
+    import sys
+
+    from itu.algs4.stdlib import stdio
+    from itu.algs4.stdlib.instream import InStream
+
+    In = InStream(sys.argv[1])
+    G = CSRGraph.from_stream(In)
+    stdio.writeln(G)
@@ -3,6 +3,7 @@
 # This is python3
 
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
 
 
 class Cycle:
@@ -10,7 +11,8 @@ class Cycle:
     undirected graph has a cycle. The hasCycle operation determines whether the
     graph has a cycle and, if so, the cycle operation returns one.
 
-    This implementation uses depth-first search. The constructor takes
+    This implementation uses depth-first search with an explicit stack
+    (see iterative_dfs). The constructor takes
     time proportional to V + E (in the worst case), where V is the
     number of vertices and E is the number of edges. Afterwards, the
     hasCycle operation takes constant time the cycle operation takes
@@ -33,8 +35,8 @@ class Cycle:
         self._edgeTo = [0] * G.V()
         self._cycle = None
         for v in range(G.V()):
-            if not self._marked[v]:
-                self._dfs(G, -1, v)
+            if not self._marked[v] and self._dfs(G, v):
+                break
 
     def _has_self_loop(self, G):
         # does this graph have a self loop?
@@ -84,23 +86,30 @@ class Cycle:
         """
         return self._cycle
 
-    def _dfs(self, G, u, v):
-        self._marked[v] = True
-        for w in G.adj(v):
-            # short circuit if cycle already found
-            if self._cycle is not None:
-                return
-            if not self._marked[w]:
-                self._edgeTo[w] = v
-                self._dfs(G, v, w)
-            elif w != u:
-                self._cycle = Stack()
-                x = v
-                while x != w:
-                    self._cycle.push(x)
-                    x = self._edgeTo[x]
-                self._cycle.push(w)
-                self._cycle.push(v)
+    def _dfs(self, G, s):
+        # returns True if a cycle is found in the component of s
+        edgeTo = self._edgeTo
+        edgeTo[s] = -1
+
+        def tree_edge(v, w, e):
+            edgeTo[w] = v
+
+        def non_tree_edge(v, w, e):
+            # the edge back to the parent of v is not a cycle
+            if w == edgeTo[v]:
+                return False
+            self._cycle = Stack()
+            x = v
+            while x != w:
+                self._cycle.push(x)
+                x = edgeTo[x]
+            self._cycle.push(w)
+            self._cycle.push(v)
+            return True
+
+        return iterative_dfs(
+            G, s, self._marked, tree_edge=tree_edge, non_tree_edge=non_tree_edge
+        )
 
 
 if __name__ == "__main__":
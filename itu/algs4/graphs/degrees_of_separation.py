@@ -1,4 +1,4 @@
-from itu.algs4.graphs.breadth_first_paths import BreadthFirstPaths
+from itu.algs4.graphs.direction_optimizing_bfs import DirectionOptimizingBFS
 from itu.algs4.graphs.symbol_graph import SymbolGraph
 from itu.algs4.stdlib import stdio
 
@@ -12,6 +12,9 @@ class DegreesOfSeparation:
     individual, then the client computes the Kevin Bacon number of every actor
     in the network.
 
+    The search is a DirectionOptimizingBFS, which switches to bottom-up
+    steps for the few large middle levels of a social network.
+
     The running time is proportional to the number of individuals and
     connections in the network. If the connections are given implicitly,
     as in the movie network example (where every two actors are
@@ -49,7 +52,7 @@ class DegreesOfSeparation:
             return
 
         s = sg.index_of(source)
-        bfs = BreadthFirstPaths(G, s)
+        bfs = DirectionOptimizingBFS(G, s)
 
         while not stdio.isEmpty():
             sink = stdio.readLine()
@@ -0,0 +1,371 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements delta-stepping (Meyer and Sanders, 2003), a
+single-source shortest paths algorithm that settles vertices in buckets of
+distances instead of one at a time.
+
+The tentative distances are kept in buckets of width delta: bucket i holds
+the vertices whose tentative distance lies in [i delta, (i + 1) delta). The
+algorithm repeatedly empties the first nonempty bucket in phases. Each phase
+takes all vertices of the bucket at once and relaxes their light edges
+(those of weight at most delta), which may put vertices back into the same
+bucket. Once the bucket stays empty, the heavy edges of all vertices removed
+from it are relaxed together; they can only reach later buckets. Within a
+phase, all relaxation requests are computed from the distances at the start
+of the phase, so they are independent of each other. Phases with many edges
+are therefore split over a pool of worker processes: the digraph is written
+once to a binary CSR file (see CSREdgeWeightedDigraph) and the distances to
+a second file, which every worker memory-maps, so that each phase only
+sends the vertices of the bucket and gets back the best request per target.
+A small delta behaves like Dijkstra's algorithm, a large one like
+Bellman-Ford.
+
+"""
+
+import heapq
+import mmap
+import multiprocessing
+import os
+import sys
+import tempfile
+from array import array
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.csr_edge_weighted_digraph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.stdlib.instream import InStream
+
+_PARALLEL_CUTOFF = 1 << 15  # fewest edges in a phase that is split over the pool
+
+_graph = None  # the digraph of the worker process, set by _load
+_dist = None  # the shared distances of the worker process
+_delta = None  # the bucket width of the worker process
+
+
+def _load(graph_file, dist_file, delta):
+    # initializer of the worker processes
+    global _graph, _dist, _delta
+    _graph = CSREdgeWeightedDigraph.load(graph_file)
+    with open(dist_file, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _dist = memoryview(mm).cast("d")
+    _delta = delta
+
+
+def _requests(G, dist, delta, vertices, light):
+    # returns the relaxation requests of the light (or heavy) edges leaving
+    # vertices that improve on dist, as a dict from each target to its best
+    # request (distance, edge index)
+    offsets, targets, weights = G.arrays()
+    best = {}
+    for v in vertices:
+        dist_v = dist[v]
+        for i in range(offsets[v], offsets[v + 1]):
+            weight = weights[i]
+            if (weight <= delta) != light:
+                continue
+            w = targets[i]
+            d = dist_v + weight
+            if d < dist[w] and (w not in best or d < best[w][0]):
+                best[w] = (d, i)
+    return best
+
+
+def _run_vertices(task):
+    # computes the requests of a part of a bucket in the worker
+    vertices, light = task
+    frontier = array("i")
+    frontier.frombytes(vertices)
+    best = _requests(_graph, _dist, _delta, frontier, light)
+    distances = array("d", (d for d, _ in best.values()))
+    edges = array("q", (i for _, i in best.values()))
+    return array("i", best).tobytes(), distances.tobytes(), edges.tobytes()
+
+
+def _split(G, delta):
+    # splits the CSR arrays of G into two CSR structures, one of the light
+    # edges (weight <= delta) and one of the heavy edges; the edges keep the
+    # index of the original edge, so that paths can report their weight
+    V = G.V()
+    offsets, _, weights = G.arrays()
+    light = (array("q", [0]), array("q"))
+    heavy = (array("q", [0]), array("q"))
+    for v in range(V):
+        for i in range(offsets[v], offsets[v + 1]):
+            (light if weights[i] <= delta else heavy)[1].append(i)
+        light[0].append(len(light[1]))
+        heavy[0].append(len(heavy[1]))
+    return light, heavy
+
+
+class DeltaSteppingSP:
+    """The DeltaSteppingSP class represents a data type for solving the
+    single-source shortest paths problem in edge-weighted digraphs where the
+    edge weights are nonnegative, with the same API as DijkstraSP.
+
+    This implementation uses delta-stepping on the CSR form of the digraph.
+    Each phase gathers the relaxation requests of a whole bucket before it
+    applies any of them. A phase whose vertices have at least cutoff edges is
+    split over a pool of worker processes that share the digraph and the
+    distances through memory-mapped files; smaller phases, for which the
+    pool costs more than the relaxations themselves, run in this process.
+    With delta chosen near the largest weight divided by the average
+    outdegree, the constructor takes time proportional to V + E + L / delta
+    on graphs with random weights, where L is the largest distance, with
+    the scans of the large phases divided by the number of processes. Each
+    call to dist_to() and has_path_to() takes constant time. Each call to
+    path_to() takes time proportional to the number of edges in the shortest
+    path returned.
+
+    """
+
+    def __init__(self, G, s, delta=None, processes=None, cutoff=None):
+        """Computes a shortest-paths tree from the source vertex s to every
+        other vertex in the edge-weighted digraph G.
+
+        :param G: the edge-weighted digraph, or a CSREdgeWeightedDigraph
+        :param s: the source vertex
+        :param delta: the width of a bucket; by default, the largest edge
+                      weight divided by the average outdegree
+        :param processes: the number of worker processes; defaults to the
+                          number of CPUs, and 1 runs all phases in this process
+        :param cutoff: the fewest edges in a phase that is split over the
+                       worker processes; a digraph with fewer edges in all is
+                       searched without starting any
+        :raises IllegalArgumentException: if an edge weight is negative
+        :raises IllegalArgumentException: unless 0 <= s < V
+        :raises IllegalArgumentException: unless delta > 0
+
+        """
+        if isinstance(G, CSREdgeWeightedDigraph):
+            csr = G
+        else:
+            csr = CSREdgeWeightedDigraph.from_graph(G)
+        V = csr.V()
+        weights = csr.arrays()[2]
+        if len(weights) > 0 and min(weights) < 0:
+            for e in csr.edges():
+                if e.weight() < 0:
+                    raise IllegalArgumentException(
+                        "edge {} has negative weight".format(e)
+                    )
+        if delta is None:
+            max_weight = max(weights, default=0.0)
+            delta = max_weight * V / len(weights) if max_weight > 0 else 1.0
+        if delta <= 0:
+            raise IllegalArgumentException("delta must be positive")
+        self._G = csr
+        self._dist_to = array("d", [float("inf")]) * V
+        self._edge_to = array("q", [-1]) * V  # index of the last edge in CSR
+        self._validate_vertex(s)
+        self._delta = delta
+        self._buckets = {}  # bucket number -> set of vertices
+        self._order = []  # heap of bucket numbers, with stale entries
+        if processes is None:
+            processes = os.cpu_count() or 1
+        self._processes = processes
+        self._cutoff = _PARALLEL_CUTOFF if cutoff is None else cutoff
+        if processes == 1 or csr.E() < self._cutoff:
+            self._step(csr, s, None)
+            return
+
+        # the workers share the digraph and the distances through two files;
+        # the distances are written through a shared mapping of the second
+        fd, graph_file = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        fd, dist_file = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        try:
+            csr.save(graph_file)
+            with open(dist_file, "wb") as f:
+                f.write(self._dist_to)
+            with open(dist_file, "r+b") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE)
+            view = memoryview(mm).cast("d")
+            self._dist_to = view
+            initargs = (graph_file, dist_file, delta)
+            with multiprocessing.Pool(processes, _load, initargs) as pool:
+                self._step(csr, s, pool)
+            self._dist_to = array("d", view)
+            view.release()
+            mm.close()
+        finally:
+            os.remove(graph_file)
+            os.remove(dist_file)
+
+    def _step(self, G, s, pool):
+        split = _split(G, self._delta)
+        buckets = self._buckets
+        order = self._order
+        self._relax([(s, 0.0, -1)])
+        while order:
+            b = heapq.heappop(order)
+            if b not in buckets:
+                continue  # stale entry of a bucket that was emptied
+            settled = []
+            while b in buckets:
+                frontier = buckets.pop(b)
+                settled.extend(frontier)
+                # the light-edge requests of the whole bucket, then apply them
+                self._relax(self._phase(G, split, list(frontier), True, pool))
+            self._relax(self._phase(G, split, settled, False, pool))
+
+    def _phase(self, G, split, vertices, light, pool):
+        # returns the requests (w, distance, edge index) of the light or
+        # heavy edges leaving vertices, from the pool if they are many
+        offsets, targets, weights = G.arrays()
+        if pool is None or self._cutoff > sum(
+            offsets[v + 1] - offsets[v] for v in vertices
+        ):
+            dist_to = self._dist_to
+            edge_offsets, edges = split[0] if light else split[1]
+            return [
+                (targets[i], dist_to[v] + weights[i], i)
+                for v in vertices
+                for i in edges[edge_offsets[v] : edge_offsets[v + 1]]
+            ]
+        parts = 4 * self._processes
+        step = -(-len(vertices) // parts)
+        tasks = [
+            (array("i", vertices[lo : lo + step]).tobytes(), light)
+            for lo in range(0, len(vertices), step)
+        ]
+        requests = []
+        for targets_part, distances, edges in pool.map(_run_vertices, tasks):
+            part = (array("i"), array("d"), array("q"))
+            for a, data in zip(part, (targets_part, distances, edges)):
+                a.frombytes(data)
+            requests.extend(zip(*part))
+        return requests
+
+    def _relax(self, requests):
+        # applies the relaxation requests (w, distance, edge index), moving
+        # each vertex whose distance decreases to its new bucket
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        buckets = self._buckets
+        delta = self._delta
+        for w, d, i in requests:
+            old = dist_to[w]
+            if d >= old:
+                continue
+            if old != float("inf"):
+                b = int(old // delta)
+                bucket = buckets.get(b)
+                if bucket is not None:
+                    bucket.discard(w)
+                    if not bucket:
+                        del buckets[b]
+            dist_to[w] = d
+            edge_to[w] = i
+            b = int(d // delta)
+            if b in buckets:
+                buckets[b].add(w)
+            else:
+                buckets[b] = {w}
+                heapq.heappush(self._order, b)
+
+    def dist_to(self, v):
+        """Returns the length of a shortest path from the source vertex s to
+        vertex v.
+
+        :param v: the destination vertex
+        :return: the length of a shortest path from the source vertex s to vertex v;
+                 float('inf') if no such path
+        :rtype: float
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._dist_to[v]
+
+    def has_path_to(self, v):
+        """Returns True if there is a path from the source vertex s to vertex v.
+
+        :param v: the destination vertex
+        :return: True if there is a path from the source vertex s to vertex v,
+                 and False otherwise
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._dist_to[v] < float("inf")
+
+    def path_to(self, v):
+        """Returns a shortest path from the source vertex s to vertex v.
+
+        :param v: the destination vertex
+        :return: a shortest path from the source vertex s to vertex v, and
+                 None if no such path
+        :rtype: collections.iterable[DirectedEdge]
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        if not self.has_path_to(v):
+            return None
+        offsets, targets, weights = self._G.arrays()
+        path = Stack()
+        i = self._edge_to[v]
+        while i != -1:
+            # the tail of edge i is the vertex whose adjacency range holds it
+            w = targets[i]
+            u = self._tail(offsets, i)
+            path.push(DirectedEdge(u, w, weights[i]))
+            i = self._edge_to[u]
+        return path
+
+    @staticmethod
+    def _tail(offsets, i):
+        # returns the vertex v with offsets[v] <= i < offsets[v + 1]
+        lo, hi = 0, len(offsets) - 2
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if offsets[mid] <= i:
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def _validate_vertex(self, v):
+        """Raises an IllegalArgumentException unless 0 <= v < V.
+
+        :param v: the vertex to be validated
+
+        """
+        V = len(self._dist_to)
+        if v < 0 or v >= V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, V - 1)
+            )
+
+
+def main():
+    """Creates an EdgeWeightedDigraph from input file.
+
+    Runs DeltaSteppingSP on the graph with the given source vertex.
+    Prints the shortest path from the source vertex to all other
+    vertices.
+
+    """
+    if len(sys.argv) == 3:
+        stream = InStream(sys.argv[1])
+        G = EdgeWeightedDigraph.from_stream(stream)
+        s = int(sys.argv[2])
+        sp = DeltaSteppingSP(G, s)
+        for t in range(G.V()):
+            if sp.has_path_to(t):
+                print("{} to {} ({:.2f})  ".format(s, t, sp.dist_to(t)), end="")
+                for e in sp.path_to(t):
+                    print(e, end="   ")
+                print()
+            else:
+                print("{} to {}         no path\n".format(s, t))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,16 @@
 # This is python3
 
 from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
 
 
 class DepthFirstPaths:
     """The  DepthFirstPaths class represents a data type for finding paths from
     a source vertex s to every other vertex in an undirected graph.
 
-    This implementation uses depth-first search. The constructor takes
+    This implementation uses depth-first search with an explicit stack
+    (see iterative_dfs), so it is not limited by the recursion depth of
+    Python. The constructor takes
     time proportional to V + E, where V is the number of vertices and E
     is the number of edges. Each call to hasPathTo(int) takes constant
     time each call to pathTo(int) takes time proportional to the length
@@ -32,13 +35,14 @@ class DepthFirstPaths:
         self._validateVertex(s)
         self._dfs(G, s)
 
-    def _dfs(self, G, v):
-        # depth first search from v
-        self._marked[v] = True
-        for w in G.adj(v):
-            if not self._marked[w]:
-                self._edgeTo[w] = v
-                self._dfs(G, w)
+    def _dfs(self, G, s):
+        # depth first search from s
+        edgeTo = self._edgeTo
+
+        def tree_edge(v, w, e):
+            edgeTo[w] = v
+
+        iterative_dfs(G, s, self._marked, tree_edge=tree_edge)
 
     def has_path_to(self, v):
         """Is there a path between the source vertex s and vertex v?
@@ -3,25 +3,37 @@ import sys
 from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
-from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.sorting.index_bucket_queue import IndexBucketQueue
+from itu.algs4.sorting.index_multiway_min_pq import IndexMultiwayMinPQ
+from itu.algs4.sorting.index_radix_heap import IndexRadixHeap
 from itu.algs4.stdlib.instream import InStream
 
 # Created for BADS 2018
 # See README.md for details
 # Python 3
 
+_BUCKET_LIMIT = 1 << 10  # largest integer weight for which Dial's buckets are used
+_EXACT_LIMIT = 1 << 53  # bound on distances for the bucket queue and radix heap
+
 
 class DijkstraSP:
     """The DijkstraSP class represents a data type for solving the single-
     source shortest paths problem in edge-weighted digraphs where the edge
     weights are nonnegative.
 
-    This implementation uses Dijkstra's algorithm with a binary heap.
-    The constructor takes time proportional to E log V, where V is the
-    number of vertices and E is the number of edges. Each call to
-    dist_to() and has_path_to() takes constant time. Each call to
-    path_to() takes time proportional to the number of edges in the
-    shortest path returned.
+    This implementation uses Dijkstra's algorithm with a 4-way heap of
+    float keys (IndexMultiwayMinPQ), which is updated once per scanned
+    vertex for all the vertices whose distance decreased. The constructor
+    takes time proportional to E log V, where V is the number of vertices
+    and E is the number of edges. If all edge weights are integers, it uses
+    a monotone priority queue instead: a bucket queue (IndexBucketQueue)
+    if the largest weight C is small, which takes time proportional to
+    E + V C in the worst case, and a radix heap (IndexRadixHeap) otherwise,
+    which takes time proportional to E + V log C. The integer queues are
+    only used if C (V - 1) is below 2^53, so that every distance is an
+    exact float and fits in their 64-bit keys. Each call to dist_to()
+    and has_path_to() takes constant time. Each call to path_to() takes
+    time proportional to the number of edges in the shortest path returned.
 
     """
 
@@ -35,19 +47,36 @@ class DijkstraSP:
         :raises IllegalArgumentException: unless 0 <= s < V
 
         """
-        for e in G.edges():
-            if e.weight() < 0:
-                raise IllegalArgumentException("edge {} has negative weight".format(e))
+        # one pass over the adjacency lists, which hold every edge once
+        integral = True
+        max_weight = 0
+        for v in range(G.V()):
+            for e in G.adj(v):
+                weight = e.weight()
+                if weight < 0:
+                    raise IllegalArgumentException(
+                        "edge {} has negative weight".format(e)
+                    )
+                if weight > max_weight:
+                    max_weight = weight
+                if integral and not float(weight).is_integer():
+                    integral = False
+        # the integer queues need every distance to be an exact float
+        integral = integral and max_weight * max(G.V() - 1, 1) < _EXACT_LIMIT
         self._dist_to = [float("inf")] * G.V()
         self._edge_to = [None] * G.V()
         self._validate_vertex(s)
         self._dist_to[s] = 0.0
-        self._pq = IndexMinPQ(G.V())
+        if not integral:
+            self._pq = IndexMultiwayMinPQ(G.V())
+        elif max_weight <= _BUCKET_LIMIT:
+            self._pq = IndexBucketQueue(G.V(), int(max_weight))
+        else:
+            self._pq = IndexRadixHeap(G.V())
         self._pq.insert(s, 0.0)
         while not self._pq.is_empty():
             v = self._pq.del_min()
-            for e in G.adj(v):
-                self._relax(e)
+            self._relax(v, G.adj(v))
 
     def dist_to(self, v):
         """Returns the length of a shortest path from the source vertex s to
@@ -94,21 +123,31 @@ class DijkstraSP:
             e = self._edge_to[e.from_vertex()]
         return path
 
-    def _relax(self, e):
-        """Relaxes the edge e and updates the pq if changed.
+    def _relax(self, v, edges):
+        """Relaxes the edges leaving v and updates the pq for all vertices
+        whose distance decreased.
 
-        :param e: the edge to relax
+        :param v: the vertex the edges leave
+        :param edges: the edges to relax
 
         """
-        v = e.from_vertex()
-        w = e.to_vertex()
-        if self._dist_to[w] > self._dist_to[v] + e.weight():
-            self._dist_to[w] = self._dist_to[v] + e.weight()
-            self._edge_to[w] = e
-            if self._pq.contains(w):
-                self._pq.decrease_key(w, self._dist_to[w])
-            else:
-                self._pq.insert(w, self._dist_to[w])
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        dist_v = dist_to[v]
+        queued = {}  # vertex -> whether it was on the pq before
+        for e in edges:
+            w = e.to_vertex()
+            d = dist_v + e.weight()
+            if dist_to[w] > d:
+                if w not in queued:
+                    queued[w] = dist_to[w] < float("inf")
+                dist_to[w] = d
+                edge_to[w] = e
+        if queued:
+            decreased = [w for w in queued if queued[w]]
+            inserted = [w for w in queued if not queued[w]]
+            self._pq.decrease_many(decreased, [dist_to[w] for w in decreased])
+            self._pq.insert_many(inserted, [dist_to[w] for w in inserted])
 
     def _validate_vertex(self, v):
         """Raises an IllegalArgumentException unless 0 <= v < V.
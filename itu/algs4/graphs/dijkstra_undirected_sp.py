@@ -3,7 +3,7 @@ import sys
 from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
-from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.sorting.index_multiway_min_pq import IndexMultiwayMinPQ
 from itu.algs4.stdlib.instream import InStream
 
 # Created for BADS 2018
@@ -16,9 +16,11 @@ class DijkstraUndirectedSP:
     source shortest paths problem in edge-weighted diagraphs where the edge
     weights are nonnegative.
 
-    This implementation uses Dijkstra's algorithm with a binary heap.
-    The constructor takes time proportional to E log V, where V is the
-    number of vertices and E is the number of edges. Each call to
+    This implementation uses Dijkstra's algorithm with a 4-way heap of
+    float keys (IndexMultiwayMinPQ), which is updated once per scanned
+    vertex for all the vertices whose distance decreased. The constructor
+    takes time proportional to E log V, where V is the number of vertices
+    and E is the number of edges. Each call to
     dist_to() and has_path_to() takes constant time each call to
     path_to() takes time proportional to the number of edges in the
     shortest path returned.
@@ -35,21 +37,24 @@ class DijkstraUndirectedSP:
         :raises IllegalArgumentException: unless 0 <= s < V
 
         """
-        for e in G.edges():
-            if e.weight() < 0:
-                raise IllegalArgumentException("edge {} has negative weight".format(e))
+        # the adjacency lists hold every edge, without building edges()
+        for v in range(G.V()):
+            for e in G.adj(v):
+                if e.weight() < 0:
+                    raise IllegalArgumentException(
+                        "edge {} has negative weight".format(e)
+                    )
 
         self._dist_to = [float("inf")] * G.V()
         self._edge_to = [None] * G.V()
         self._dist_to[s] = 0.0
         self._validate_vertex(s)
-        self._pq = IndexMinPQ(G.V())
-        self._pq.insert(s, 0)
+        self._pq = IndexMultiwayMinPQ(G.V())
+        self._pq.insert(s, 0.0)
 
         while not self._pq.is_empty():
             v = self._pq.del_min()
-            for e in G.adj(v):
-                self._relax(e, v)
+            self._relax(G.adj(v), v)
 
     def dist_to(self, v):
         """Returns the length of a shortest path between the source vertex s
@@ -111,21 +116,31 @@ class DijkstraUndirectedSP:
                 "vertex {} is not between 0 and {}".format(v, V - 1)
             )
 
-    def _relax(self, e, v):
-        """Relax edge e and update pq if changed.
+    def _relax(self, edges, v):
+        """Relax the edges of v and update pq for all vertices whose distance
+        decreased.
 
-        :param e: the edge to relax
-        :param v: the vertex e goes out from
+        :param edges: the edges to relax
+        :param v: the vertex the edges go out from
 
         """
-        w = e.other(v)
-        if self._dist_to[v] + e.weight() < self._dist_to[w]:
-            self._dist_to[w] = self._dist_to[v] + e.weight()
-            self._edge_to[w] = e
-            if self._pq.contains(w):
-                self._pq.decrease_key(w, self._dist_to[w])
-            else:
-                self._pq.insert(w, self._dist_to[w])
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        dist_v = dist_to[v]
+        queued = {}  # vertex -> whether it was on the pq before
+        for e in edges:
+            w = e.other(v)
+            d = dist_v + e.weight()
+            if d < dist_to[w]:
+                if w not in queued:
+                    queued[w] = dist_to[w] < float("inf")
+                dist_to[w] = d
+                edge_to[w] = e
+        if queued:
+            decreased = [w for w in queued if queued[w]]
+            inserted = [w for w in queued if not queued[w]]
+            self._pq.decrease_many(decreased, [dist_to[w] for w in decreased])
+            self._pq.insert_many(inserted, [dist_to[w] for w in inserted])
 
 
 def main():
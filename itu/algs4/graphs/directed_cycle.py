@@ -14,6 +14,7 @@ import sys
 
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
 from itu.algs4.stdlib.instream import InStream
 
 
@@ -23,7 +24,8 @@ class DirectedCycle:
     digraph has a directed cycle and, and of so, the cycle operation returns
     one.
 
-    This implementation uses depth-first search. The constructor takes time proportional
+    This implementation uses depth-first search with an explicit stack (see
+    iterative_dfs). The constructor takes time proportional
     to V + E (in the worst case), where V is the number of vertices and E is the
     number of edges. Afterwards, the hasCycle operation takes constant time; the
     cycle operation takes time proportional to the length of the cycle.
@@ -46,32 +48,46 @@ class DirectedCycle:
         self._edge_to = [0] * digraph.V()
         self._marked = [False] * digraph.V()
         for v in range(digraph.V()):
-            if not self._marked[v]:
-                self._dfs(digraph, v)
+            if not self._marked[v] and self._dfs(digraph, v):
+                break
 
     # check that algorithm computes either the topological order or finds a directed cycle
-    def _dfs(self, digraph, v):
-        self._on_stack[v] = True
-        self._marked[v] = True
-        for w in digraph.adj(v):
-            # short circuit if directed cycle found
-            if self.has_cycle():
-                return
-            # found new vertex, so recur
-            elif not self._marked[w]:
-                self._edge_to[w] = v
-                self._dfs(digraph, w)
-            # trace back directed cycle
-            elif self._on_stack[w]:
-                self._cycle = Stack()
-                x = v
-                while x != w:
-                    self._cycle.push(x)
-                    x = self._edge_to[x]
-                self._cycle.push(w)
-                self._cycle.push(v)
-
-        self._on_stack[v] = False
+    def _dfs(self, digraph, s):
+        on_stack = self._on_stack
+        edge_to = self._edge_to
+
+        def pre(v):
+            on_stack[v] = True
+
+        def post(v):
+            on_stack[v] = False
+
+        # found new vertex
+        def tree_edge(v, w, e):
+            edge_to[w] = v
+
+        # trace back directed cycle, which stops the search
+        def non_tree_edge(v, w, e):
+            if not on_stack[w]:
+                return False
+            self._cycle = Stack()
+            x = v
+            while x != w:
+                self._cycle.push(x)
+                x = edge_to[x]
+            self._cycle.push(w)
+            self._cycle.push(v)
+            return True
+
+        return iterative_dfs(
+            digraph,
+            s,
+            self._marked,
+            pre=pre,
+            post=post,
+            tree_edge=tree_edge,
+            non_tree_edge=non_tree_edge,
+        )
 
     def has_cycle(self):
         """Does the digraph have a directed cycle?
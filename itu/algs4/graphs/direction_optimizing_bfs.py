@@ -0,0 +1,199 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements direction-optimizing breadth-first search (Beamer,
+Asanovic and Patterson, 2012).
+
+A breadth-first search proceeds in levels. The usual top-down step examines
+every edge leaving the current frontier. On graphs with a small diameter,
+such as social networks, a few middle levels contain most of the vertices,
+and almost all of those edges lead to vertices that are already visited. A
+bottom-up step goes the other way: each unvisited vertex looks through its
+incoming edges for a parent in the frontier, and stops at the first one it
+finds. The search switches to bottom-up steps when the edges leaving the
+frontier outnumber a fraction of the edges of the unvisited vertices, and
+switches back to top-down once the frontier is small again.
+
+"""
+
+import math
+import sys
+from array import array
+
+from itu.algs4.fundamentals.stack import Stack
+
+_ALPHA = 14  # go bottom-up once the frontier has more than 1/ALPHA of the unexplored edges
+_BETA = 24  # go top-down again once the frontier has fewer than V/BETA vertices
+
+
+class DirectionOptimizingBFS:
+    """The DirectionOptimizingBFS class represents a data type for finding
+    shortest paths (number of edges) from a source vertex, or a set of source
+    vertices, to every other vertex in a directed or undirected graph. It
+    answers the same queries as BreadthFirstPaths.
+
+    This implementation runs a level-synchronous breadth-first search that
+    keeps each frontier in a list and picks a top-down or a bottom-up step for
+    each level. The distances and the parent of each vertex are stored in
+    flat int arrays. The constructor takes time proportional to V + E in the
+    worst case, and usually examines far fewer edges on graphs with a small
+    diameter. For a digraph, the first bottom-up step builds its reverse.
+    Each call to dist_to() and has_path_to() takes constant time; each call
+    to path_to() takes time proportional to the length of the path.
+
+    """
+
+    def __init__(self, G, sources):
+        """Computes the shortest paths between any one of the source vertices
+        and every other vertex in the graph G.
+
+        :param G: the graph or digraph
+        :param sources: the source vertex, or an iterable of source vertices
+        :raises ValueError: unless 0 <= s < V for each source vertex s
+        :raises ValueError: if there are no source vertices
+
+        """
+        V = G.V()
+        if isinstance(sources, int):
+            sources = [sources]
+        elif sources is not None:
+            sources = list(sources)
+        self._dist_to = array("i", [-1]) * V  # -1 for vertices not reached
+        self._edge_to = array("i", [-1]) * V  # parent on a shortest path
+        self._validateVertices(sources)
+        self._bfs(G, sources)
+
+    def _bfs(self, G, sources):
+        V = G.V()
+        dist_to = self._dist_to
+        edge_to = self._edge_to
+        frontier = []
+        for s in sources:
+            if dist_to[s] == -1:
+                dist_to[s] = 0
+                frontier.append(s)
+        degree = array("i", (G.degree(v) for v in range(V)))
+        unexplored = sum(degree) - sum(degree[v] for v in frontier)
+        reverse = None
+        bottom_up = False
+        level = 0
+        while frontier:
+            edges = sum(degree[v] for v in frontier)
+            if not bottom_up and edges > unexplored / _ALPHA:
+                bottom_up = True
+            elif bottom_up and len(frontier) < V / _BETA:
+                bottom_up = False
+
+            following = []
+            if bottom_up:
+                if reverse is None:
+                    # undirected graphs are their own reverse
+                    reverse = G.reverse() if hasattr(G, "reverse") else G
+                for w in range(V):
+                    if dist_to[w] != -1:
+                        continue
+                    for v in reverse.adj(w):
+                        if dist_to[v] == level:
+                            dist_to[w] = level + 1
+                            edge_to[w] = v
+                            following.append(w)
+                            break
+            else:
+                for v in frontier:
+                    for w in G.adj(v):
+                        if dist_to[w] == -1:
+                            dist_to[w] = level + 1
+                            edge_to[w] = v
+                            following.append(w)
+            unexplored -= sum(degree[w] for w in following)
+            frontier = following
+            level += 1
+
+    def has_path_to(self, v):
+        """Is there a path between the source vertex (or sources) and vertex
+        v?
+
+        :param v: the vertex
+        :returns: True if there is a path, and False otherwise
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        self._validateVertex(v)
+        return self._dist_to[v] != -1
+
+    def dist_to(self, v):
+        """Returns the number of edges in a shortest path between the source
+        vertex (or sources) and vertex v.
+
+        :param v: the vertex
+        :returns: the number of edges in a shortest path, and math.inf if
+                  there is no path
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        self._validateVertex(v)
+        d = self._dist_to[v]
+        return math.inf if d == -1 else d
+
+    def distances(self):
+        """Returns the number of edges in a shortest path between the source
+        vertex (or sources) and every vertex, in one array.
+
+        :returns: an int array whose entry v is the distance to vertex v, and
+                  -1 if there is no path
+
+        """
+        return array("i", self._dist_to)
+
+    def path_to(self, v):
+        """Returns a shortest path between the source vertex (or sources) and
+        v, or None if no such path.
+
+        :param v: the vertex
+        :returns: the sequence of vertices on a shortest path, as an Iterable
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        if not self.has_path_to(v):
+            return None
+        path = Stack()
+        x = v
+        while self._dist_to[x] != 0:
+            path.push(x)
+            x = self._edge_to[x]
+        path.push(x)
+        return path
+
+    def _validateVertex(self, v):
+        # throw a ValueError unless 0 <= v < V
+        V = len(self._dist_to)
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
+
+    def _validateVertices(self, vertices):
+        # throw a ValueError unless there is a vertex and 0 <= v < V for each
+        if vertices is None:
+            raise ValueError("argument is None")
+        count = 0
+        for v in vertices:
+            self._validateVertex(v)
+            count += 1
+        if count == 0:
+            raise ValueError("zero vertices")
+
+
+if __name__ == "__main__":
+    from itu.algs4.graphs.graph import Graph
+    from itu.algs4.stdlib.instream import InStream
+
+    G = Graph.from_stream(InStream(sys.argv[1]))
+    s = int(sys.argv[2])
+    bfs = DirectionOptimizingBFS(G, s)
+
+    for v in range(G.V()):
+        if bfs.has_path_to(v):
+            print("{} to {} ({}):  ".format(s, v, bfs.dist_to(v)), end="")
+            print("-".join(str(x) for x in bfs.path_to(v)))
+        else:
+            print("{} to {} (-):  not connected".format(s, v))
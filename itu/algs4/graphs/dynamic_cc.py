@@ -0,0 +1,521 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements fully dynamic connectivity: the connected
+components of an undirected graph whose edges are inserted and deleted over
+time.
+
+DynamicCC answers queries online with the algorithm of Holm, de Lichtenberg
+and Thorup (2001). Every edge has a level between 0 and log V. The tree edges
+of level at least i form a spanning forest F_i of the edges of level at least
+i, and F_0 is a spanning forest of the whole graph. Each F_i is stored as
+Euler tours in treaps, which link, cut and find the tree of a vertex in
+logarithmic expected time. When a tree edge of level l is deleted, the search
+for a replacement edge goes from level l down to 0, each time in the smaller
+of the two trees; the edges it examines without success move up one level,
+which pays for the search, since the tree of a vertex at level i has at most
+V / 2^i vertices.
+
+offline_dynamic_cc() answers a whole known sequence of operations at once
+instead. Each edge is alive during an interval of time, which is split over
+the O(log m) nodes of a segment tree on the m operations. A depth-first
+traversal of that tree unites the edges of each node in a union-find
+structure without path compression, visits the queries at the leaves in
+order, and rolls the unions back when it leaves the node.
+
+"""
+
+import random
+from array import array
+
+from itu.algs4.fundamentals.uf import UF
+
+_RANDOM = random.Random(20010728)  # treap priorities
+
+
+class _Node:
+    # a node of an Euler tour treap: the occurrence of a vertex, with the
+    # flags of the HDT algorithm, or the traversal of a tree edge tail->head
+
+    __slots__ = (
+        "left",
+        "right",
+        "parent",
+        "prio",
+        "size",
+        "vsize",
+        "tail",
+        "is_vertex",
+        "tree_own",
+        "nontree_own",
+        "tree_any",
+        "nontree_any",
+    )
+
+    def __init__(self, tail, is_vertex):
+        self.left = self.right = self.parent = None
+        self.prio = _RANDOM.random()
+        self.size = 1  # number of nodes in the subtree
+        self.vsize = 1 if is_vertex else 0  # number of vertex nodes in the subtree
+        self.tail = tail
+        self.is_vertex = is_vertex
+        self.tree_own = self.nontree_own = False  # has tree or non-tree edges
+        self.tree_any = self.nontree_any = False  # some node in the subtree has
+
+
+def _update(t):
+    # recomputes the subtree fields of t from its children
+    size = 1
+    vsize = 1 if t.is_vertex else 0
+    tree_any = t.tree_own
+    nontree_any = t.nontree_own
+    for c in (t.left, t.right):
+        if c is not None:
+            size += c.size
+            vsize += c.vsize
+            tree_any = tree_any or c.tree_any
+            nontree_any = nontree_any or c.nontree_any
+    t.size = size
+    t.vsize = vsize
+    t.tree_any = tree_any
+    t.nontree_any = nontree_any
+
+
+def _merge(a, b):
+    # concatenates the sequences of the treaps a and b
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.prio > b.prio:
+        a.right = _merge(a.right, b)
+        a.right.parent = a
+        _update(a)
+        return a
+    b.left = _merge(a, b.left)
+    b.left.parent = b
+    _update(b)
+    return b
+
+
+def _split(t, k):
+    # splits the treap t into its first k nodes and the rest
+    if t is None:
+        return None, None
+    left_size = t.left.size if t.left is not None else 0
+    if k <= left_size:
+        a, b = _split(t.left, k)
+        t.left = b
+        if b is not None:
+            b.parent = t
+        _update(t)
+        if a is not None:
+            a.parent = None
+        t.parent = None
+        return a, t
+    a, b = _split(t.right, k - left_size - 1)
+    t.right = a
+    if a is not None:
+        a.parent = t
+    _update(t)
+    if b is not None:
+        b.parent = None
+    t.parent = None
+    return t, b
+
+
+def _root(x):
+    while x.parent is not None:
+        x = x.parent
+    return x
+
+
+def _index(x):
+    # returns the position of x in its sequence and the root of its treap
+    i = x.left.size if x.left is not None else 0
+    while x.parent is not None:
+        p = x.parent
+        if x is p.right:
+            i += (p.left.size if p.left is not None else 0) + 1
+        x = p
+    return i, x
+
+
+def _find(t, own, any_):
+    # returns a node of the treap t whose flag own is set, or None
+    if t is None or not getattr(t, any_):
+        return None
+    while not getattr(t, own):
+        if t.left is not None and getattr(t.left, any_):
+            t = t.left
+        else:
+            t = t.right
+    return t
+
+
+class _EulerTourForest:
+    # a forest stored as one Euler tour treap per tree
+
+    def __init__(self):
+        self._vertices = {}  # vertex -> its node, created on first use
+        self._edges = {}  # (tail, head) -> the node of that traversal
+
+    def node(self, v):
+        x = self._vertices.get(v)
+        if x is None:
+            x = self._vertices[v] = _Node(v, True)
+        return x
+
+    def root(self, v):
+        return _root(self.node(v))
+
+    def connected(self, v, w):
+        return self.root(v) is self.root(w)
+
+    def tree_size(self, v):
+        return self.root(v).vsize
+
+    def _reroot(self, v):
+        # rotates the tour of the tree of v to start at v
+        i, t = _index(self.node(v))
+        a, b = _split(t, i)
+        return _merge(b, a)
+
+    def link(self, v, w):
+        vw = self._edges[v, w] = _Node(v, False)
+        wv = self._edges[w, v] = _Node(w, False)
+        t = _merge(_merge(_merge(self._reroot(v), vw), self._reroot(w)), wv)
+        t.parent = None
+
+    def cut(self, v, w):
+        first = self._edges.pop((v, w))
+        second = self._edges.pop((w, v))
+        i, t = _index(first)
+        j, _ = _index(second)
+        if i > j:
+            i, j = j, i
+        # the tour is a, first, b, second, c; b is the tour of one side
+        a, rest = _split(t, i)
+        _, rest = _split(rest, 1)
+        b, rest = _split(rest, j - i - 1)
+        _, c = _split(rest, 1)
+        t = _merge(a, c)
+        if t is not None:
+            t.parent = None
+
+    def set_flag(self, v, own, value):
+        x = self.node(v)
+        setattr(x, own, value)
+        while x is not None:
+            _update(x)
+            x = x.parent
+
+
+class DynamicCC:
+    """The DynamicCC class represents a data type for the connected components
+    of an undirected graph on V vertices whose edges can be added and
+    removed, with the queries of CC. Parallel edges and self-loops are
+    permitted. The component identifier of a connected component is one of
+    its vertices; two vertices have the same component identifier if and
+    only if they are in the same connected component, until the next update.
+
+    This implementation uses the Holm-de Lichtenberg-Thorup algorithm, with
+    Euler tour treaps for the spanning forests of the levels. Adding an
+    edge, and the connected, id and size operations, take logarithmic
+    expected time. Removing an edge takes time proportional to log^2 V
+    amortized. The count operation takes constant time.
+
+    """
+
+    def __init__(self, V):
+        """Initializes a graph with V vertices and no edges.
+
+        :param V: the number of vertices
+        :raises ValueError: if V < 0
+
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative")
+        self._V = V
+        self._count = V
+        levels = max(V, 1).bit_length()
+        self._forests = [_EulerTourForest() for _ in range(levels + 1)]
+        self._tree_adj = [{} for _ in range(levels + 1)]  # level-i tree edges
+        self._nontree_adj = [{} for _ in range(levels + 1)]  # level-i other edges
+        self._multiplicity = {}  # (v, w) with v <= w -> number of copies
+        self._level = {}  # (v, w) -> level of the edge
+        self._tree = set()  # the edges of F_0
+
+    def V(self):
+        """Returns the number of vertices.
+
+        :returns: the number of vertices
+
+        """
+        return self._V
+
+    def add_edge(self, v, w):
+        """Adds the undirected edge v-w.
+
+        :param v: one vertex in the edge
+        :param w: the other vertex in the edge
+        :raises ValueError: unless both 0 <= v < V and 0 <= w < V
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        key = (v, w) if v <= w else (w, v)
+        copies = self._multiplicity.get(key, 0)
+        self._multiplicity[key] = copies + 1
+        if copies > 0 or v == w:
+            return  # only the first copy of an edge matters
+        self._level[key] = 0
+        if self._forests[0].connected(v, w):
+            self._add(self._nontree_adj, "nontree_own", 0, v, w)
+        else:
+            self._tree.add(key)
+            self._add(self._tree_adj, "tree_own", 0, v, w)
+            self._forests[0].link(v, w)
+            self._count -= 1
+
+    def remove_edge(self, v, w):
+        """Removes one copy of the undirected edge v-w.
+
+        :param v: one vertex in the edge
+        :param w: the other vertex in the edge
+        :raises ValueError: unless both 0 <= v < V and 0 <= w < V
+        :raises ValueError: if there is no edge v-w
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        key = (v, w) if v <= w else (w, v)
+        copies = self._multiplicity.get(key, 0)
+        if copies == 0:
+            raise ValueError("there is no edge {}-{}".format(v, w))
+        if copies > 1:
+            self._multiplicity[key] = copies - 1
+            return
+        del self._multiplicity[key]
+        if v == w:
+            return
+        level = self._level.pop(key)
+        if key not in self._tree:
+            self._remove(self._nontree_adj, "nontree_own", level, v, w)
+            return
+        self._tree.remove(key)
+        self._remove(self._tree_adj, "tree_own", level, v, w)
+        for i in range(level + 1):
+            self._forests[i].cut(v, w)
+        for i in range(level, -1, -1):
+            if self._replace(i, v, w):
+                return
+        self._count += 1
+
+    def _replace(self, i, v, w):
+        # looks for an edge of level i that reconnects the trees of v and w
+        # in F_i, moving the edges of the smaller tree up one level meanwhile
+        forest = self._forests[i]
+        if forest.tree_size(v) > forest.tree_size(w):
+            v, w = w, v
+        # the tree of v is the smaller one; its tree edges of level i go up
+        while True:
+            x = _find(forest.root(v), "tree_own", "tree_any")
+            if x is None:
+                break
+            x = x.tail
+            for y in list(self._tree_adj[i][x]):
+                self._remove(self._tree_adj, "tree_own", i, x, y)
+                self._add(self._tree_adj, "tree_own", i + 1, x, y)
+                self._level[(x, y) if x <= y else (y, x)] = i + 1
+                self._forests[i + 1].link(x, y)
+        # then its non-tree edges of level i either reconnect or go up
+        while True:
+            x = _find(forest.root(v), "nontree_own", "nontree_any")
+            if x is None:
+                return False
+            x = x.tail
+            for y in list(self._nontree_adj[i][x]):
+                self._remove(self._nontree_adj, "nontree_own", i, x, y)
+                key = (x, y) if x <= y else (y, x)
+                if forest.connected(y, v):
+                    self._add(self._nontree_adj, "nontree_own", i + 1, x, y)
+                    self._level[key] = i + 1
+                else:
+                    self._tree.add(key)
+                    self._add(self._tree_adj, "tree_own", i, x, y)
+                    for j in range(i + 1):
+                        self._forests[j].link(x, y)
+                    return True
+
+    def _add(self, adjacency, flag, i, v, w):
+        # records the edge v-w at level i in adjacency and sets the flag of
+        # each endpoint in F_i if it had no such edges before
+        for a, b in ((v, w), (w, v)):
+            neighbours = adjacency[i].get(a)
+            if neighbours is None:
+                neighbours = adjacency[i][a] = set()
+            if not neighbours:
+                self._forests[i].set_flag(a, flag, True)
+            neighbours.add(b)
+
+    def _remove(self, adjacency, flag, i, v, w):
+        # removes the edge v-w at level i from adjacency, and clears the
+        # flag of each endpoint in F_i that has no such edges left
+        for a, b in ((v, w), (w, v)):
+            neighbours = adjacency[i][a]
+            neighbours.discard(b)
+            if not neighbours:
+                self._forests[i].set_flag(a, flag, False)
+
+    def id(self, v):
+        """Returns the component id of the connected component containing
+        vertex v.
+
+        :param v: the vertex
+        :returns: the component id of the connected component containing vertex v
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._forests[0].root(v).tail
+
+    def size(self, v):
+        """Returns the number of vertices in the connected component containing
+        vertex v.
+
+        :param v: the vertex
+        :returns: the number of vertices in the connected component containing vertex v
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._forests[0].tree_size(v)
+
+    def count(self):
+        """Returns the number of connected components.
+
+        :returns: the number of connected components
+
+        """
+        return self._count
+
+    def connected(self, v, w):
+        """Returns true if vertices v and w are in the same connected
+        component.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: True if vertices v and w are in the same connected component;
+                    False otherwise
+        :raises ValueError: unless 0 <= v < V
+        :raises ValueError: unless 0 <= w < V
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        return self._forests[0].connected(v, w)
+
+    def _validate_vertex(self, v):
+        # Raises a ValueError unless 0 <= v < V
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
+
+
+def offline_dynamic_cc(V, operations):
+    """Answers the queries in a sequence of operations on an undirected graph
+    with V vertices and initially no edges. The operations are tuples:
+    ("add", v, w) adds the edge v-w, ("remove", v, w) removes one copy of it,
+    ("connected", v, w) asks whether v and w are connected, and ("count",)
+    asks for the number of connected components.
+
+    This implementation processes the sequence offline, by divide and
+    conquer over time with a union-find structure that supports rollback.
+    It takes time proportional to m log m log V for m operations.
+
+    :param V: the number of vertices
+    :param operations: the sequence of operations
+    :returns: the answers to the queries, in order, as a list
+    :raises ValueError: if an operation is unknown, names a vertex that is
+                        not between 0 and V - 1, or removes a missing edge
+
+    """
+    operations = list(operations)
+    m = len(operations)
+    if V < 0:
+        raise ValueError("Number of vertices must be nonnegative")
+    for op in operations:
+        if op[0] not in ("add", "remove", "connected", "count"):
+            raise ValueError("unknown operation {}".format(op[0]))
+        for v in op[1:]:
+            if v < 0 or v >= V:
+                raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
+
+    # the intervals [start, end) of time during which each edge exists,
+    # stored in the nodes of a segment tree over [0, m)
+    size = 1
+    while size < m:
+        size *= 2
+    segments = [[] for _ in range(2 * size)]
+
+    def insert(lo, hi, edge):
+        node, node_lo, node_hi = 1, 0, size
+        stack = [(node, node_lo, node_hi)]
+        while stack:
+            node, node_lo, node_hi = stack.pop()
+            if hi <= node_lo or node_hi <= lo:
+                continue
+            if lo <= node_lo and node_hi <= hi:
+                segments[node].append(edge)
+                continue
+            mid = (node_lo + node_hi) // 2
+            stack.append((2 * node, node_lo, mid))
+            stack.append((2 * node + 1, mid, node_hi))
+
+    added = {}  # (v, w) -> start times of its live copies
+    for t, op in enumerate(operations):
+        if op[0] == "add" or op[0] == "remove":
+            v, w = op[1], op[2]
+            key = (v, w) if v <= w else (w, v)
+            if op[0] == "add":
+                added.setdefault(key, []).append(t)
+            elif added.get(key):
+                insert(added[key].pop(), t, key)
+            else:
+                raise ValueError("there is no edge {}-{}".format(v, w))
+    for key, starts in added.items():
+        for start in starts:
+            insert(start, m, key)
+
+    # queries[t] = number of queries among the first t operations, to skip
+    # the parts of time without any
+    queries = array("i", [0]) * (size + 1)
+    for t in range(size):
+        is_query = t < m and operations[t][0] in ("connected", "count")
+        queries[t + 1] = queries[t] + is_query
+
+    uf = UF(V, "i", undoable=True)
+    answers = []
+
+    def visit(node, lo, hi):
+        if queries[hi] == queries[lo]:
+            return
+        checkpoint = uf.checkpoint()
+        for v, w in segments[node]:
+            uf.union(v, w)
+        if hi - lo == 1:
+            op = operations[lo]
+            if op[0] == "connected":
+                answers.append(uf.find(op[1]) == uf.find(op[2]))
+            else:
+                answers.append(uf.count())
+        else:
+            mid = (lo + hi) // 2
+            visit(2 * node, lo, mid)
+            visit(2 * node + 1, mid, hi)
+        uf.rollback(checkpoint)
+
+    visit(1, 0, size)
+    return answers
@@ -0,0 +1,232 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+"""This module implements a topological order of a digraph that is kept up
+to date while edges are added, with the algorithm of Pearce and Kelly (2006).
+
+Every vertex has a rank, and every edge leads from a vertex of smaller rank
+to one of larger rank. A new edge v->w that already agrees with the ranks
+costs nothing. Otherwise, only the vertices whose ranks lie between those of
+w and v can be out of order: a forward search from w and a backward search
+from v, both confined to that range, find the vertices reachable from w and
+those reaching v. If the forward search meets v, the edge would close a
+cycle and is rejected. Else the two sets are placed in the ranks they held
+together, the ones reaching v first, each in its old relative order.
+
+"""
+
+from array import array
+
+from itu.algs4.fundamentals.stack import Stack
+
+
+class DynamicTopological:
+    """The DynamicTopological class represents a directed acyclic graph
+    (DAG) together with a topological order of its vertices, which is
+    updated as edges are added. An edge that would close a directed cycle is
+    rejected, and the cycle operation returns that cycle. The order and rank
+    operations work as in Topological.
+
+    This implementation uses the Pearce-Kelly algorithm. Adding an edge takes
+    time proportional to the number of vertices and edges in the part of the
+    digraph whose ranks lie between those of its endpoints, plus the log of
+    that number of vertices per such vertex to sort them, instead of V + E for
+    recomputing the order. The rank operation takes constant time and the
+    order operation takes time proportional to V.
+
+    """
+
+    def __init__(self, V):
+        """Initializes an empty DAG with V vertices and no edges, in the
+        topological order 0 through V-1.
+
+        :param V: the number of vertices
+        :raises ValueError: if V < 0
+
+        """
+        if V < 0:
+            raise ValueError("Number of vertices must be nonnegative")
+        self._V = V
+        self._E = 0
+        self._adj = [[] for _ in range(V)]  # edges leaving each vertex
+        self._radj = [[] for _ in range(V)]  # edges entering each vertex
+        self._rank = array("i", range(V))  # rank[v] = position of v in the order
+        self._vertex = array("i", range(V))  # vertex[i] = vertex at position i
+        self._cycle = None  # the cycle closed by the last rejected edge
+
+    def V(self):
+        """Returns the number of vertices in the digraph.
+
+        :returns: the number of vertices in the digraph
+
+        """
+        return self._V
+
+    def E(self):
+        """Returns the number of edges in the digraph.
+
+        :returns: the number of edges in the digraph
+
+        """
+        return self._E
+
+    def adj(self, v):
+        """Returns the vertices adjacent from vertex v in the digraph.
+
+        :param v: the vertex
+        :returns: the vertices adjacent from vertex v in the digraph, as an iterable
+
+        """
+        self._validate_vertex(v)
+        return self._adj[v]
+
+    def add_edge(self, v, w):
+        """Adds the directed edge v->w to the digraph, unless it would close a
+        directed cycle, and updates the topological order.
+
+        :param v: the tail vertex
+        :param w: the head vertex
+        :returns: True if the edge was added, and False if it was rejected
+                  because it closes a cycle, which cycle() then returns
+        :raises ValueError: unless both 0 <= v < V and 0 <= w < V
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        if v == w:
+            self._cycle = Stack()
+            self._cycle.push(v)
+            self._cycle.push(v)
+            return False
+        rank = self._rank
+        lower, upper = rank[w], rank[v]
+        if lower < upper:
+            # w precedes v in the order, so the ranks in between must change
+            forward = self._search_forward(w, v, upper)
+            if forward is None:
+                return False
+            backward = self._search_backward(v, lower)
+            self._reorder(backward, forward)
+        self._adj[v].append(w)
+        self._radj[w].append(v)
+        self._E += 1
+        self._cycle = None
+        return True
+
+    def _search_forward(self, w, v, upper):
+        # returns the vertices reachable from w with rank below upper, or
+        # None if v is reachable, in which case the cycle is recorded
+        rank = self._rank
+        edge_to = {w: w}
+        stack = [w]
+        while stack:
+            x = stack.pop()
+            for y in self._adj[x]:
+                if y == v:
+                    self._record_cycle(edge_to, x, v)
+                    return None
+                if rank[y] < upper and y not in edge_to:
+                    edge_to[y] = x
+                    stack.append(y)
+        return list(edge_to)
+
+    def _search_backward(self, v, lower):
+        # returns the vertices that reach v with rank above lower
+        rank = self._rank
+        marked = {v}
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            for y in self._radj[x]:
+                if rank[y] > lower and y not in marked:
+                    marked.add(y)
+                    stack.append(y)
+        return list(marked)
+
+    def _reorder(self, backward, forward):
+        # gives the vertices of both sets the ranks they hold together, first
+        # those reaching the tail, then those reachable from the head
+        rank = self._rank
+        vertex = self._vertex
+        backward.sort(key=rank.__getitem__)
+        forward.sort(key=rank.__getitem__)
+        moved = backward + forward
+        ranks = sorted(rank[x] for x in moved)
+        for x, r in zip(moved, ranks):
+            rank[x] = r
+            vertex[r] = x
+
+    def _record_cycle(self, edge_to, x, v):
+        # the cycle v->w->...->x->v, where edge_to leads from x back to w
+        cycle = Stack()
+        cycle.push(v)
+        while edge_to[x] != x:
+            cycle.push(x)
+            x = edge_to[x]
+        cycle.push(x)
+        cycle.push(v)
+        self._cycle = cycle
+
+    def cycle(self):
+        """Returns the directed cycle that the last call to add_edge() would
+        have closed, if it rejected its edge, and None otherwise.
+
+        :returns: the cycle as an iterable of vertices, starting and ending
+                  at the tail of the rejected edge, and None if the last edge
+                  was added
+
+        """
+        return self._cycle
+
+    def order(self):
+        """Returns a topological order of the digraph.
+
+        :returns: the vertices in a topological order, as an iterable
+
+        """
+        return list(self._vertex)
+
+    def has_order(self):
+        """Does the digraph have a topological order? Always True, since no
+        edge that closes a cycle is added.
+
+        :returns: True
+
+        """
+        return True
+
+    def rank(self, v):
+        """Returns the rank of vertex v in the topological order.
+
+        :param v: the vertex
+        :returns: the position of vertex v in the topological order
+
+        """
+        self._validate_vertex(v)
+        return self._rank[v]
+
+    def _validate_vertex(self, v):
+        # throw a ValueError unless 0 <= v < V
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
+
+
+if __name__ == "__main__":
+    import sys
+
+    from itu.algs4.stdlib.instream import InStream
+
+    # adds the edges of a digraph file one at a time, reporting those that
+    # would close a cycle, and prints the final order
+    stream = InStream(sys.argv[1])
+    V = stream.readInt()
+    E = stream.readInt()
+    dag = DynamicTopological(V)
+    for _ in range(E):
+        v = stream.readInt()
+        w = stream.readInt()
+        if not dag.add_edge(v, w):
+            cycle = " ".join(str(x) for x in dag.cycle())
+            print("{}->{} closes the cycle {}".format(v, w, cycle))
+    print(" ".join(str(v) for v in dag.order()))
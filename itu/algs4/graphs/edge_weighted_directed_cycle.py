@@ -6,6 +6,7 @@ import sys
 from itu.algs4.fundamentals.stack import Stack
 from itu.algs4.graphs.directed_edge import DirectedEdge
 from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
 
 # Execution:    python edge_weighted_directed_cycle V E F
 # Finds a directed cycle in an edge-weighted digraph.
@@ -17,7 +18,8 @@ from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
     The hasCycle operation determines whether the edge-weighted
     digraph has a directed cycle and, if so, the cycle operation
     returns one.
-    This implementation uses depth-first search.
+    This implementation uses depth-first search with an explicit stack
+    (see iterative_dfs).
     The constructor takes time proportional to V + E
     (in the worst case),
     where V is the number of vertices and E is the number of edges.
@@ -42,39 +44,50 @@ class EdgeWeightedDirectedCycle:
         self._cycle = None  # directed cycle (or None if no such cycle)
 
         for v in range(G.V()):
-            if not self._marked[v]:
-                self._dfs(G, v)
+            if not self._marked[v] and self._dfs(G, v):
+                break
 
         # check that digraph has a cycle
         assert self._check()
 
     # check that algorithm computes either the topological order or finds a directed cycle
-    def _dfs(self, G, v):
-        self._onStack[v] = True
-        self._marked[v] = True
-        for e in G.adj(v):
-            w = e.to_vertex()
-
-            # short circuit if directed cycle found
-            if self._cycle is not None:
-                return
-
-            # found new vertex, so recur
-            elif not self._marked[w]:
-                self._edgeTo[w] = e
-                self._dfs(G, w)
-
-            # trace back directed cycle
-            elif self._onStack[w]:
-                self._cycle = Stack()
-                f = e
-                while f.from_vertex() != w:
-                    self._cycle.push(f)
-                    f = self._edgeTo[f.from_vertex()]
+    def _dfs(self, G, s):
+        onStack = self._onStack
+        edgeTo = self._edgeTo
+
+        def pre(v):
+            onStack[v] = True
+
+        def post(v):
+            onStack[v] = False
 
+        # found new vertex
+        def tree_edge(v, w, e):
+            edgeTo[w] = e
+
+        # trace back directed cycle, which stops the search
+        def non_tree_edge(v, w, e):
+            if not onStack[w]:
+                return False
+            self._cycle = Stack()
+            f = e
+            while f.from_vertex() != w:
                 self._cycle.push(f)
-                return
-        self._onStack[v] = False
+                f = edgeTo[f.from_vertex()]
+
+            self._cycle.push(f)
+            return True
+
+        return iterative_dfs(
+            G,
+            s,
+            self._marked,
+            pre=pre,
+            post=post,
+            tree_edge=tree_edge,
+            non_tree_edge=non_tree_edge,
+            edge_weighted=True,
+        )
 
     # Does the edge-weighted digraph have a directed cycle?
     # @return True if the edge-weighted digraph has a directed cycle,
@@ -0,0 +1,202 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements the Floyd-Warshall algorithm for the all-pairs
+shortest paths problem in dense edge-weighted digraphs, whose edge weights
+may be negative.
+
+The distances and next hops are kept as V rows, one per source vertex. Each
+of the V rounds of the algorithm lets the paths from every vertex i pass
+through one more vertex k: row i improves wherever the distance from i to k
+plus row k is smaller. Both the sums and the comparisons are computed by
+builtins over whole rows instead of a Python statement per entry, and only
+the entries that improve, which are few after the first rounds, are visited
+one at a time to update the distances and the next hops.
+
+"""
+
+import sys
+from array import array
+from itertools import compress, repeat
+from operator import add, lt
+
+from itu.algs4.errors.errors import UnsupportedOperationException
+from itu.algs4.fundamentals.queue import Queue
+from itu.algs4.graphs.bellman_ford_array_sp import BellmanFordArraySP
+from itu.algs4.graphs.csr_edge_weighted_digraph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.stdlib import instream
+
+
+class FloydWarshall:
+    """The FloydWarshall class represents a data type for solving the
+    all-pairs shortest paths problem in edge-weighted digraphs with no
+    negative cycles, with the interface of DijkstraAllPairsSP. The edge
+    weights can be positive, negative, or zero. This class finds either a
+    shortest path between every pair of vertices or a negative cycle.
+
+    This implementation uses the Floyd-Warshall algorithm on a distance
+    matrix and a next-hop matrix, updated a row at a time. The constructor
+    takes time proportional to V^3 in the worst case, where V is the number
+    of vertices, and uses space proportional to V^2. It stops as soon as an
+    entry on the diagonal of the distance matrix becomes negative. Afterwards,
+    the dist(), has_path() and has_negative_cycle() methods take constant
+    time; the path() method takes time proportional to the number of edges
+    in the shortest path returned times the degree of their tails.
+
+    """
+
+    def __init__(self, G):
+        """Computes a shortest paths tree from each vertex to every other
+        vertex in the edge-weighted digraph G, or finds a negative cycle.
+
+        :param G: the edge-weighted digraph, or a CSREdgeWeightedDigraph
+
+        """
+        if isinstance(G, CSREdgeWeightedDigraph):
+            csr = G
+        else:
+            csr = CSREdgeWeightedDigraph.from_graph(G)
+        V = csr.V()
+        offsets, targets, weights = csr.arrays()
+        self._G = csr
+        self._V = V
+        self._cycle = None
+
+        # initialize the distances with the lightest edge between two vertices
+        inf = float("inf")
+        dist = []
+        nxt = []
+        for v in range(V):
+            row = [inf] * V
+            hop = array("i", [-1]) * V
+            row[v] = 0.0
+            hop[v] = v
+            for i in range(offsets[v], offsets[v + 1]):
+                w = targets[i]
+                if weights[i] < row[w]:
+                    row[w] = weights[i]
+                    hop[w] = w
+            dist.append(row)
+            nxt.append(hop)
+        self._dist = dist
+        self._next = nxt
+
+        vertices = range(V)
+        for k in vertices:
+            row_k = dist[k]
+            for i in vertices:
+                row_i = dist[i]
+                d = row_i[k]
+                if d == inf:
+                    continue
+                through_k = list(map(add, repeat(d), row_k))
+                improved = list(compress(vertices, map(lt, through_k, row_i)))
+                if not improved:
+                    continue
+                hop_i = nxt[i]
+                hop = hop_i[k]
+                for j in improved:
+                    row_i[j] = through_k[j]
+                    hop_i[j] = hop
+                if row_i[i] < 0.0:
+                    self._find_negative_cycle(i)
+                    return
+
+    def _find_negative_cycle(self, v):
+        # v lies on a negative cycle, which Bellman-Ford from v finds
+        self._cycle = BellmanFordArraySP(self._G, v).negative_cycle()
+
+    def has_negative_cycle(self):
+        """Is there a negative cycle in the digraph?
+
+        :returns: True if there is a negative cycle, and False otherwise
+
+        """
+        return self._cycle is not None
+
+    def negative_cycle(self):
+        """Returns a negative cycle, or None if there is no such cycle.
+
+        :returns: a negative cycle as an iterable of edges, and None if there
+                  is no such cycle
+
+        """
+        return self._cycle
+
+    def path(self, source, target):
+        """Returns a shortest path from source vertex to the target vertex.
+
+        :param source: the source vertex
+        :param target: the destination vertex
+
+        :returns: a shortest path from the source vertex to the target vertex as an iterable of edges,
+                  and None if no such path
+        :raises UnsupportedOperationException: if there is a negative cycle
+
+        """
+        if not self.has_path(source, target):
+            return None
+        path = Queue()
+        v = source
+        while v != target:
+            w = self._next[v][target]
+            # the lightest of the parallel edges v->w
+            path.enqueue(self._G.lightest_edge(v, w))
+            v = w
+        return path
+
+    def has_path(self, source, target):
+        """Is there a path from the source vertex to the target vertex?
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: True if there is a path from the source to the target, and False otherwise
+        :raises UnsupportedOperationException: if there is a negative cycle
+
+        """
+        return self.dist(source, target) < float("inf")
+
+    def dist(self, source, target):
+        """Returns the length of a shortest path from the source vertex to the
+        target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: the length of a shortest path from the source vertex to the target vertex;
+                  float('inf') if no such path
+        :raises UnsupportedOperationException: if there is a negative cycle
+
+        """
+        self._validateVertex(source)
+        self._validateVertex(target)
+        if self.has_negative_cycle():
+            raise UnsupportedOperationException("Negative cost cycle exists")
+        return self._dist[source][target]
+
+    # throw a ValueError unless 0 <= v < V
+    def _validateVertex(self, v):
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, (V - 1)))
+
+
+if __name__ == "__main__":
+    # Create stream from file or the standard input,
+    # depending on whether a file name was passed.
+    stream = sys.argv[1] if len(sys.argv) > 1 else None
+
+    g = EdgeWeightedDigraph.from_stream(instream.InStream(stream))
+    sp = FloydWarshall(g)
+
+    if sp.has_negative_cycle():
+        for e in sp.negative_cycle():
+            print(e)
+    else:
+        # Print the shortest path distances between all possible pairs of vertices.
+        for source in range(g.V()):
+            for target in range(g.V()):
+                print(sp.dist(source, target))
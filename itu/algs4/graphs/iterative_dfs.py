@@ -0,0 +1,83 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements depth-first search with an explicit stack instead of
+recursion. The search classes in this package (DepthFirstSearch,
+DepthFirstPaths, CC, Cycle, Bipartite, DirectedDFS, DirectedCycle,
+EdgeWeightedDirectedCycle, DepthFirstOrder and KosarajuSharirSCC) are built on
+it, so they are not limited by Python's recursion limit and work on graphs
+with paths of millions of vertices.
+
+The search visits vertices and edges in exactly the order of the textbook's
+recursive version, and reports what it sees through optional hook functions.
+
+"""
+
+
+def iterative_dfs(
+    G,
+    s,
+    marked,
+    pre=None,
+    post=None,
+    tree_edge=None,
+    non_tree_edge=None,
+    edge_weighted=False,
+):
+    """Runs a depth-first search in G from the unmarked vertex s, marking every
+    vertex it reaches in the list marked. Vertices that are already marked are
+    not entered again, so calling this function for several sources with the
+    same list searches each vertex once.
+
+    Each hook is called with the arguments listed below, as soon as the event
+    happens. If a hook returns True, the search stops at once and the function
+    returns True.
+
+    - pre(v): v has just been marked, before any of its edges are examined
+    - post(v): all edges leaving v have been examined
+    - tree_edge(v, w, e): the edge e from v to the unmarked vertex w is about
+      to be followed; w is marked right after the call
+    - non_tree_edge(v, w, e): the edge e leads from v to the marked vertex w
+
+    Here e is the item from the adjacency list of v: the vertex w itself for
+    graphs and digraphs, or a DirectedEdge for edge-weighted digraphs.
+
+    :param G: the graph, digraph or edge-weighted digraph to search
+    :param s: the source vertex
+    :param marked: the list with marked[v] True for each vertex v that should
+                   not be entered
+    :param pre: called when a vertex is discovered
+    :param post: called when a vertex is finished
+    :param tree_edge: called for each edge that leads to an unmarked vertex
+    :param non_tree_edge: called for each edge that leads to a marked vertex
+    :param edge_weighted: True if the adjacency lists of G hold DirectedEdge
+                          objects instead of vertices
+    :return: True if a hook stopped the search, False otherwise
+
+    """
+    marked[s] = True
+    if pre is not None and pre(s):
+        return True
+    # each entry holds a vertex and the iterator over its remaining edges
+    stack = [(s, iter(G.adj(s)))]
+    while stack:
+        v, edges = stack[-1]
+        for e in edges:
+            w = e.to_vertex() if edge_weighted else e
+            if marked[w]:
+                if non_tree_edge is not None and non_tree_edge(v, w, e):
+                    return True
+                continue
+            if tree_edge is not None and tree_edge(v, w, e):
+                return True
+            marked[w] = True
+            if pre is not None and pre(w):
+                return True
+            stack.append((w, iter(G.adj(w))))
+            break
+        else:
+            stack.pop()
+            if post is not None and post(v):
+                return True
+    return False
@@ -0,0 +1,189 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements Johnson's algorithm for the all-pairs shortest paths
+problem in sparse edge-weighted digraphs whose edge weights may be negative.
+
+Bellman-Ford, run once from a virtual source with an edge of weight 0 to
+every vertex, gives each vertex v a potential h(v). Every edge v->w of weight
+x then gets the weight x + h(v) - h(w), which is nonnegative, and every path
+from s to t changes its length by the same amount h(s) - h(t), so shortest
+paths stay shortest. Dijkstra's algorithm from every vertex of the reweighted
+digraph, in parallel, then solves the rest.
+
+"""
+
+import sys
+from array import array
+
+from itu.algs4.errors.errors import UnsupportedOperationException
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.bellman_ford_array_sp import BellmanFordArraySP
+from itu.algs4.graphs.csr_edge_weighted_digraph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.parallel_dijkstra_all_pairs_sp import ParallelDijkstraAllPairsSP
+from itu.algs4.stdlib import instream
+
+
+class JohnsonAllPairsSP:
+    """The JohnsonAllPairsSP class represents a data type for solving the
+    all-pairs shortest paths problem in edge-weighted digraphs with no
+    negative cycles, with the interface of DijkstraAllPairsSP. The edge
+    weights can be positive, negative, or zero. If there is a negative cycle,
+    the class finds one instead.
+
+    This implementation uses Johnson's algorithm: one run of
+    BellmanFordArraySP from a virtual source computes vertex potentials, and
+    ParallelDijkstraAllPairsSP solves the reweighted digraph. The
+    constructor takes time proportional to V E for Bellman-Ford in the worst
+    case plus V E log V for Dijkstra, divided by the number of processes, and
+    uses space proportional to V^2. Afterwards, the dist() and has_path()
+    methods take constant time and the path() method takes time proportional
+    to the number of edges in the shortest path returned, times the degree
+    of their tails.
+
+    """
+
+    def __init__(self, G, processes=None, chunk_size=None):
+        """Computes a shortest paths tree from each vertex to every other
+        vertex in the edge-weighted digraph G, or finds a negative cycle.
+
+        :param G: the edge-weighted digraph, or a CSREdgeWeightedDigraph
+        :param processes: the number of worker processes for the Dijkstra
+                          searches, as for ParallelDijkstraAllPairsSP
+        :param chunk_size: the number of sources searched per task, as for
+                           ParallelDijkstraAllPairsSP
+
+        """
+        if isinstance(G, CSREdgeWeightedDigraph):
+            csr = G
+        else:
+            csr = CSREdgeWeightedDigraph.from_graph(G)
+        V = csr.V()
+        E = csr.E()
+        self._G = csr
+        self._V = V
+        self._cycle = None
+        self._sp = None
+
+        # the digraph with a virtual source V and an edge of weight 0 from
+        # it to every vertex, after the edges of G
+        offsets, targets, weights = csr.arrays()
+        augmented = CSREdgeWeightedDigraph.from_arrays(
+            V + 1,
+            array("q", offsets) + array("q", [E + V]),
+            array("i", targets) + array("i", range(V)),
+            array("d", weights) + array("d", bytes(8 * V)),
+        )
+        bf = BellmanFordArraySP(augmented, V)
+        if bf.has_negative_cycle():
+            self._cycle = bf.negative_cycle()
+            return
+        h = array("d", (bf.dist_to(v) for v in range(V)))
+        self._h = h
+
+        new_weights = array("d", bytes(8 * E))
+        for v in range(V):
+            for i in range(offsets[v], offsets[v + 1]):
+                # rounding may leave a tight edge just below 0
+                new_weights[i] = max(0.0, weights[i] + h[v] - h[targets[i]])
+        reweighted = CSREdgeWeightedDigraph.from_arrays(
+            V, offsets, targets, new_weights
+        )
+        self._sp = ParallelDijkstraAllPairsSP(reweighted, processes, chunk_size)
+
+    def has_negative_cycle(self):
+        """Is there a negative cycle in the digraph?
+
+        :returns: True if there is a negative cycle, and False otherwise
+
+        """
+        return self._cycle is not None
+
+    def negative_cycle(self):
+        """Returns a negative cycle, or None if there is no such cycle.
+
+        :returns: a negative cycle as an iterable of edges, and None if there
+                  is no such cycle
+
+        """
+        return self._cycle
+
+    def path(self, source, target):
+        """Returns a shortest path from source vertex to the target vertex.
+
+        :param source: the source vertex
+        :param target: the destination vertex
+
+        :returns: a shortest path from the source vertex to the target vertex as an iterable of edges,
+                  and None if no such path
+        :raises UnsupportedOperationException: if there is a negative cycle
+
+        """
+        if not self.has_path(source, target):
+            return None
+        path = Stack()
+        edges = list(self._sp.path(source, target))
+        for e in reversed(edges):
+            v, w = e.from_vertex(), e.to_vertex()
+            # the lightest of the parallel edges v->w, with its own weight
+            path.push(self._G.lightest_edge(v, w))
+        return path
+
+    def has_path(self, source, target):
+        """Is there a path from the source vertex to the target vertex?
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: True if there is a path from the source to the target, and False otherwise
+        :raises UnsupportedOperationException: if there is a negative cycle
+
+        """
+        return self.dist(source, target) < float("inf")
+
+    def dist(self, source, target):
+        """Returns the length of a shortest path from the source vertex to the
+        target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: the length of a shortest path from the source vertex to the target vertex;
+                  float('inf') if no such path
+        :raises UnsupportedOperationException: if there is a negative cycle
+
+        """
+        self._validateVertex(source)
+        self._validateVertex(target)
+        if self.has_negative_cycle():
+            raise UnsupportedOperationException("Negative cost cycle exists")
+        d = self._sp.dist(source, target)
+        if d == float("inf"):
+            return d
+        return d - self._h[source] + self._h[target]
+
+    # throw a ValueError unless 0 <= v < V
+    def _validateVertex(self, v):
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, (V - 1)))
+
+
+if __name__ == "__main__":
+    # Create stream from file or the standard input,
+    # depending on whether a file name was passed.
+    stream = sys.argv[1] if len(sys.argv) > 1 else None
+
+    g = EdgeWeightedDigraph.from_stream(instream.InStream(stream))
+    sp = JohnsonAllPairsSP(g)
+
+    if sp.has_negative_cycle():
+        for e in sp.negative_cycle():
+            print(e)
+    else:
+        # Print the shortest path distances between all possible pairs of vertices.
+        for source in range(g.V()):
+            for target in range(g.V()):
+                print(sp.dist(source, target))
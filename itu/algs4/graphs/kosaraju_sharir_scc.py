@@ -29,9 +29,12 @@ from itu.algs4.errors.errors import IllegalArgumentException
 from itu.algs4.fundamentals.queue import Queue
 from itu.algs4.graphs.depth_first_order import DepthFirstOrder
 from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
 from itu.algs4.graphs.transitive_closure import TransitiveClosure
 from itu.algs4.stdlib.instream import InStream
 
+_CHECK_LIMIT = 1000  # largest digraph that is checked against TransitiveClosure
+
 
 class KosarajuSharirSCC:
 
@@ -54,16 +57,19 @@ class KosarajuSharirSCC:
                 self._dfs(G, v)
                 self._count += 1
 
-        # check that id[] gives strong components
-        assert self._check(G)
+        # check that id[] gives strong components; the check takes time
+        # proportional to V (V + E), so it is only done for small digraphs
+        assert G.V() > _CHECK_LIMIT or self._check(G)
 
     # DFS on graph G
-    def _dfs(self, G, v):
-        self._marked[v] = True
-        self._id[v] = self._count
-        for w in G.adj(v):
-            if not self._marked[w]:
-                self._dfs(G, w)
+    def _dfs(self, G, s):
+        id_ = self._id
+        count = self._count
+
+        def pre(v):
+            id_[v] = count
+
+        iterative_dfs(G, s, self._marked, pre=pre)
 
     """
      * Returns the number of strong components.
@@ -0,0 +1,141 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements Kruskal's algorithm on flat arrays of edges.
+
+Instead of one MinPQ entry per Edge object, the endpoints and weights of the
+edges are kept in three parallel typed arrays. The edge indices are sorted
+once by weight, and the edges are then passed in that order, a batch at a
+time, to UF.union_many on typed arrays, until V - 1 edges have been
+accepted.
+
+"""
+
+import sys
+from array import array
+from itertools import compress
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.queue import Queue
+from itu.algs4.fundamentals.uf import UF
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.stdlib.instream import InStream
+
+_BATCH_SIZE = 1 << 16  # number of sorted edges passed to union_many at once
+
+
+class KruskalArrayMST:
+    """The KruskalArrayMST class represents a data type for computing a
+    minimum spanning tree in an edge-weighted graph, with the same API as
+    KruskalMST.
+
+    The edge weights can be positive, zero, or negative and need not be
+    distinct. If the graph is not connected, it computes a minimum spanning
+    forest, which is the union of minimum spanning trees in each connected
+    component. This implementation sorts the edge indices by weight once and
+    filters them in batches with UF.union_many, on integer arrays; it stops
+    as soon as V - 1 edges are accepted. The constructor takes time
+    proportional to E log E and extra space proportional to E, where V is the
+    number of vertices and E is the number of edges. Afterwards, the weight
+    method takes constant time and the edges method takes time proportional
+    to V.
+
+    """
+
+    def __init__(self, G):
+        """Computes a minimum spanning tree (or forest) of an edge-weighted
+        graph.
+
+        :param G: the edge-weighted graph
+
+        """
+        either = array("i")
+        other = array("i")
+        weights = array("d")
+        for e in G.edges():
+            v = e.either()
+            either.append(v)
+            other.append(e.other(v))
+            weights.append(e.weight())
+        self._kruskal(G.V(), either, other, weights)
+
+    @staticmethod
+    def from_arrays(V, either, other, weights):
+        """Computes a minimum spanning tree (or forest) of the edge-weighted
+        graph with V vertices whose i-th edge joins either[i] and other[i]
+        and has weight weights[i], without creating an object per edge.
+
+        :param V: the number of vertices
+        :param either: the first endpoint of each edge
+        :param other: the second endpoint of each edge
+        :param weights: the weight of each edge
+        :return: a minimum spanning tree (or forest) of the graph
+        :rtype: KruskalArrayMST
+        :raises IllegalArgumentException: if the three sequences differ in length
+        :raises IllegalArgumentException: unless every endpoint is between 0 and V-1
+
+        """
+        if not len(either) == len(other) == len(weights):
+            raise IllegalArgumentException("edge arrays differ in length")
+        for endpoints in (either, other):
+            if len(endpoints) > 0 and (min(endpoints) < 0 or max(endpoints) >= V):
+                raise IllegalArgumentException(
+                    "endpoint is not between 0 and {}".format(V - 1)
+                )
+        mst = KruskalArrayMST.__new__(KruskalArrayMST)
+        mst._kruskal(V, either, other, weights)
+        return mst
+
+    def _kruskal(self, V, either, other, weights):
+        self._weight = 0
+        self._mst = Queue()
+        if V == 0:
+            return
+        uf = UF(V, "i")
+        order = sorted(range(len(weights)), key=weights.__getitem__)
+        # feed the edges to union-find in sorted batches, until one component
+        for lo in range(0, len(order), _BATCH_SIZE):
+            batch = order[lo : lo + _BATCH_SIZE]
+            ps = array("i", [either[i] for i in batch])
+            qs = array("i", [other[i] for i in batch])
+            for i in compress(batch, uf.union_many(ps, qs, stop_at=1)):
+                self._mst.enqueue(Edge(either[i], other[i], weights[i]))
+                self._weight += weights[i]
+            if uf.count() == 1:
+                break
+
+    def edges(self):
+        """Returns the edges in a minimum spanning tree (or forest).
+
+        :return: the edges in a minimum spanning tree (or forest)
+
+        """
+        return self._mst
+
+    def weight(self):
+        """Returns the sum of the edge weights in a minimum spanning tree (or
+        forest).
+
+        :return: the sum of the edge weights in a minimum spanning tree (or forest)
+
+        """
+        return self._weight
+
+
+def main():
+    """Creates an edge-weighted graph from an input file, runs Kruskal's
+    algorithm on it, and prints the edges of the MST and the sum of the edge
+    weights."""
+    if len(sys.argv) > 1:
+        stream = InStream(sys.argv[1])
+        G = EdgeWeightedGraph.from_stream(stream)
+        mst = KruskalArrayMST(G)
+        for e in mst.edges():
+            print(e)
+        print("{:.5f}".format(mst.weight()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a distance oracle for the number of edges on a
+shortest path between two vertices of an undirected graph, based on
+landmarks.
+
+The oracle stores the breadth-first distances from k landmark vertices to
+every vertex. By the triangle inequality, for every landmark l the distance
+between v and w is at least |d(l, v) - d(l, w)| and at most
+d(l, v) + d(l, w), so the stored rows give bounds on any distance in time
+proportional to k. When the bounds differ, a bidirectional breadth-first
+search finds the exact distance. It expands the smaller of its two frontiers
+a level at a time, stops as soon as the levels reached on both sides cannot
+beat the best path found, and does not expand a vertex whose depth plus the
+landmark lower bound towards the other end reaches that best path. The rows
+can be saved to a binary file, which later runs memory-map.
+
+"""
+
+import math
+import mmap
+import struct
+from array import array
+
+from itu.algs4.fundamentals.queue import Queue
+from itu.algs4.graphs.direction_optimizing_bfs import DirectionOptimizingBFS
+
+_MAGIC = b"ALGS4LDO"
+_VERSION = 1
+_BYTE_ORDER_MARK = 0x01020304
+_HEADER = struct.Struct("=8sIIqq")  # magic, version, byte order mark, V, k
+
+
+class LandmarkDistanceOracle:
+    """The LandmarkDistanceOracle class represents an index over an
+    undirected graph that answers queries for the number of edges on a
+    shortest path between any two vertices, and for such a path.
+
+    This implementation runs a DirectionOptimizingBFS from each of k
+    landmarks, by default the k vertices of largest degree, and stores the
+    distances in one flat int array of k V entries. The constructor takes
+    time proportional to k (V + E). The lower_bound() and upper_bound()
+    methods take time proportional to k. The dist() method returns at once
+    when the bounds meet and otherwise runs a pruned bidirectional
+    breadth-first search, which on graphs with a small diameter examines a
+    small part of the graph; path() always runs that search.
+
+    """
+
+    def __init__(self, G, k=16, landmarks=None):
+        """Builds the oracle for the graph G.
+
+        :param G: the graph, or a CSRGraph
+        :param k: the number of landmarks, if they are not given
+        :param landmarks: the landmark vertices; by default, the k vertices
+                          of largest degree
+        :raises ValueError: unless 0 <= l < V for each landmark l
+
+        """
+        V = G.V()
+        if landmarks is None:
+            by_degree = sorted(range(V), key=G.degree, reverse=True)
+            landmarks = by_degree[:k]
+        self._G = G
+        self._V = V
+        self._landmarks = array("i", landmarks)
+        for v in self._landmarks:
+            self._validateVertex(v)
+        self._dist = array("i")  # dist[i V + v] = distance from landmark i to v
+        for s in self._landmarks:
+            bfs = DirectionOptimizingBFS(G, s)
+            self._dist.extend(bfs.distances())
+        self._map = None  # memory map backing the distances, if loaded
+
+    @staticmethod
+    def load(filename, G):
+        """Memory-maps an oracle for the graph G from a file written by save.
+        The file stays mapped for the lifetime of the returned oracle.
+
+        :param filename: the name of the oracle file
+        :param G: the graph the oracle was built for
+        :return: the oracle stored in the file
+        :rtype: LandmarkDistanceOracle
+        :raises ValueError: if the file is not an oracle file written on a
+                            machine with the same byte order, or was built for
+                            a graph with another number of vertices
+
+        """
+        with open(filename, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(mm) < _HEADER.size:
+                raise ValueError("{} is not a distance oracle file".format(filename))
+            magic, version, mark, V, k = _HEADER.unpack_from(mm, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("{} is not a distance oracle file".format(filename))
+            if mark != _BYTE_ORDER_MARK:
+                raise ValueError(
+                    "{} was written with another byte order".format(filename)
+                )
+            if V != G.V():
+                raise ValueError("{} was built for another graph".format(filename))
+
+            start = _HEADER.size
+            end_landmarks = start + 4 * k
+            end_dist = end_landmarks + 4 * k * V
+            if len(mm) < end_dist:
+                raise ValueError("{} is truncated".format(filename))
+        except ValueError:
+            mm.close()
+            raise
+
+        view = memoryview(mm)
+        oracle = LandmarkDistanceOracle.__new__(LandmarkDistanceOracle)
+        oracle._G = G
+        oracle._V = V
+        oracle._landmarks = view[start:end_landmarks].cast("i")
+        oracle._dist = view[end_landmarks:end_dist].cast("i")
+        oracle._map = mm
+        return oracle
+
+    def save(self, filename):
+        """Writes the landmark distances to a file that can be memory-mapped
+        with load.
+
+        :param filename: the name of the file to write
+
+        """
+        k = len(self._landmarks)
+        with open(filename, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, _BYTE_ORDER_MARK, self._V, k))
+            f.write(self._landmarks)
+            f.write(self._dist)
+
+    def landmarks(self):
+        """Returns the landmark vertices.
+
+        :returns: the landmark vertices, as an iterable
+
+        """
+        return list(self._landmarks)
+
+    def lower_bound(self, v, w):
+        """Returns a lower bound on the number of edges on a shortest path
+        between v and w.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: a lower bound on the distance between v and w; math.inf if
+                  some landmark shows that there is no path
+        :raises ValueError: unless 0 <= v < V and 0 <= w < V
+
+        """
+        self._validateVertex(v)
+        self._validateVertex(w)
+        return self._lower_bound(v, self._row(w))
+
+    def upper_bound(self, v, w):
+        """Returns an upper bound on the number of edges on a shortest path
+        between v and w, through the best landmark.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: an upper bound on the distance between v and w; math.inf if
+                  no landmark reaches both
+        :raises ValueError: unless 0 <= v < V and 0 <= w < V
+
+        """
+        self._validateVertex(v)
+        self._validateVertex(w)
+        if v == w:
+            return 0
+        best = math.inf
+        for a, b in zip(self._row(v), self._row(w)):
+            if a != -1 and b != -1 and a + b < best:
+                best = a + b
+        return best
+
+    def dist(self, v, w):
+        """Returns the number of edges on a shortest path between v and w.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: the distance between v and w, and math.inf if there is no path
+        :raises ValueError: unless 0 <= v < V and 0 <= w < V
+
+        """
+        lower = self.lower_bound(v, w)
+        upper = self.upper_bound(v, w)
+        if lower == upper:
+            return lower
+        found = self._search(v, w, upper)
+        return upper if found is None else found[0]
+
+    def has_path(self, v, w):
+        """Is there a path between v and w?
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: True if there is a path between v and w, and False otherwise
+        :raises ValueError: unless 0 <= v < V and 0 <= w < V
+
+        """
+        return self.dist(v, w) < math.inf
+
+    def path(self, v, w):
+        """Returns a shortest path between v and w, or None if no such path.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: the sequence of vertices on a shortest path from v to w, as
+                  an Iterable
+        :raises ValueError: unless 0 <= v < V and 0 <= w < V
+
+        """
+        if self.lower_bound(v, w) == math.inf:
+            return None
+        found = self._search(v, w, self.upper_bound(v, w) + 1)
+        if found is None:
+            return None
+        _, forward, backward, y = found
+        half = []
+        x = y
+        while x != v:
+            half.append(x)
+            x = forward[x]
+        half.append(v)
+        path = Queue()
+        for x in reversed(half):
+            path.enqueue(x)
+        while y != w:
+            y = backward[y]
+            path.enqueue(y)
+        return path
+
+    def _row(self, v):
+        # the distances from each landmark to v
+        return self._dist[v :: self._V]
+
+    def _lower_bound(self, v, row):
+        # the landmark lower bound on the distance between v and the vertex
+        # whose landmark distances are row
+        dist, V = self._dist, self._V
+        best = 0
+        i = v
+        for b in row:
+            a = dist[i]
+            i += V
+            if (a == -1) != (b == -1):
+                return math.inf
+            if a - b > best:
+                best = a - b
+            elif b - a > best:
+                best = b - a
+        return best
+
+    def _search(self, v, w, best):
+        # bidirectional breadth-first search for a path between v and w
+        # shorter than best; returns its length, the parent dicts of both
+        # sides and the vertex where they meet, or None if there is none
+        if v == w:
+            return (0, {v: v}, {w: w}, v) if best > 0 else None
+        G = self._G
+        sides = [
+            ({v: v}, {v: 0}, [v], self._row(w)),  # parents, depths, frontier
+            ({w: w}, {w: 0}, [w], self._row(v)),
+        ]
+        depth = [0, 0]
+        meeting = None
+        while sides[0][2] and sides[1][2] and depth[0] + depth[1] + 1 < best:
+            i = 0 if len(sides[0][2]) <= len(sides[1][2]) else 1
+            parents, depths, frontier, target = sides[i]
+            other = sides[1 - i][1]
+            level = depth[i] + 1
+            following = []
+            for x in frontier:
+                for y in G.adj(x):
+                    if y in depths:
+                        continue
+                    parents[y] = x
+                    depths[y] = level
+                    if y in other and level + other[y] < best:
+                        best = level + other[y]
+                        meeting = y
+                    # a vertex that cannot lie on a shorter path is not expanded
+                    if level + self._lower_bound(y, target) < best:
+                        following.append(y)
+            sides[i] = (parents, depths, following, target)
+            depth[i] = level
+        if meeting is None:
+            return None
+        # the meeting vertex has a parent on both sides
+        return best, sides[0][0], sides[1][0], meeting
+
+    def _validateVertex(self, v):
+        # throw a ValueError unless 0 <= v < V
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
+
+
+if __name__ == "__main__":
+    import sys
+
+    from itu.algs4.graphs.symbol_graph import SymbolGraph
+    from itu.algs4.stdlib import stdio
+
+    # reads a social network as for DegreesOfSeparation, and then pairs of
+    # individuals from standard input, one per line, separated by the
+    # delimiter, and prints a shortest chain between them
+    filename = sys.argv[1]
+    delimiter = sys.argv[2]
+    sg = SymbolGraph(filename, delimiter)
+    oracle = LandmarkDistanceOracle(sg.graph())
+    while not stdio.isEmpty():
+        names = stdio.readLine().split(delimiter)
+        if len(names) != 2 or not all(sg.contains(name) for name in names):
+            stdio.writeln("\tNot in database.")
+            continue
+        v, w = (sg.index_of(name) for name in names)
+        path = oracle.path(v, w)
+        if path is None:
+            stdio.writeln("\tNot connected")
+        else:
+            for x in path:
+                stdio.writef("\t%s\n", sg.name_of(x))
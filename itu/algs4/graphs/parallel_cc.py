@@ -0,0 +1,233 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements connected components of an undirected graph with
+the edge list split across a pool of worker processes.
+
+Each worker runs union-find on a chunk of the edges and returns the edges
+that merged two of its components, which form a spanning forest of its chunk
+with at most V - 1 edges. Two vertices are connected in the graph if and
+only if they are connected in the union of these forests, so one more
+union-find over the forests gives the components. They are then numbered
+from 0 in the order of their smallest vertex, which is the numbering of CC.
+
+"""
+
+import multiprocessing
+import os
+import sys
+from array import array
+from itertools import compress
+
+from itu.algs4.fundamentals.uf import UF
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.stdlib.instream import InStream
+
+_PARALLEL_CUTOFF = 1 << 15  # fewest edges for which the chunks use the pool
+
+_V = 0  # the number of vertices in the worker process
+_tails = None  # the endpoints of the edges in the worker process
+_heads = None
+
+
+def _load(V, tails, heads):
+    # initializer of the worker processes
+    global _V, _tails, _heads
+    _V = V
+    _tails = array("i")
+    _tails.frombytes(tails)
+    _heads = array("i")
+    _heads.frombytes(heads)
+
+
+def _spanning_forest(V, tails, heads):
+    # returns the endpoints of the edges of a spanning forest of the edges
+    uf = UF(V, "i")
+    merged = uf.union_many(tails, heads)
+    return array("i", compress(tails, merged)), array("i", compress(heads, merged))
+
+
+def _run_chunk(chunk):
+    # finds a spanning forest of a chunk of the edges in the worker
+    lo, hi = chunk
+    tails, heads = _spanning_forest(_V, _tails[lo:hi], _heads[lo:hi])
+    return tails.tobytes(), heads.tobytes()
+
+
+class ParallelCC:
+    """The ParallelCC class represents a data type for determining the
+    connected components in an undirected graph, with the same API as CC and
+    the same component identifiers: the components are numbered from 0 in
+    the order of their smallest vertex.
+
+    This implementation splits the edges into chunks and finds a spanning
+    forest of each chunk with union-find in a pool of worker processes, then
+    merges the forests with union-find in this process. A graph with fewer
+    than cutoff edges, for which the pool costs more than the union-find work
+    itself, is handled in this process. The constructor takes
+    time proportional to V + E, with the E alpha(V) of the union-find work on
+    the chunks divided by the number of processes, plus V alpha(V) per chunk
+    to merge the forests. Afterwards, the id, count, connected and size
+    operations take constant time.
+
+    """
+
+    def __init__(self, G, processes=None, chunk_size=None, cutoff=None):
+        """Computes the connected components of the undirected graph G.
+
+        :param G: the undirected graph, or a CSRGraph
+        :param processes: the number of worker processes; defaults to the
+                          number of CPUs, and 1 does all the work in this process
+        :param chunk_size: the number of edges per chunk; by default, each
+                           process gets about four chunks
+        :param cutoff: the fewest edges for which the chunks are split over
+                       the worker processes; a graph with fewer edges is
+                       handled without starting any
+
+        """
+        tails = array("i")
+        heads = array("i")
+        for v in range(G.V()):
+            for w in G.adj(v):
+                if w > v:  # each edge once; self-loops do not matter
+                    tails.append(v)
+                    heads.append(w)
+        self._components(G.V(), tails, heads, processes, chunk_size, cutoff)
+
+    @staticmethod
+    def from_arrays(V, tails, heads, processes=None, chunk_size=None, cutoff=None):
+        """Computes the connected components of the undirected graph with V
+        vertices and the edges tails[i]-heads[i], without building a Graph.
+
+        :param V: the number of vertices
+        :param tails: one endpoint of each edge
+        :param heads: the other endpoint of each edge
+        :param processes: the number of worker processes; defaults to the
+                          number of CPUs, and 1 does all the work in this process
+        :param chunk_size: the number of edges per chunk; by default, each
+                           process gets about four chunks
+        :param cutoff: the fewest edges for which the chunks are split over
+                       the worker processes; a graph with fewer edges is
+                       handled without starting any
+        :return: the connected components of the graph
+        :rtype: ParallelCC
+        :raises ValueError: if tails and heads have different lengths, or an
+                            endpoint is not between 0 and V - 1
+
+        """
+        if len(tails) != len(heads):
+            raise ValueError("tails and heads must have the same length")
+        tails = array("i", tails)
+        heads = array("i", heads)
+        for endpoints in (tails, heads):
+            if endpoints and (min(endpoints) < 0 or max(endpoints) >= V):
+                raise ValueError("endpoints must be between 0 and {}".format(V - 1))
+        cc = ParallelCC.__new__(ParallelCC)
+        cc._components(V, tails, heads, processes, chunk_size, cutoff)
+        return cc
+
+    def _components(self, V, tails, heads, processes, chunk_size, cutoff):
+        E = len(tails)
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, -(-E // (4 * processes)))
+
+        chunks = [(lo, min(lo + chunk_size, E)) for lo in range(0, E, chunk_size)]
+        if cutoff is None:
+            cutoff = _PARALLEL_CUTOFF
+        if processes == 1 or len(chunks) <= 1 or E < cutoff:
+            uf = UF(V, "i")
+            uf.union_many(tails, heads)
+        else:
+            initargs = (V, tails.tobytes(), heads.tobytes())
+            with multiprocessing.Pool(processes, _load, initargs) as pool:
+                forests = pool.map(_run_chunk, chunks)
+            uf = UF(V, "i")
+            for forest_tails, forest_heads in forests:
+                uf.union_many(array("i", forest_tails), array("i", forest_heads))
+
+        # number the components in the order of their smallest vertex
+        self._id = array("i", bytes(4 * V))  # id[v] = id of component containing v
+        self._size = array("i")  # size[id] = number of vertices in given component
+        label = {}
+        for v, root in enumerate(uf.find_many(range(V))):
+            c = label.get(root)
+            if c is None:
+                c = label[root] = len(self._size)
+                self._size.append(0)
+            self._id[v] = c
+            self._size[c] += 1
+        self._count = len(self._size)  # number of connected components
+
+    def id(self, v):
+        """Returns the component id of the connected component containing
+        vertex v.
+
+        :param v: the vertex
+        :returns: the component id of the connected component containing vertex v
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._id[v]
+
+    def size(self, v):
+        """Returns the number of vertices in the connected component containing
+        vertex v.
+
+        :param v: the vertex
+        :returns: the number of vertices in the connected component containing vertex v
+        :raises ValueError: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._size[self._id[v]]
+
+    def count(self):
+        """Returns the number of connected components.
+
+        :returns: the number of connected components
+
+        """
+        return self._count
+
+    def connected(self, v, w):
+        """Returns true if vertices v and w are in the same connected
+        component.
+
+        :param v: one vertex
+        :param w: the other vertex
+        :returns: True if vertices v and w are in the same connected component;
+                    False otherwise
+        :raises ValueError: unless 0 <= v < V
+        :raises ValueError: unless 0 <= w < V
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        return self._id[v] == self._id[w]
+
+    def _validate_vertex(self, v):
+        # Raises a ValueError unless 0 <= v < V
+        V = len(self._id)
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, V - 1))
+
+
+def main(args):
+    # prints the number of components and the vertices of each, as for CC
+    G = Graph.from_stream(InStream(args[0]))
+    cc = ParallelCC(G)
+    m = cc.count()
+    print("{} components".format(m))
+    components = [[] for _ in range(m)]
+    for v in range(G.V()):
+        components[cc.id(v)].append(v)
+    for component in components:
+        print(" ".join(str(v) for v in component))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,214 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a data type for solving the all-pairs shortest paths
+problem in edge-weighted digraphs where the edge weights are nonnegative, by
+running Dijkstra's algorithm from every vertex in a pool of worker processes.
+
+The digraph is written once to a binary CSR file (see CSREdgeWeightedDigraph),
+which every worker memory-maps, so all processes share one read-only copy of
+it through the page cache. Each worker runs the searches for a chunk of
+sources and sends back only the rows of the distance and predecessor
+matrices, as bytes.
+
+"""
+
+import heapq
+import multiprocessing
+import os
+import sys
+import tempfile
+from array import array
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.stack import Stack
+from itu.algs4.graphs.csr_edge_weighted_digraph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.stdlib import instream
+
+_graph = None  # the digraph of the worker process, set by _load
+
+
+def _load(filename):
+    # initializer of the worker processes
+    global _graph
+    _graph = CSREdgeWeightedDigraph.load(filename)
+
+
+def _dijkstra(G, s, dist, pred):
+    # runs Dijkstra's algorithm from s on the CSR arrays of G and fills in the
+    # rows dist and pred (float64 and int32 arrays of length V, initialized
+    # to infinity and -1); uses heapq with lazy deletion, so the rows are the
+    # only per-source arrays
+    offsets, targets, weights = G.arrays()
+    dist[s] = 0.0
+    heap = [(0.0, s)]
+    while heap:
+        d, v = heapq.heappop(heap)
+        if d > dist[v]:
+            continue
+        for i in range(offsets[v], offsets[v + 1]):
+            w = targets[i]
+            nd = d + weights[i]
+            if nd < dist[w]:
+                dist[w] = nd
+                pred[w] = v
+                heapq.heappush(heap, (nd, w))
+
+
+def _run_sources(sources):
+    # runs the searches for the range of sources in the worker and returns
+    # its first source with the rows of both matrices
+    V = _graph.V()
+    dist = array("d", [float("inf")]) * (V * len(sources))
+    pred = array("i", [-1]) * (V * len(sources))
+    for k, s in enumerate(sources):
+        row_dist = array("d", [float("inf")]) * V
+        row_pred = array("i", [-1]) * V
+        _dijkstra(_graph, s, row_dist, row_pred)
+        dist[k * V : (k + 1) * V] = row_dist
+        pred[k * V : (k + 1) * V] = row_pred
+    return sources.start, dist.tobytes(), pred.tobytes()
+
+
+class ParallelDijkstraAllPairsSP:
+    """The ParallelDijkstraAllPairsSP class represents a data type for solving
+    the all-pairs shortest paths problem in edge-weighted digraphs where the
+    edge weights are nonnegative.
+
+    This implementation runs Dijkstra's algorithm from each vertex, like
+    DijkstraAllPairsSP, but splits the sources into chunks that a pool of
+    worker processes searches in parallel. The results are kept in two flat
+    V-by-V matrices: the distances as float64 and the predecessor of each
+    vertex on a shortest path as int32, instead of V DijkstraSP objects.
+    The constructor takes time proportional to V (E log V) divided by the
+    number of processes, and uses space proportional to V^2 (12 bytes per
+    pair of vertices). Afterwards, the dist() and has_path() methods take
+    constant time and the path() method takes time proportional to the
+    number of edges in the shortest path returned.
+
+    """
+
+    def __init__(self, G, processes=None, chunk_size=None):
+        """Computes a shortest paths tree from each vertex to every other
+        vertex in the edge-weighted digraph G.
+
+        :param G: the edge-weighted digraph, or a CSREdgeWeightedDigraph
+        :param processes: the number of worker processes; defaults to the
+                          number of CPUs, and 1 runs all searches in this process
+        :param chunk_size: the number of sources searched per task; by default,
+                           each process gets about four tasks
+        :raises IllegalArgumentException: if an edge weight is negative
+
+        """
+        if isinstance(G, CSREdgeWeightedDigraph):
+            csr = G
+        else:
+            csr = CSREdgeWeightedDigraph.from_graph(G)
+        for weight in csr.arrays()[2]:
+            if weight < 0:
+                raise IllegalArgumentException("edge with negative weight")
+        V = csr.V()
+        if processes is None:
+            processes = os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, -(-V // (4 * processes)))
+        self._G = csr
+        self._V = V
+        self._dist = array("d", [float("inf")]) * (V * V)
+        self._pred = array("i", [-1]) * (V * V)
+
+        chunks = [range(s, min(s + chunk_size, V)) for s in range(0, V, chunk_size)]
+        if processes == 1 or len(chunks) <= 1:
+            for s in range(V):
+                dist = array("d", [float("inf")]) * V
+                pred = array("i", [-1]) * V
+                _dijkstra(csr, s, dist, pred)
+                self._dist[s * V : (s + 1) * V] = dist
+                self._pred[s * V : (s + 1) * V] = pred
+            return
+
+        fd, filename = tempfile.mkstemp(suffix=".bin")
+        os.close(fd)
+        try:
+            csr.save(filename)
+            with multiprocessing.Pool(processes, _load, (filename,)) as pool:
+                for start, dist, pred in pool.imap_unordered(_run_sources, chunks):
+                    rows = array("d")
+                    rows.frombytes(dist)
+                    self._dist[start * V : start * V + len(rows)] = rows
+                    rows = array("i")
+                    rows.frombytes(pred)
+                    self._pred[start * V : start * V + len(rows)] = rows
+        finally:
+            os.remove(filename)
+
+    def path(self, source, target):
+        """Returns a shortest path from source vertex to the target vertex.
+
+        :param source: the source vertex
+        :param target: the destination vertex
+
+        :returns: a shortest path from the source vertex to the target vertex as an iterable of edges,
+                  and None if no such path
+
+        """
+        if not self.has_path(source, target):
+            return None
+        row = source * self._V
+        path = Stack()
+        w = target
+        while w != source:
+            v = self._pred[row + w]
+            # the lightest of the parallel edges v->w is on the shortest path
+            path.push(self._G.lightest_edge(v, w))
+            w = v
+        return path
+
+    def has_path(self, source, target):
+        """Is there a path from the source vertex to the target vertex?
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: True if there is a path from the source to the target, and False otherwise
+
+        """
+        return self.dist(source, target) < float("inf")
+
+    def dist(self, source, target):
+        """Returns the length of a shortest path from the source vertex to the
+        target vertex.
+
+        :param source: the source vertex
+        :param target: the target vertex
+
+        :returns: the length of a shortest path from the source vertex to the target vertex;
+                  float('inf') if no such path
+
+        """
+        self._validateVertex(source)
+        self._validateVertex(target)
+
+        return self._dist[source * self._V + target]
+
+    # throw a ValueError unless 0 <= v < V
+    def _validateVertex(self, v):
+        V = self._V
+        if v < 0 or v >= V:
+            raise ValueError("vertex {} is not between 0 and {}".format(v, (V - 1)))
+
+
+if __name__ == "__main__":
+    # Create stream from file or the standard input,
+    # depending on whether a file name was passed.
+    stream = sys.argv[1] if len(sys.argv) > 1 else None
+
+    g = EdgeWeightedDigraph.from_stream(instream.InStream(stream))
+    sp = ParallelDijkstraAllPairsSP(g)
+
+    # Print the shortest path distances between all possible pairs of vertices.
+    for source in range(g.V()):
+        for target in range(g.V()):
+            print(sp.dist(source, target))
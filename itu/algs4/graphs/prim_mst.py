@@ -6,7 +6,7 @@ import sys
 
 from itu.algs4.fundamentals.queue import Queue
 from itu.algs4.fundamentals.uf import UF
-from itu.algs4.sorting.index_min_pq import IndexMinPQ
+from itu.algs4.sorting.index_multiway_min_pq import IndexMultiwayMinPQ
 
 
 class PrimMST:
@@ -17,12 +17,12 @@ class PrimMST:
     spanning trees in each connected component. The weight() method returns the
     weight of a minimum spanning tree and the edges() method returns its edges.
 
-    This implementation uses Prim's algorithm with an indexed binary
-    heap. The constructor takes time proportional to E log V and extra
-    space not including the graph) proportional to V, where V is the
-    number of vertices and E is the number of edges. Afterwards, the
-    weight() method takes constant time and the edges() method takes
-    time proportional to V.
+    This implementation uses Prim's algorithm with an indexed 4-way
+    heap of float keys (IndexMultiwayMinPQ). The constructor takes time
+    proportional to E log V and extra space (not including the graph)
+    proportional to V, where V is the number of vertices and E is the
+    number of edges. Afterwards, the weight() method takes constant time
+    and the edges() method takes time proportional to V.
 
     """
 
@@ -42,7 +42,7 @@ class PrimMST:
         self._marked = [
             False
         ] * G.V()  # self._marked[v] = True if v on tree, False otherwise
-        self._pq = IndexMinPQ(G.V())
+        self._pq = IndexMultiwayMinPQ(G.V())
 
         for v in range(G.V()):
             self._dist_to[v] = math.inf
@@ -63,19 +63,26 @@ class PrimMST:
             self._scan(G, v)
 
     def _scan(self, G, v):
-        # scan vertex v
+        # scan vertex v, then update the pq once for all vertices whose
+        # distance decreased
         self._marked[v] = True
+        marked = self._marked
+        dist_to = self._dist_to
+        queued = {}  # vertex -> whether it was on the pq before
         for e in G.adj(v):
             w = e.other(v)
-            if self._marked[w]:
+            if marked[w]:
                 continue  # v-w is obsolete edge
-            if e.weight() < self._dist_to[w]:
-                self._dist_to[w] = e.weight()
+            if e.weight() < dist_to[w]:
+                if w not in queued:
+                    queued[w] = dist_to[w] < math.inf
+                dist_to[w] = e.weight()
                 self._edge_to[w] = e
-                if self._pq.contains(w):
-                    self._pq.decrease_key(w, self._dist_to[w])
-                else:
-                    self._pq.insert(w, self._dist_to[w])
+        if queued:
+            decreased = [w for w in queued if queued[w]]
+            inserted = [w for w in queued if not queued[w]]
+            self._pq.decrease_many(decreased, [dist_to[w] for w in decreased])
+            self._pq.insert_many(inserted, [dist_to[w] for w in inserted])
 
     def edges(self):
         """Returns the edges in a minimum spanning tree (or forest).
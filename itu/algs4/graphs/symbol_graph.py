@@ -2,10 +2,8 @@
 # see README.md for details
 # This is python3
 
-from itu.algs4.graphs.graph import Graph
-from itu.algs4.searching.binary_search_st import BinarySearchST
+from itu.algs4.graphs.symbol_graph_builder import SymbolGraphBuilder
 from itu.algs4.stdlib import stdio
-from itu.algs4.stdlib.instream import InStream
 
 
 class SymbolGraph:
@@ -17,12 +15,11 @@ class SymbolGraph:
     between 0 and V - 1.
     It also supports initializing a symbol graph from a file.
 
-    This implementation uses an ST to map from strings to integers,
-    an array to map from integers to strings, and a Graph to store
-    the underlying graph.
-    The index_of and contains operations take time
-    proportional to log V, where V is the number of vertices.
-    The name_of operation takes constant time.
+    This implementation reads the file once with a SymbolGraphBuilder, which
+    uses a dict to map from strings to integers, a list to map from integers
+    to strings, and a Graph to store the underlying graph.
+    The index_of, contains and name_of operations take constant expected
+    time.
 
     """
 
@@ -36,34 +33,28 @@ class SymbolGraph:
         :param delimiter: the delimiter between fields
 
         """
-        self._st = BinarySearchST()  # string -> index
-
-        # First pass builds the index by reading strings to associate
-        # distinct strings with an index
-        stream = InStream(filename)
-        while not stream.isEmpty():
-            a = stream.readLine().split(delimiter)
-            for i in range(len(a)):
-                if not self._st.contains(a[i]):
-                    self._st.put(a[i], self._st.size())
+        builder = SymbolGraphBuilder(directed=False).read(filename, delimiter)
 
         stdio.writef("Done reading %s\n", filename)
 
-        # inverted index to get keys in an array
-        self._keys = [None] * self._st.size()  # index  -> string
-        for name in self._st.keys():
-            self._keys[self._st.get(name)] = name
-
-        # second pass builds the graph by connecting first vertex on each
-        # line to all others
-        self._graph = Graph(self._st.size())  # the underlying graph
-        stream = InStream(filename)
-        while stream.hasNextLine():
-            a = stream.readLine().split(delimiter)
-            v = self._st.get(a[0])
-            for i in range(1, len(a)):
-                w = self._st.get(a[i])
-                self._graph.add_edge(v, w)
+        self._st = builder.index()  # string -> index
+        self._keys = builder.names()  # index  -> string
+        self._graph = builder.graph()  # the underlying graph
+
+    @staticmethod
+    def from_builder(builder):
+        """Initializes a symbol graph from the names and edges collected by a
+        SymbolGraphBuilder, such as one loaded from a binary symbol graph file.
+
+        :param builder: the SymbolGraphBuilder
+        :returns: the symbol graph
+
+        """
+        sg = SymbolGraph.__new__(SymbolGraph)
+        sg._st = builder.index()
+        sg._keys = builder.names()
+        sg._graph = builder.graph()
+        return sg
 
     def contains(self, s):
         """Does the graph contain the vertex named s?
@@ -72,7 +63,7 @@ class SymbolGraph:
         :return:s true if s is the name of a vertex, and false otherwise
 
         """
-        return self._st.contains(s)
+        return s in self._st
 
     def index_of(self, s):
         """Returns the integer associated with the vertex named s.
@@ -0,0 +1,230 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements a builder for symbol graphs and symbol digraphs,
+which reads the input once and can store its result in a binary file.
+
+Each vertex name gets the next integer the first time it is seen, through a
+dict, and each edge is buffered as a pair of integers in two typed arrays
+until the graph is built, so the input is never read twice. A binary symbol
+graph file consists of a 48-byte header, the vertex names encoded in UTF-8
+and separated by newlines, padding up to the next multiple of 4 bytes, and
+the E tails and E heads of the edges (int32), in the byte order of the
+machine that wrote the file.
+
+"""
+
+import struct
+from array import array
+
+from itu.algs4.graphs.csr_graph import CSRDigraph, CSRGraph
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.stdlib.instream import InStream
+
+_MAGIC = b"ALGS4SYM"
+_VERSION = 1
+_BYTE_ORDER_MARK = 0x01020304
+# magic, version, byte order mark, directed, V, E, length of the names
+_HEADER = struct.Struct("=8sIIqqqq")
+
+
+class SymbolGraphBuilder:
+    """The SymbolGraphBuilder class collects the named vertices and the edges
+    of a symbol graph or symbol digraph, and builds the underlying Graph,
+    Digraph or CSR form from them, which SymbolGraph and SymbolDigraph wrap.
+
+    This implementation maps names to integers with a dict and buffers the
+    edges in integer arrays. Adding a vertex or an edge takes constant
+    expected time, so reading a file takes time proportional to its length;
+    building a graph takes time proportional to V + E. Saving and loading
+    take time proportional to the size of the file, with no Python-level
+    work per edge.
+
+    """
+
+    def __init__(self, directed=False):
+        """Initializes an empty builder.
+
+        :param directed: True to build a digraph, False for an undirected graph
+
+        """
+        self._directed = directed
+        self._index = {}  # name -> index
+        self._names = []  # index -> name
+        self._tails = array("i")
+        self._heads = array("i")
+
+    def read(self, filename, delimiter):
+        """Adds the vertices and edges of a file in one pass. Each line in the
+        file contains the name of a vertex, followed by a list of the names of
+        the vertices adjacent to that vertex, separated by the delimiter. As in
+        SymbolGraph, a blank line adds a vertex whose name is the empty string.
+
+        :param filename: the name of the file
+        :param delimiter: the delimiter between fields
+        :return: this builder
+
+        """
+        stream = InStream(filename)
+        while stream.hasNextLine():
+            a = stream.readLine().split(delimiter)
+            v = self.add_vertex(a[0])
+            for name in a[1:]:
+                self._tails.append(v)
+                self._heads.append(self.add_vertex(name))
+        return self
+
+    def add_vertex(self, name):
+        """Adds the vertex named name, unless there already is one.
+
+        :param name: the name of the vertex
+        :return: the integer associated with the vertex named name
+
+        """
+        v = self._index.get(name)
+        if v is None:
+            v = self._index[name] = len(self._names)
+            self._names.append(name)
+        return v
+
+    def add_edge(self, v, w):
+        """Adds the edge v-w (or v->w for a digraph) between the vertices
+        named v and w, adding the vertices first if necessary.
+
+        :param v: the name of one vertex (the tail, for a digraph)
+        :param w: the name of the other vertex (the head, for a digraph)
+
+        """
+        self._tails.append(self.add_vertex(v))
+        self._heads.append(self.add_vertex(w))
+
+    def is_directed(self):
+        """Does this builder build a digraph?
+
+        :return: True if it builds a digraph, and False for an undirected graph
+
+        """
+        return self._directed
+
+    def V(self):
+        """Returns the number of vertices added so far.
+
+        :return: the number of vertices
+
+        """
+        return len(self._names)
+
+    def E(self):
+        """Returns the number of edges added so far.
+
+        :return: the number of edges
+
+        """
+        return len(self._tails)
+
+    def index(self):
+        """Returns the dict that maps each vertex name to its integer.
+
+        :return: the dict from vertex names to integers
+
+        """
+        return self._index
+
+    def names(self):
+        """Returns the vertex names, indexed by their integers.
+
+        :return: the list of vertex names
+
+        """
+        return self._names
+
+    def graph(self):
+        """Builds the underlying graph, with the edges in the order they were
+        added, as a Digraph if this builder is directed and as a Graph
+        otherwise.
+
+        :return: the underlying graph
+
+        """
+        G = Digraph(self.V()) if self._directed else Graph(self.V())
+        for v, w in zip(self._tails, self._heads):
+            G.add_edge(v, w)
+        return G
+
+    def csr(self):
+        """Builds the underlying graph in compressed sparse row form, as a
+        CSRDigraph if this builder is directed and as a CSRGraph otherwise.
+
+        :return: the underlying graph in compressed sparse row form
+
+        """
+        frozen = CSRDigraph if self._directed else CSRGraph
+        return frozen(self.V(), zip(self._tails, self._heads))
+
+    def save(self, filename):
+        """Writes the names and edges to a binary symbol graph file that can
+        be read with load.
+
+        :param filename: the name of the file to write
+        :raises ValueError: if a vertex name contains a newline
+
+        """
+        for name in self._names:
+            if "\n" in name:
+                raise ValueError("vertex name {!r} contains a newline".format(name))
+        names = "\n".join(self._names).encode("utf-8")
+        header = _HEADER.pack(
+            _MAGIC,
+            _VERSION,
+            _BYTE_ORDER_MARK,
+            self._directed,
+            self.V(),
+            self.E(),
+            len(names),
+        )
+        with open(filename, "wb") as f:
+            f.write(header)
+            f.write(names)
+            f.write(bytes((-len(names)) % 4))
+            f.write(self._tails)
+            f.write(self._heads)
+
+    @staticmethod
+    def load(filename):
+        """Reads a builder back from a binary symbol graph file written by
+        save.
+
+        :param filename: the name of the binary symbol graph file
+        :return: a builder with the names and edges stored in the file
+        :rtype: SymbolGraphBuilder
+        :raises ValueError: if the file is not a binary symbol graph file
+                            written on a machine with the same byte order
+
+        """
+        with open(filename, "rb") as f:
+            data = f.read()
+        if len(data) < _HEADER.size:
+            raise ValueError("{} is not a binary symbol graph file".format(filename))
+        magic, version, mark, directed, V, E, length = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("{} is not a binary symbol graph file".format(filename))
+        if mark != _BYTE_ORDER_MARK:
+            raise ValueError("{} was written with another byte order".format(filename))
+
+        start = _HEADER.size
+        end_names = start + length
+        start_tails = end_names + (-length) % 4
+        end_tails = start_tails + 4 * E
+        end_heads = end_tails + 4 * E
+        if len(data) < end_heads:
+            raise ValueError("{} is truncated".format(filename))
+
+        builder = SymbolGraphBuilder(bool(directed))
+        if V > 0:
+            builder._names = data[start:end_names].decode("utf-8").split("\n")
+        builder._index = {name: v for v, name in enumerate(builder._names)}
+        builder._tails.frombytes(data[start_tails:end_tails])
+        builder._heads.frombytes(data[end_tails:end_heads])
+        return builder
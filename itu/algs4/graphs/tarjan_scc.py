@@ -0,0 +1,199 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+"""This module implements Tarjan's algorithm for the strong components of a
+digraph, as one iterative depth-first search.
+
+Every vertex gets a preorder number when it is discovered and is pushed on a
+stack of vertices whose component is still open. The low number of a vertex
+is the smallest preorder number it reaches through its descendants and one
+edge back to a vertex still on that stack. When a vertex is finished with
+its low number equal to its own preorder number, it is the root of a strong
+component, which consists of it and the vertices above it on the stack. The
+search needs neither a reversed copy of the digraph nor a second pass, and
+keeps its own stack of adjacency iterators instead of recursing.
+
+"""
+
+import sys
+from array import array
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.fundamentals.queue import Queue
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.transitive_closure import TransitiveClosure
+from itu.algs4.stdlib.instream import InStream
+
+_CHECK_LIMIT = 1000  # largest digraph that is checked against TransitiveClosure
+
+
+def strong_components(G):
+    """Generates the strong components of the digraph G, each as a list of
+    its vertices, as soon as the search has completed it. The components come
+    in reverse topological order: every edge between two components leads
+    from a component to one that was generated before it.
+
+    :param G: the digraph, or a CSRDigraph
+    :return: a generator of the strong components of G
+
+    """
+    V = G.V()
+    pre = array("i", [-1]) * V  # pre[v] = preorder number of v
+    low = array("i", [0]) * V  # low[v] = low number of v
+    on_stack = bytearray(V)
+    stack = []  # vertices whose component is not yet complete
+    counter = 0
+    for s in range(V):
+        if pre[s] != -1:
+            continue
+        pre[s] = low[s] = counter
+        counter += 1
+        stack.append(s)
+        on_stack[s] = 1
+        work = [(s, iter(G.adj(s)))]
+        while work:
+            v, edges = work[-1]
+            for w in edges:
+                if pre[w] == -1:
+                    pre[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, iter(G.adj(w))))
+                    break
+                if on_stack[w] and pre[w] < low[v]:
+                    low[v] = pre[w]
+            else:
+                # all edges leaving v have been examined
+                work.pop()
+                if work:
+                    u = work[-1][0]
+                    if low[v] < low[u]:
+                        low[u] = low[v]
+                if low[v] == pre[v]:
+                    component = []
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component.append(w)
+                        if w == v:
+                            break
+                    yield component
+
+
+class TarjanSCC:
+    """The TarjanSCC class represents a data type for determining the strong
+    components in a digraph, with the same API as KosarajuSharirSCC. The id
+    operation determines in which strong component a given vertex lies; the
+    strongly_connected operation determines whether two vertices are in the
+    same strong component; and the count operation determines the number of
+    strong components.
+
+    This implementation uses Tarjan's algorithm, in one iterative
+    depth-first search over strong_components(). The constructor takes time
+    proportional to V + E (in the worst case), where V is the number of
+    vertices and E is the number of edges, and extra space proportional to
+    V. Afterwards, the id, count, and strongly_connected operations take
+    constant time. The components are numbered from 0 in reverse
+    topological order.
+
+    """
+
+    def __init__(self, G):
+        """Computes the strong components of the digraph G.
+
+        :param G: the digraph, or a CSRDigraph
+
+        """
+        # id[v] = id of strong component containing v
+        self._id = array("i", bytes(4 * G.V()))
+        self._count = 0  # number of strongly-connected components
+        for component in strong_components(G):
+            for v in component:
+                self._id[v] = self._count
+            self._count += 1
+
+        # check that id[] gives strong components; the check takes time
+        # proportional to V (V + E), so it is only done for small digraphs
+        assert G.V() > _CHECK_LIMIT or self._check(G)
+
+    def count(self):
+        """Returns the number of strong components.
+
+        :return: the number of strong components
+
+        """
+        return self._count
+
+    def strongly_connected(self, v, w):
+        """Are vertices v and w in the same strong component?
+
+        :param v: one vertex
+        :param w: the other vertex
+        :return: True if vertices v and w are in the same strong component,
+                 and False otherwise
+        :raises IllegalArgumentException: unless 0 <= v < V
+        :raises IllegalArgumentException: unless 0 <= w < V
+
+        """
+        self._validate_vertex(v)
+        self._validate_vertex(w)
+        return self._id[v] == self._id[w]
+
+    def id(self, v):
+        """Returns the component id of the strong component containing vertex
+        v.
+
+        :param v: the vertex
+        :return: the component id of the strong component containing vertex v
+        :raises IllegalArgumentException: unless 0 <= v < V
+
+        """
+        self._validate_vertex(v)
+        return self._id[v]
+
+    # does the id[] array contain the strongly connected components?
+    def _check(self, G):
+        tc = TransitiveClosure(G)
+        for v in range(G.V()):
+            for w in range(G.V()):
+                if self.strongly_connected(v, w) != (
+                    tc.reachable(v, w) and tc.reachable(w, v)
+                ):
+                    return False
+        return True
+
+    # throw an IllegalArgumentException unless 0 <= v < V
+    def _validate_vertex(self, v):
+        V = len(self._id)
+        if v < 0 or v >= V:
+            raise IllegalArgumentException(
+                "vertex {} is not between 0 and {}".format(v, V - 1)
+            )
+
+
+def main(args):
+    stream = InStream(args[0])
+    G = Digraph.from_stream(stream)
+    scc = TarjanSCC(G)
+
+    # number of connected components
+    m = scc.count()
+    print("{} strong components".format(m))
+
+    # compute list of vertices in each strong component
+    components = [Queue() for i in range(m)]
+
+    for v in range(G.V()):
+        components[scc.id(v)].enqueue(v)
+
+    # print results
+    for i in range(m):
+        for v in components[i]:
+            print(str(v), end=" ")
+        print()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,231 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+from array import array
+from typing import Iterable
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.errors.errors import NoSuchElementException
+
+
+class IndexBucketQueue:
+    """The IndexBucketQueue class represents a monotone indexed priority queue
+    of nonnegative integer keys that all lie within a window: every key must
+    be at least the last key deleted, and at most that key plus max_step. It
+    supports insert, decrease-key and delete-the-minimum, where the client
+    refers to each key by an integer between 0 and max_n - 1, like
+    IndexMinPQ. Dijkstra's algorithm meets both conditions when its edge
+    weights are integers between 0 and max_step.
+
+    This implementation is Dial's bucket queue: a circular array of
+    max_step + 1 buckets, where the item with key k is kept in bucket
+    k mod (max_step + 1), and a cursor that moves forward through the
+    buckets to find the minimum. The insert and decrease-key operations
+    take constant time. Delete-the-minimum takes time proportional to the
+    number of empty buckets the cursor passes, so a sequence of operations
+    takes time proportional to its length plus the largest key. The
+    is-empty, size, contains and key-of operations take constant time.
+    Construction takes time proportional to max_n + max_step.
+
+    """
+
+    def __init__(self, max_n: int, max_step: int) -> None:
+        """Initializes an empty indexed bucket queue with indices between 0
+        and max_n - 1.
+
+        :param max_n: the keys on this priority queue are indices from 0 to max_n - 1
+        :param max_step: the largest difference between a key on the priority
+                         queue and the last key deleted
+        :raises IllegalArgumentException: if max_n < 0 or max_step < 0
+
+        """
+        if max_n < 0:
+            raise IllegalArgumentException("max_n must be nonnegative")
+        if max_step < 0:
+            raise IllegalArgumentException("max_step must be nonnegative")
+        self._max_n = max_n
+        self._n = 0
+        self._width = max_step + 1
+        self._keys = array("q", [-1]) * max_n  # -1 if not on the queue
+        self._buckets = [set() for _ in range(self._width)]
+        self._cursor = 0  # the last key deleted
+
+    def insert(self, i: int, key: int) -> None:
+        """Associates key with index i.
+
+        :param i: an index
+        :param key: the key to associate with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if there already is an item associated with index i
+        :raises IllegalArgumentException: unless the key lies within max_step
+                                          above the last key deleted
+
+        """
+        if self.contains(i):
+            raise IllegalArgumentException("index is already in the priority queue")
+        key = self._check_key(key)
+        self._keys[i] = key
+        self._buckets[key % self._width].add(i)
+        self._n += 1
+
+    def insert_many(self, indices: Iterable[int], keys: Iterable[int]) -> None:
+        """Associates each key with the index at the same position.
+
+        :param indices: the indices
+        :param keys: the keys to associate with the indices
+        :raises IllegalArgumentException: unless 0 <= i < max_n for each index i
+        :raises IllegalArgumentException: if there already is an item associated with an index
+        :raises IllegalArgumentException: unless each key lies within max_step
+                                          above the last key deleted
+
+        """
+        for i, key in zip(indices, keys):
+            self.insert(i, key)
+
+    def contains(self, i: int) -> bool:
+        """Is i an index on this priority queue?
+
+        :param i: an index
+        :return: True if i is an index on this priority queue False otherwise
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+
+        """
+        if i < 0 or i >= self._max_n:
+            raise IllegalArgumentException("index is not within range")
+        return self._keys[i] != -1
+
+    def decrease_key(self, i: int, key: int) -> None:
+        """Decrease the key associated with index i to the specified value.
+
+        :param i: the index of the key to decrease
+        :param key: decrease the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key >= key_of(i)
+        :raises IllegalArgumentException: if no key is associated with index i
+        :raises IllegalArgumentException: if key is less than the last key deleted
+
+        """
+        if not self.contains(i):
+            raise IllegalArgumentException("index is not in the priority queue")
+        key = self._check_key(key)
+        old = self._keys[i]
+        if old <= key:
+            raise IllegalArgumentException(
+                "calling decrease_key() with given argument would not strictly decrease the key"
+            )
+        self._buckets[old % self._width].remove(i)
+        self._buckets[key % self._width].add(i)
+        self._keys[i] = key
+
+    def decrease_many(self, indices: Iterable[int], keys: Iterable[int]) -> None:
+        """Decreases the key associated with each index to the key at the
+        same position.
+
+        :param indices: the indices of the keys to decrease
+        :param keys: decrease the keys associated with the indices to these keys
+        :raises IllegalArgumentException: unless 0 <= i < max_n for each index i
+        :raises IllegalArgumentException: if a key does not strictly decrease
+        :raises IllegalArgumentException: if no key is associated with an index
+        :raises IllegalArgumentException: if a key is less than the last key deleted
+
+        """
+        for i, key in zip(indices, keys):
+            self.decrease_key(i, key)
+
+    def min_key(self) -> int:
+        """Returns a minimum key.
+
+        :return: a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+
+        """
+        return self._find_min()
+
+    def del_min(self) -> int:
+        """Removes a minimum key and returns its associated index.
+
+        :return: an index associated with a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+
+        """
+        self._cursor = self._find_min()
+        i = self._buckets[self._cursor % self._width].pop()
+        self._keys[i] = -1
+        self._n -= 1
+        return i
+
+    def is_empty(self) -> bool:
+        """Returns True if this priority queue is empty.
+
+        :return: True if this priority queue is empty False otherwise
+        :rtype: bool
+
+        """
+        return self._n == 0
+
+    def size(self) -> int:
+        """Returns the number of keys on this priority queue.
+
+        :return: the number of keys on this priority queue
+        :rtype: int
+
+        """
+        return self._n
+
+    def __len__(self) -> int:
+        return self._n
+
+    def key_of(self, i: int) -> int:
+        """Returns the key associated with index i.
+
+        :param i: the index of the key to return
+        :return: the key associated with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if no key is associated with index i
+
+        """
+        if not self.contains(i):
+            raise IllegalArgumentException("index is not on the priority queue")
+        return self._keys[i]
+
+    def _find_min(self) -> int:
+        # returns a minimum key, found by scanning forward from the cursor
+        if self._n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        buckets, width = self._buckets, self._width
+        cursor = self._cursor
+        while not buckets[cursor % width]:
+            cursor += 1
+        return cursor
+
+    def _check_key(self, key) -> int:
+        # returns the key as an int, unless it is outside the window or not
+        # integral
+        k = int(key)
+        if k != key:
+            raise IllegalArgumentException("key {} is not an integer".format(key))
+        if k < self._cursor or k >= self._cursor + self._width:
+            raise IllegalArgumentException(
+                "key {} is not between {} and {}".format(
+                    key, self._cursor, self._cursor + self._width - 1
+                )
+            )
+        return k
+
+
+def main():
+    """Inserts a bunch of keys to a bucket queue and deletes and prints them
+    in order."""
+    keys = [5, 3, 9, 3, 8, 7, 0, 9]
+    pq = IndexBucketQueue(len(keys), 9)
+    pq.insert_many(range(len(keys)), keys)
+    while not pq.is_empty():
+        i = pq.del_min()
+        print("{} {}".format(i, keys[i]))
+
+
+if __name__ == "__main__":
+    main()
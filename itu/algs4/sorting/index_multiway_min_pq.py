@@ -0,0 +1,377 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+from array import array
+from typing import Iterable, Iterator
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.errors.errors import NoSuchElementException
+
+
+class IndexMultiwayMinPQ:
+    """The IndexMultiwayMinPQ class represents an indexed priority queue of
+    float keys, with the same operations as IndexMinPQ: insert and
+    delete-the-minimum, along with delete and change-the-key methods, where
+    the client refers to each key by an integer between 0 and max_n - 1.
+
+    This implementation uses a d-way heap, 4-way by default: each node has d
+    children, so the heap is only log_d(n) levels deep. The heap, its
+    inverse and the keys are stored in typed arrays, and the keys are
+    compared as floats. Items are moved along the heap by shifting the
+    others into a hole instead of by exchanges. The insert, decrease-key
+    and increase-key operations take time proportional to log_d(n), and the
+    delete-the-minimum, delete and change-key operations take time
+    proportional to d log_d(n). The bulk insert_many() and decrease_many()
+    operations rebuild the heap in linear time when they change a large
+    part of it. The is-empty, size, min-index, min-key and key-of
+    operations take constant time. Construction takes time proportional to
+    the specified capacity.
+
+    """
+
+    def __init__(self, max_n: int, d: int = 4) -> None:
+        """Initializes an empty indexed priority queue with indices between 0
+        and max_n - 1.
+
+        :param max_n: the keys on this priority queue are indices from 0 to max_n - 1
+        :param d: the number of children of each node of the heap
+        :raises IllegalArgumentException: if max_n < 0
+        :raises IllegalArgumentException: if d < 2
+
+        """
+        if max_n < 0:
+            raise IllegalArgumentException("max_n must be nonnegative")
+        if d < 2:
+            raise IllegalArgumentException("d must be at least 2")
+        self._max_n = max_n
+        self._d = d
+        self._n = 0
+        self._pq = array("i", bytes(4 * max_n))  # heap position -> index
+        self._qp = array("i", [-1]) * max_n  # index -> heap position, or -1
+        self._keys = array("d", bytes(8 * max_n))
+
+    def insert(self, i: int, key: float) -> None:
+        """Associates key with index i.
+
+        :param i: an index
+        :param key: the key to associate with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if there already is an item associated with index i
+
+        """
+        if self.contains(i):
+            raise IllegalArgumentException("index is already in the priority queue")
+        n = self._n
+        self._n = n + 1
+        self._pq[n] = i
+        self._qp[i] = n
+        self._keys[i] = key
+        self._swim(n)
+
+    def insert_many(self, indices: Iterable[int], keys: Iterable[float]) -> None:
+        """Associates each key with the index at the same position.
+
+        :param indices: the indices
+        :param keys: the keys to associate with the indices
+        :raises IllegalArgumentException: unless 0 <= i < max_n for each index i
+        :raises IllegalArgumentException: if there already is an item associated with an index
+
+        """
+        start = self._n
+        pq, qp, key_array = self._pq, self._qp, self._keys
+        for i, key in zip(indices, keys):
+            if self.contains(i):
+                raise IllegalArgumentException("index is already in the priority queue")
+            n = self._n
+            self._n = n + 1
+            pq[n] = i
+            qp[i] = n
+            key_array[i] = key
+        self._restore(range(start, self._n))
+
+    def contains(self, i: int) -> bool:
+        """Is i an index on this priority queue?
+
+        :param i: an index
+        :return: True if i is an index on this priority queue False otherwise
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+
+        """
+        if i < 0 or i >= self._max_n:
+            raise IllegalArgumentException("index is not within range")
+        return self._qp[i] != -1
+
+    def change_key(self, i: int, key: float) -> None:
+        """Change the key associated with index i to the specified value.
+
+        :param i: the index of the key to change
+        :param key: change the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if not self.contains(i):
+            raise NoSuchElementException("index is not in the priority queue")
+        self._keys[i] = key
+        self._swim(self._qp[i])
+        self._sink(self._qp[i])
+
+    def decrease_key(self, i: int, key: float) -> None:
+        """Decrease the key associated with index i to the specified value.
+
+        :param i: the index of the key to decrease
+        :param key: decrease the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key >= key_of(i)
+        :raises IllegalArgumentException: if no key is associated with index i
+
+        """
+        if not self.contains(i):
+            raise IllegalArgumentException("index is not in the priority queue")
+        if self._keys[i] <= key:
+            raise IllegalArgumentException(
+                "calling decrease_key() with given argument would not strictly decrease the key"
+            )
+        self._keys[i] = key
+        self._swim(self._qp[i])
+
+    def decrease_many(self, indices: Iterable[int], keys: Iterable[float]) -> None:
+        """Decreases the key associated with each index to the key at the
+        same position.
+
+        :param indices: the indices of the keys to decrease
+        :param keys: decrease the keys associated with the indices to these keys
+        :raises IllegalArgumentException: unless 0 <= i < max_n for each index i
+        :raises IllegalArgumentException: if a key does not strictly decrease
+        :raises IllegalArgumentException: if no key is associated with an index
+
+        """
+        qp, key_array = self._qp, self._keys
+        positions = []
+        for i, key in zip(indices, keys):
+            if not self.contains(i):
+                raise IllegalArgumentException("index is not in the priority queue")
+            if key_array[i] <= key:
+                raise IllegalArgumentException(
+                    "calling decrease_many() with given argument would not strictly decrease the key"
+                )
+            key_array[i] = key
+            positions.append(qp[i])
+        self._restore(positions)
+
+    def increase_key(self, i: int, key: float) -> None:
+        """Increase the key associated with index i to the specified value.
+
+        :param i: the index of the key to increase
+        :param key: increase the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key <= key_of(i)
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if not self.contains(i):
+            raise NoSuchElementException("index is not in the priority queue")
+        if self._keys[i] >= key:
+            raise IllegalArgumentException(
+                "calling increase_key() with given argument would not strictly increase the key"
+            )
+        self._keys[i] = key
+        self._sink(self._qp[i])
+
+    def delete(self, i: int) -> None:
+        """Remove the key associated with index i.
+
+        :param i: the index of the key to remove
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises NoSuchElementException: if no key is associated with index i
+
+        """
+        if not self.contains(i):
+            raise NoSuchElementException("index is not in the priority queue")
+        k = self._qp[i]
+        self._qp[i] = -1
+        self._n -= 1
+        n = self._n
+        if k != n:
+            # move the last item into the hole, then up or down
+            j = self._pq[n]
+            self._pq[k] = j
+            self._qp[j] = k
+            self._swim(k)
+            self._sink(self._qp[j])
+
+    def min_index(self) -> int:
+        """Returns an index associated with a minimum key.
+
+        :return: an index associated with a minimum key
+        :rtype: int
+        :raises NoSuchElementException: if this priority queue is empty
+
+        """
+        if self._n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        return self._pq[0]
+
+    def min_key(self) -> float:
+        """Returns a minimum key.
+
+        :return: a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+
+        """
+        if self._n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        return self._keys[self._pq[0]]
+
+    def del_min(self) -> int:
+        """Removes a minimum key and returns its associated index.
+
+        :return: an index associated with a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+
+        """
+        if self._n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        pq = self._pq
+        min_index = pq[0]
+        self._qp[min_index] = -1
+        self._n -= 1
+        n = self._n
+        if n > 0:
+            j = pq[n]
+            pq[0] = j
+            self._qp[j] = 0
+            self._sink(0)
+        return min_index
+
+    def is_empty(self) -> bool:
+        """Returns True if this priority queue is empty.
+
+        :return: True if this priority queue is empty False otherwise
+        :rtype: bool
+
+        """
+        return self._n == 0
+
+    def size(self) -> int:
+        """Returns the number of keys on this priority queue.
+
+        :return: the number of keys on this priority queue
+        :rtype: int
+
+        """
+        return self._n
+
+    def __len__(self) -> int:
+        return self._n
+
+    def key_of(self, i: int) -> float:
+        """Returns the key associated with index i.
+
+        :param i: the index of the key to return
+        :return: the key associated with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if no key is associated with index i
+
+        """
+        if not self.contains(i):
+            raise IllegalArgumentException("index is not on the priority queue")
+        return self._keys[i]
+
+    def _restore(self, positions) -> None:
+        """Restores the heap order after the keys at the given heap positions
+        have decreased, or were appended: by swimming each of them, or by
+        rebuilding the whole heap if they make up a large part of it.
+
+        :param positions: the heap positions of the changed items
+
+        """
+        if len(positions) > self._n // self._d:
+            for k in range((self._n - 2) // self._d, -1, -1):
+                self._sink(k)
+        else:
+            # an item swims past the positions above it only, so swimming
+            # top-down never leaves a decreased key below a larger one
+            for k in sorted(positions):
+                self._swim(k)
+
+    def _swim(self, k: int) -> None:
+        """Moves item at index k up to a legal position on the heap.
+
+        :param k: Index of the item on the heap to be moved
+
+        """
+        pq, qp, keys, d = self._pq, self._qp, self._keys, self._d
+        i = pq[k]
+        key = keys[i]
+        while k > 0:
+            parent = (k - 1) // d
+            j = pq[parent]
+            if keys[j] <= key:
+                break
+            pq[k] = j
+            qp[j] = k
+            k = parent
+        pq[k] = i
+        qp[i] = k
+
+    def _sink(self, k: int) -> None:
+        """Moves item at index k down to a legal position on the heap.
+
+        :param k: Index of the item on the heap to be moved
+
+        """
+        pq, qp, keys, d, n = self._pq, self._qp, self._keys, self._d, self._n
+        i = pq[k]
+        key = keys[i]
+        last = (n - 2) // d  # the last position with a child
+        while k <= last:
+            child = d * k + 1
+            # the child with the smallest key
+            best = child
+            best_key = keys[pq[child]]
+            for c in range(child + 1, min(child + d, n)):
+                c_key = keys[pq[c]]
+                if c_key < best_key:
+                    best = c
+                    best_key = c_key
+            if best_key >= key:
+                break
+            j = pq[best]
+            pq[k] = j
+            qp[j] = k
+            k = best
+        pq[k] = i
+        qp[i] = k
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterates over all the items in this priority queue in ascending
+        order."""
+        copy = IndexMultiwayMinPQ(self._max_n, self._d)
+        items = [self._pq[k] for k in range(self._n)]
+        copy.insert_many(items, [self._keys[i] for i in items])
+        while not copy.is_empty():
+            yield copy.del_min()
+
+
+def main():
+    """Inserts a bunch of keys to an indexed priority queue, deletes and
+    prints them, inserts them again, and prints them using an iterator."""
+    keys = [0.5, 0.25, 0.75, 0.125, 1.0, 0.375, 0.5, 0.625, 0.875, 0.0]
+    pq = IndexMultiwayMinPQ(len(keys))
+    for i in range(len(keys)):
+        pq.insert(i, keys[i])
+    while not pq.is_empty():
+        i = pq.del_min()
+        print("{} {}".format(i, keys[i]))
+    print()
+    pq.insert_many(range(len(keys)), keys)
+    for i in pq:
+        print("{} {}".format(i, keys[i]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# Created for BADS 2018
+# See README.md for details
+# Python 3
+
+from array import array
+from typing import Iterable
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.errors.errors import NoSuchElementException
+
+_BUCKETS = 65  # one per possible bit length of the xor of two 64-bit keys
+
+
+class IndexRadixHeap:
+    """The IndexRadixHeap class represents a monotone indexed priority queue
+    of nonnegative integer keys. It supports insert, decrease-key and
+    delete-the-minimum, where the client refers to each key by an integer
+    between 0 and max_n - 1, like IndexMinPQ. It is monotone: no key may be
+    smaller than the last key deleted, which is the case for the keys
+    Dijkstra's algorithm uses.
+
+    This implementation is a radix heap (Ahuja, Mehlhorn, Orlin and Tarjan,
+    1990). An item is kept in the bucket numbered by the bit length of the
+    xor of its key and the last deleted minimum, so bucket 0 holds the keys
+    equal to that minimum and every other bucket b the keys that first
+    differ from it in bit b - 1. When bucket 0 is empty, delete-the-minimum
+    finds the minimum of the first nonempty bucket and redistributes that
+    bucket among the buckets below it. An item only ever moves to lower
+    buckets, so with keys below 2^64 the insert and decrease-key operations
+    take constant time and delete-the-minimum takes amortized time
+    proportional to log C, where C is the largest key. The is-empty, size,
+    contains and key-of operations take constant time. Construction takes
+    time proportional to the specified capacity.
+
+    """
+
+    def __init__(self, max_n: int) -> None:
+        """Initializes an empty indexed radix heap with indices between 0 and
+        max_n - 1.
+
+        :param max_n: the keys on this priority queue are indices from 0 to max_n - 1
+        :raises IllegalArgumentException: if max_n < 0
+
+        """
+        if max_n < 0:
+            raise IllegalArgumentException("max_n must be nonnegative")
+        self._max_n = max_n
+        self._n = 0
+        self._keys = array("q", bytes(8 * max_n))
+        self._bucket_of = array("b", [-1]) * max_n  # -1 if not on the queue
+        self._buckets = [set() for _ in range(_BUCKETS)]
+        self._last = 0  # the last key deleted
+
+    def insert(self, i: int, key: int) -> None:
+        """Associates key with index i.
+
+        :param i: an index
+        :param key: the key to associate with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if there already is an item associated with index i
+        :raises IllegalArgumentException: if key is less than the last key deleted
+
+        """
+        if self.contains(i):
+            raise IllegalArgumentException("index is already in the priority queue")
+        key = self._check_key(key)
+        self._keys[i] = key
+        self._put(i, key)
+        self._n += 1
+
+    def insert_many(self, indices: Iterable[int], keys: Iterable[int]) -> None:
+        """Associates each key with the index at the same position.
+
+        :param indices: the indices
+        :param keys: the keys to associate with the indices
+        :raises IllegalArgumentException: unless 0 <= i < max_n for each index i
+        :raises IllegalArgumentException: if there already is an item associated with an index
+        :raises IllegalArgumentException: if a key is less than the last key deleted
+
+        """
+        for i, key in zip(indices, keys):
+            self.insert(i, key)
+
+    def contains(self, i: int) -> bool:
+        """Is i an index on this priority queue?
+
+        :param i: an index
+        :return: True if i is an index on this priority queue False otherwise
+        :rtype: bool
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+
+        """
+        if i < 0 or i >= self._max_n:
+            raise IllegalArgumentException("index is not within range")
+        return self._bucket_of[i] != -1
+
+    def decrease_key(self, i: int, key: int) -> None:
+        """Decrease the key associated with index i to the specified value.
+
+        :param i: the index of the key to decrease
+        :param key: decrease the key associated with index i to this key
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if key >= key_of(i)
+        :raises IllegalArgumentException: if no key is associated with index i
+        :raises IllegalArgumentException: if key is less than the last key deleted
+
+        """
+        if not self.contains(i):
+            raise IllegalArgumentException("index is not in the priority queue")
+        key = self._check_key(key)
+        if self._keys[i] <= key:
+            raise IllegalArgumentException(
+                "calling decrease_key() with given argument would not strictly decrease the key"
+            )
+        self._keys[i] = key
+        b = (key ^ self._last).bit_length()
+        if b != self._bucket_of[i]:
+            self._buckets[self._bucket_of[i]].remove(i)
+            self._buckets[b].add(i)
+            self._bucket_of[i] = b
+
+    def decrease_many(self, indices: Iterable[int], keys: Iterable[int]) -> None:
+        """Decreases the key associated with each index to the key at the
+        same position.
+
+        :param indices: the indices of the keys to decrease
+        :param keys: decrease the keys associated with the indices to these keys
+        :raises IllegalArgumentException: unless 0 <= i < max_n for each index i
+        :raises IllegalArgumentException: if a key does not strictly decrease
+        :raises IllegalArgumentException: if no key is associated with an index
+        :raises IllegalArgumentException: if a key is less than the last key deleted
+
+        """
+        for i, key in zip(indices, keys):
+            self.decrease_key(i, key)
+
+    def min_key(self) -> int:
+        """Returns a minimum key.
+
+        :return: a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+
+        """
+        if self._n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        if self._buckets[0]:
+            return self._last
+        bucket = next(bucket for bucket in self._buckets if bucket)
+        return min(self._keys[i] for i in bucket)
+
+    def del_min(self) -> int:
+        """Removes a minimum key and returns its associated index.
+
+        :return: an index associated with a minimum key
+        :raises NoSuchElementException: if this priority queue is empty
+        :rtype: int
+
+        """
+        if self._n == 0:
+            raise NoSuchElementException("Priority queue underflow")
+        buckets = self._buckets
+        if not buckets[0]:
+            bucket = next(bucket for bucket in buckets if bucket)
+            keys = self._keys
+            self._last = keys[min(bucket, key=keys.__getitem__)]
+            for i in bucket:
+                self._put(i, keys[i])
+            bucket.clear()
+        i = buckets[0].pop()
+        self._bucket_of[i] = -1
+        self._n -= 1
+        return i
+
+    def is_empty(self) -> bool:
+        """Returns True if this priority queue is empty.
+
+        :return: True if this priority queue is empty False otherwise
+        :rtype: bool
+
+        """
+        return self._n == 0
+
+    def size(self) -> int:
+        """Returns the number of keys on this priority queue.
+
+        :return: the number of keys on this priority queue
+        :rtype: int
+
+        """
+        return self._n
+
+    def __len__(self) -> int:
+        return self._n
+
+    def key_of(self, i: int) -> int:
+        """Returns the key associated with index i.
+
+        :param i: the index of the key to return
+        :return: the key associated with index i
+        :raises IllegalArgumentException: unless 0 <= i < max_n
+        :raises IllegalArgumentException: if no key is associated with index i
+
+        """
+        if not self.contains(i):
+            raise IllegalArgumentException("index is not on the priority queue")
+        return self._keys[i]
+
+    def _put(self, i: int, key: int) -> None:
+        # puts index i with the given key into its bucket
+        b = (key ^ self._last).bit_length()
+        self._buckets[b].add(i)
+        self._bucket_of[i] = b
+
+    def _check_key(self, key) -> int:
+        # returns the key as an int, unless it is below the last deleted key
+        # or not integral
+        k = int(key)
+        if k != key:
+            raise IllegalArgumentException("key {} is not an integer".format(key))
+        if k < self._last:
+            raise IllegalArgumentException(
+                "key {} is less than the last key deleted".format(key)
+            )
+        return k
+
+
+def main():
+    """Inserts a bunch of keys to a radix heap and deletes and prints them in
+    order."""
+    keys = [5, 3, 12, 3, 40, 7, 0, 9]
+    pq = IndexRadixHeap(len(keys))
+    pq.insert_many(range(len(keys)), keys)
+    while not pq.is_empty():
+        i = pq.del_min()
+        print("{} {}".format(i, keys[i]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# Created for BADS 2018
+# See README.md for details
+# This is python3
+import io
+import sys
+
+"""
+Binary input. This class provides methods for reading in bits from
+a binary input stream, either one bit at a time (as a boolean),
+8 bits at a time (as a byte or char), r bits at a time (as an int)
+or all remaining bytes at once (as a string).
+
+The input stream can be standard input, a file, any binary file object,
+or a bytes buffer. Several BinaryIn objects can be open at the same time.
+
+All primitive types are assumed to be represented in big-endian order.
+
+The client should not intermix calls to BinaryIn with other reads from
+the same stream; otherwise unexpected behavior will result.
+"""
+
+_BLOCK_SIZE = 1 << 16  # number of bytes read from the stream at a time
+
+
+class BinaryIn:
+    def __init__(self, ins=None):
+        """Initializes a binary input stream. Defaults to standard input.
+
+        :param ins: the name of a file, a bytes buffer, or a file object to
+                    read from. Text streams such as sys.stdin are read
+                    through their underlying binary buffer.
+
+        """
+        if ins is None:
+            ins = sys.stdin
+        if isinstance(ins, str):
+            ins = open(ins, "rb")
+        elif isinstance(ins, (bytes, bytearray, memoryview)):
+            ins = io.BytesIO(ins)
+        elif hasattr(ins, "buffer"):
+            ins = ins.buffer
+        self._in = ins
+        self._block = b""  # last block read from the stream
+        self._pos = 0  # index of the next unread byte in the block
+        self._buffer = 0  # the low n bits are read but not yet consumed
+        self._n = 0  # number of bits left in buffer
+
+    def _fill(self, r):
+        # moves bytes from the block into the bit buffer, at most 8 at a time,
+        # until the buffer holds at least r bits; returns False if the stream
+        # ends first
+        while self._n < r:
+            pos = self._pos
+            if pos >= len(self._block):
+                self._block = self._in.read(_BLOCK_SIZE)
+                self._pos = pos = 0
+                if not self._block:
+                    return False
+            chunk = self._block[pos : pos + 8]
+            self._pos = pos + len(chunk)
+            self._buffer &= (1 << self._n) - 1
+            self._buffer = (self._buffer << (8 * len(chunk))) | int.from_bytes(
+                chunk, "big"
+            )
+            self._n += 8 * len(chunk)
+        return True
+
+    def close(self):
+        """Close this input stream and release any associated system
+        resources."""
+        self._in.close()
+
+    def is_empty(self):
+        """Returns true if this binary input stream is empty.
+
+        :return: True if this binary input stream is empty, False otherwise
+
+        """
+        return self._n == 0 and not self._fill(1)
+
+    def read_bool(self):
+        """Reads the next bit of data from this binary input stream and
+        returns it as a boolean.
+
+        :return: the next bit of data from this binary input stream as a boolean
+        :raises EOFError: if this binary input stream is empty
+
+        """
+        if self._n == 0 and not self._fill(1):
+            raise EOFError("Reading from empty input stream")
+        self._n -= 1
+        return (self._buffer >> self._n) & 1 == 1
+
+    def read_int(self, r=32):
+        """Reads the next r bits from this binary input stream and returns
+        them as an r-bit nonnegative int.
+
+        :param r: number of relevant bits in the int, between 1 and 32
+        :return: the next r bits of data from this binary input stream as an int
+        :raises ValueError: unless 1 <= r <= 32
+        :raises EOFError: if there are fewer than r bits available
+
+        """
+        if r < 1 or r > 32:
+            raise ValueError("Illegal value for r = {}".format(r))
+        if self._n < r and not self._fill(r):
+            raise EOFError("Reading from empty input stream")
+        self._n -= r
+        return (self._buffer >> self._n) & ((1 << r) - 1)
+
+    def read_byte(self):
+        """Reads the next 8 bits from this binary input stream and returns
+        them as an int between 0 and 255.
+
+        :return: the next 8 bits of data from this binary input stream
+        :raises EOFError: if there are fewer than 8 bits available
+
+        """
+        return self.read_int(8)
+
+    def read_char(self, r=8):
+        """Reads the next r bits from this binary input stream and returns
+        them as an r-bit character.
+
+        :param r: number of relevant bits in the char, between 1 and 16
+        :return: the next r bits of data from this binary input stream as a char
+        :raises ValueError: unless 1 <= r <= 16
+        :raises EOFError: if there are fewer than r bits available
+
+        """
+        if r < 1 or r > 16:
+            raise ValueError("Illegal value for r = {}".format(r))
+        return chr(self.read_int(r))
+
+    def read_string(self):
+        """Reads the remaining bytes of data from this binary input stream and
+        returns them as a string of 8-bit characters.
+
+        :return: the remaining bytes of data from this binary input stream as a string
+        :raises EOFError: if this binary input stream is empty or if the number
+                          of bits available is not a multiple of 8
+
+        """
+        if self.is_empty():
+            raise EOFError("Reading from empty input stream")
+        if self._n % 8 != 0:
+            sb = []
+            while not self.is_empty():
+                sb.append(self.read_char())
+            return "".join(sb)
+        # byte-aligned: decode the rest of the stream in one go
+        head = (self._buffer & ((1 << self._n) - 1)).to_bytes(self._n // 8, "big")
+        data = b"".join((head, self._block[self._pos :], self._in.read()))
+        self._block = b""
+        self._pos = 0
+        self._buffer = 0
+        self._n = 0
+        return data.decode("latin-1")
+
+
+def main():
+    """Copies the file given as command-line argument to standard output,
+    one byte at a time."""
+    from itu.algs4.stdlib.binary_out import BinaryOut
+
+    binary_in = BinaryIn(sys.argv[1])
+    binary_out = BinaryOut()
+    while not binary_in.is_empty():
+        binary_out.write_byte(binary_in.read_byte())
+    binary_out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,6 @@
 # Created for BADS 2018
 # See README.md for details
 # This is python3
-import struct
 import sys
 
 """
@@ -9,84 +8,155 @@ Binary output. This class provides methods for converting
 some primitive type variables (boolean, byte, char, and int)
 to sequences of bits and writing them
 to an output stream.
-The output stream can be standard output or another outputstream.
+The output stream can be standard output, a file, or any binary file
+object. Several BinaryOut objects can be open at the same time.
 Uses big-endian (most-significant byte first).
 
-The client must flush() the output stream when finished writing bits.
+Bits are collected in memory and written to the output stream in
+large blocks. The client must flush() the output stream when finished
+writing bits.
 
 The client should not intermix calls to BinaryOut with calls to stdout;
 otherwise unexpected behavior will result.
 """
 
+_BLOCK_SIZE = 1 << 16  # number of bytes written to the stream at a time
+
 
 class BinaryOut:
-    def __init__(self, os=sys.stdout):
+    def __init__(self, os=None):
         """Initializes a binary output stream from a specified output stream.
-        Defaults to stdin.
+        Defaults to standard output.
 
-        :param os: the output streamt to write to.
+        :param os: the name of a file, or the file object to write to. Text
+                   streams such as sys.stdout are written through their
+                   underlying binary buffer.
 
         """
-        self.out = os.buffer
-        self.buffer = 0  # 8-bit buffer of bits to write out
-        self.n = 0  # number of bits used in buffer
-
-    def _writeBit(self, x):
-        self.buffer <<= 1
-        if x:
-            self.buffer |= 1
-        self.n += 1
-        if self.n == 8:
-            self._clearBuffer()
-
-    def _writeByte(self, x):
-        assert x >= 0 and x < 256
-        # optimized if byte-alligned
-        if self.n == 0:
-            self.out.write(struct.pack("B", x))
-            return
-        # otherwise write one bit at a time
-        for i in range(0, 8):
-            bit = ((x >> (8 - i - 1)) & 1) == 1
-            self._writeBit(bit)
-
-    def _clearBuffer(self):
-        if self.n == 0:
-            return
-        if self.n > 0:
-            self.buffer <<= 8 - self.n
-        self.out.write(self.buffer.to_bytes(1, "big"))
-        self.n = 0
-        self.buffer = 0
+        if os is None:
+            os = sys.stdout
+        if isinstance(os, str):
+            os = open(os, "wb")
+        elif hasattr(os, "buffer"):
+            os = os.buffer
+        self._out = os
+        self._block = bytearray()  # whole bytes not yet written out
+        self._buffer = 0  # the low n bits are still to be moved to the block
+        self._n = 0  # number of bits in buffer
+
+    def _write_bits(self, x, r):
+        # appends the r low bits of x, which must be nonnegative and less
+        # than 2^r
+        self._buffer = (self._buffer << r) | x
+        self._n += r
+        if self._n >= 64:
+            self._drain()
+
+    def _drain(self):
+        # moves all whole bytes from the bit buffer to the block, and writes
+        # the block once it is large enough
+        k = self._n >> 3
+        self._n &= 7
+        self._block += (self._buffer >> self._n).to_bytes(k, "big")
+        self._buffer &= (1 << self._n) - 1
+        if len(self._block) >= _BLOCK_SIZE:
+            self._out.write(self._block)
+            self._block.clear()
 
     def flush(self):
-        self._clearBuffer()
-        self.out.flush()
+        """Writes all buffered bits to the output stream, padding with 0s to
+        a byte boundary, and flushes the stream."""
+        pad = -self._n % 8
+        self._buffer <<= pad
+        self._n += pad
+        self._drain()
+        self._out.write(self._block)
+        self._block.clear()
+        self._out.flush()
 
     def close(self):
+        """Flushes and closes the output stream."""
         self.flush()
-        self.out.close()
+        self._out.close()
 
     def write_bool(self, x):
-        self._writeBit(x)
+        """Writes the specified bit to the binary output stream.
+
+        :param x: the boolean to write
+
+        """
+        self._buffer = (self._buffer << 1) | (1 if x else 0)
+        self._n += 1
+        if self._n >= 64:
+            self._drain()
 
     def write_byte(self, x):
-        self._writeByte(x & 0xFF)
-
-    def write_int(self, x):
-        self._writeByte(((x >> 24) & 0xFF))
-        self._writeByte(((x >> 16) & 0xFF))
-        self._writeByte(((x >> 8) & 0xFF))
-        self._writeByte(((x >> 0) & 0xFF))
-
-    def write_char(self, x):
-        if ord(x) < 0 or ord(x) >= 256:
-            raise ValueError("Illegal 8-bit char = {}".format(x))
-        self._writeByte(ord(x))
-
-    def write_string(self, s):
-        for i in s:
-            self.write_char(s[i])
+        """Writes the 8 low bits of x to the binary output stream.
+
+        :param x: the int whose 8 low bits to write
+
+        """
+        self._write_bits(x & 0xFF, 8)
+
+    def write_int(self, x, r=32):
+        """Writes the r-bit int to the binary output stream. For r = 32, the
+        32 low bits of x are written, so negative ints are stored in two's
+        complement.
+
+        :param x: the int to write
+        :param r: the number of relevant bits in the int, between 1 and 32
+        :raises ValueError: unless 1 <= r <= 32
+        :raises ValueError: unless 0 <= x < 2^r for r < 32
+
+        """
+        if r == 32:
+            self._write_bits(x & 0xFFFFFFFF, 32)
+            return
+        if r < 1 or r > 32:
+            raise ValueError("Illegal value for r = {}".format(r))
+        if x < 0 or x >= (1 << r):
+            raise ValueError("Illegal {}-bit int = {}".format(r, x))
+        self._write_bits(x, r)
+
+    def write_char(self, x, r=8):
+        """Writes the r-bit char to the binary output stream.
+
+        :param x: the char to write
+        :param r: the number of relevant bits in the char, between 1 and 16
+        :raises ValueError: unless 1 <= r <= 16
+        :raises ValueError: unless ord(x) < 2^r
+
+        """
+        if r < 1 or r > 16:
+            raise ValueError("Illegal value for r = {}".format(r))
+        c = ord(x)
+        if c >= (1 << r):
+            raise ValueError("Illegal {}-bit char = {}".format(r, x))
+        self._write_bits(c, r)
+
+    def write_string(self, s, r=8):
+        """Writes the string of r-bit characters to the binary output stream.
+
+        :param s: the string to write
+        :param r: the number of relevant bits in each char, between 1 and 16
+        :raises ValueError: unless 1 <= r <= 16
+        :raises ValueError: if any character in the string is not an r-bit char
+
+        """
+        if r != 8 or self._n % 8 != 0:
+            for c in s:
+                self.write_char(c, r)
+            return
+        # byte-aligned 8-bit characters are appended to the block directly
+        try:
+            data = s.encode("latin-1")
+        except UnicodeEncodeError as e:
+            raise ValueError("Illegal 8-bit char = {}".format(s[e.start]))
+        self._drain()
+        self._block += data
+        if len(self._block) >= _BLOCK_SIZE:
+            self._out.write(self._block)
+            self._block.clear()
 
 
 def main():
@@ -1,17 +1,21 @@
 # Created for BADS 2018
 # See README.md for details
 # This is python3
-import struct
 import sys
 
+from itu.algs4.stdlib.binary_out import BinaryOut
+
 """
 Binary standard output. This class provides methods for converting
 some primitive type variables (boolean, byte, char, and int)
 to sequences of bits and writing them
-to an output stream.
-The output stream can be standard output or another outputstream.
+to standard output.
 Uses big-endian (most-significant byte first).
 
+The methods delegate to a single BinaryOut object writing to standard
+output, which is created on first use. Use BinaryOut directly to write to
+files or to several streams at once.
+
 The client must flush() the output stream when finished writing bits.
 
 The client should not intermix calls to BinaryOut with calls to stdout;
@@ -20,107 +24,42 @@ otherwise unexpected behavior will result.
 
 
 class BinaryStdOut:
-    out = sys.stdout.buffer
-    buffer_ = 0
-    n = 0
-    is_init = False
+    _out = None
 
     @staticmethod
-    def _initialize():
-        BinaryStdOut.buffer_ = 0  # 8-bit buffer of bits to write out
-        BinaryStdOut.n = 0  # number of bits used in buffer
-        BinaryStdOut.is_init = True
-
-    @staticmethod
-    def _write_bit(x):
-        if not BinaryStdOut.is_init:
-            BinaryStdOut._initialize()
-        BinaryStdOut.buffer_ <<= 1
-        if x:
-            BinaryStdOut.buffer_ |= 1
-        BinaryStdOut.n += 1
-        if BinaryStdOut.n == 8:
-            BinaryStdOut._clear_buffer()
-
-    @staticmethod
-    def _write_byte(x):
-        if not BinaryStdOut.is_init:
-            BinaryStdOut._initialize()
-        assert x >= 0 and x < 256
-        # optimized if byte-alligned
-        if BinaryStdOut.n == 0:
-            BinaryStdOut.out.write(struct.pack("B", x))
-            return
-        # otherwise write one bit at a time
-        for i in range(0, 8):
-            bit = ((x >> (8 - i - 1)) & 1) == 1
-            BinaryStdOut._write_bit(bit)
-
-    @staticmethod
-    def _clear_buffer():
-        if not BinaryStdOut.is_init:
-            BinaryStdOut._initialize()
-        if BinaryStdOut.n == 0:
-            return
-        if BinaryStdOut.n > 0:
-            BinaryStdOut.buffer_ <<= 8 - BinaryStdOut.n
-        BinaryStdOut.out.write(struct.pack("B", BinaryStdOut.buffer_))
-        BinaryStdOut.n = 0
-        BinaryStdOut.buffer_ = 0
+    def _stream():
+        if BinaryStdOut._out is None:
+            BinaryStdOut._out = BinaryOut(sys.stdout)
+        return BinaryStdOut._out
 
     @staticmethod
     def flush():
-        BinaryStdOut._clear_buffer()
-        BinaryStdOut.out.flush()
+        BinaryStdOut._stream().flush()
 
     @staticmethod
     def close():
-        BinaryStdOut.flush()
-        BinaryStdOut.out.close()
-        BinaryStdOut.is_init = False
+        BinaryStdOut._stream().close()
+        BinaryStdOut._out = None
 
     @staticmethod
     def write_bool(x):
-        BinaryStdOut._write_bit(x)
+        BinaryStdOut._stream().write_bool(x)
 
     @staticmethod
     def write_byte(x):
-        BinaryStdOut._write_byte(x & 0xFF)
+        BinaryStdOut._stream().write_byte(x)
 
     @staticmethod
     def write_int(x, r=32):
-        if r == 32:
-            BinaryStdOut._write_byte(((x >> 24) & 0xFF))
-            BinaryStdOut._write_byte(((x >> 16) & 0xFF))
-            BinaryStdOut._write_byte(((x >> 8) & 0xFF))
-            BinaryStdOut._write_byte(((x >> 0) & 0xFF))
-            return
-        if r < 1 or r > 16:
-            raise ValueError("Illegal value for r = {}".format(r))
-        if x < 0 or x >= (1 << r):
-            raise ValueError("Illegal {}-bit char = {}".format(r, x))
-        for i in range(0, r):
-            bit = ((x >> (r - i - 1)) & 1) == 1
-            BinaryStdOut._write_bit(bit)
+        BinaryStdOut._stream().write_int(x, r)
 
     @staticmethod
     def write_char(x, r=8):
-        if r == 8:
-            if ord(x) < 0 or ord(x) >= 256:
-                raise ValueError("Illegal 8-bit char = {}".format(x))
-            BinaryStdOut._write_byte(ord(x))
-            return
-        if r < 1 or r > 16:
-            raise ValueError("Illegal value for r = {}".format(r))
-        if ord(x) >= (1 << r):
-            raise ValueError("Illegal {}-bit char = {}".format(r, x))
-        for i in range(0, r):
-            bit = ((x >> (r - i - 1)) & 1) == 1
-            BinaryStdOut._write_bit(bit)
+        BinaryStdOut._stream().write_char(x, r)
 
+    @staticmethod
     def write_string(s, r=8):
-        for i in s:
-            BinaryStdOut.write_char(i, r)
+        BinaryStdOut._stream().write_string(s, r)
 
 
 def main():
@@ -10,6 +10,7 @@ The instream module defines the InStream class.
 
 import re
 import sys
+from array import array
 
 if sys.hexversion < 0x03000000:
     import urllib
@@ -18,6 +19,27 @@ else:
 
 # -----------------------------------------------------------------------
 
+# Number of characters to read from a non-interactive stream at a time.
+# The buffer is always filled with whole lines, so no token is ever split
+# between two chunks.
+_CHUNK_SIZE = 1 << 16
+
+_NON_WHITESPACE = re.compile(r"\S")
+
+# Token patterns are compiled on first use and shared by all instances.
+_patterns = {}
+
+
+def _compile(regExp):
+    pattern = _patterns.get(regExp)
+    if pattern is None:
+        pattern = re.compile(r"\s*(" + regExp + ")")
+        _patterns[regExp] = pattern
+    return pattern
+
+
+# -----------------------------------------------------------------------
+
 
 class InStream:
 
@@ -35,6 +57,11 @@ class InStream:
 
     Usually it's better to use one set exclusively.
 
+    The stream is read in chunks of whole lines into a buffer, and tokens
+    are matched in place from a position index into that buffer, so
+    reading n tokens takes time proportional to the length of the input.
+    readAllInts() and readAllFloats() can return typed arrays.
+
     """
 
     # -------------------------------------------------------------------
@@ -48,6 +75,7 @@ class InStream:
 
         """
         self._buffer = ""
+        self._pos = 0  # index of the first unread character of self._buffer
         self._stream = None
         self._readingWebPage = False
 
@@ -73,6 +101,59 @@ class InStream:
 
     # -------------------------------------------------------------------
 
+    def _decode(self, text):
+        """Return text as a string, decoding it if it was read as bytes."""
+        if sys.hexversion < 0x03000000 or self._readingWebPage:
+            return text.decode("utf-8")
+        return text
+
+    # -------------------------------------------------------------------
+
+    def _readChunk(self):
+        """Read and return the next chunk of whole lines from the stream
+        wrapped by self, or the empty string at the end of the stream.
+
+        An interactive stream is read one line at a time, so that a
+        client never waits for input it has not asked for.
+
+        """
+        if self._stream.isatty():
+            return self._decode(self._stream.readline())
+        lines = self._stream.readlines(_CHUNK_SIZE)
+        return "".join(self._decode(line) for line in lines)
+
+    # -------------------------------------------------------------------
+
+    def _fill(self):
+        """Append the next chunk of the stream wrapped by self to the
+        buffer, discarding the part of the buffer that has been consumed.
+
+        Return False iff the end of the stream has been reached.
+
+        """
+        chunk = self._readChunk()
+        if chunk == "":
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    # -------------------------------------------------------------------
+
+    def _remainingChunks(self):
+        """Consume and yield the unread part of the buffer followed by all
+        remaining chunks of the stream wrapped by self."""
+        s = self._buffer[self._pos :]
+        self._buffer = ""
+        self._pos = 0
+        if s == "":
+            s = self._readChunk()
+        while s != "":
+            yield s
+            s = self._readChunk()
+
+    # -------------------------------------------------------------------
+
     def _readRegExp(self, regExp):
         """Discard leading white space characters from the stream wrapped by
         self.
@@ -83,28 +164,28 @@ class InStream:
         characters to be read from the stream do not match regExp.
 
         """
-        if self.isEmpty():
-            raise EOFError()
-        compiledRegExp = re.compile(r"^\s*" + regExp)
-        match = compiledRegExp.search(self._buffer)
+        pattern = _compile(regExp)
+        match = pattern.match(self._buffer, self._pos)
         if match is None:
-            raise ValueError()
-        s = match.group()
-        self._buffer = self._buffer[match.end() :]
-        return s.lstrip()
+            # Either only white space is left in the buffer, or the next
+            # characters do not match; the buffer holds whole lines, so a
+            # match is never cut short at the end of the buffer.
+            if self.isEmpty():
+                raise EOFError()
+            match = pattern.match(self._buffer, self._pos)
+            if match is None:
+                raise ValueError()
+        self._pos = match.end()
+        return match.group(1)
 
     # -------------------------------------------------------------------
 
     def isEmpty(self):
         """Return True iff no non-whitespace characters remain in the stream
         wrapped by self."""
-        while self._buffer.strip() == "":
-            line = self._stream.readline()
-            if sys.hexversion < 0x03000000 or self._readingWebPage:
-                line = line.decode("utf-8")
-            if line == "":
+        while _NON_WHITESPACE.search(self._buffer, self._pos) is None:
+            if not self._fill():
                 return True
-            self._buffer += str(line)
         return False
 
     # -------------------------------------------------------------------
@@ -122,6 +203,8 @@ class InStream:
 
         """
         s = self._readRegExp(r"[-+]?(0[xX][\dA-Fa-f]+|0[0-7]*|\d+)")
+        if s[0] != "0" and s[0] != "-":
+            return int(s)
         radix = 10
         strLength = len(s)
         if (strLength >= 1) and (s[0:1] == "0"):
@@ -140,19 +223,22 @@ class InStream:
 
     # -------------------------------------------------------------------
 
-    def readAllInts(self):
+    def readAllInts(self, typecode=None):
         """Read all remaining strings from the stream wrapped by self, convert
         each to an int, and return those ints in an array.
 
+        If typecode is given, the ints are returned in an array.array of
+        that type code (for example "i" or "q") instead of a list.
+
         Raise a ValueError if any of the strings cannot be converted to
-        an int.
+        an int, or does not fit into the given type.
 
         """
-        strings = self.readAllStrings()
-        ints = []
-        for s in strings:
-            i = int(s)
-            ints.append(i)
+        if typecode is None:
+            return [int(s) for s in self.readAllStrings()]
+        ints = array(typecode)
+        for chunk in self._remainingChunks():
+            ints.extend(map(int, chunk.split()))
         return ints
 
     # -------------------------------------------------------------------
@@ -173,19 +259,22 @@ class InStream:
 
     # -------------------------------------------------------------------
 
-    def readAllFloats(self):
+    def readAllFloats(self, typecode=None):
         """Read all remaining strings from the stream wrapped by self, convert
         each to a float, and return those floats in an array.
 
+        If typecode is given, the floats are returned in an array.array
+        of that type code ("d" or "f") instead of a list.
+
         Raise a ValueError if any of the strings cannot be converted to
         a float.
 
         """
-        strings = self.readAllStrings()
-        floats = []
-        for s in strings:
-            f = float(s)
-            floats.append(f)
+        if typecode is None:
+            return [float(s) for s in self.readAllStrings()]
+        floats = array(typecode)
+        for chunk in self._remainingChunks():
+            floats.extend(map(float, chunk.split()))
         return floats
 
     # -------------------------------------------------------------------
@@ -243,24 +332,19 @@ class InStream:
         """Read all remaining strings from the stream wrapped by self, and
         return them in an array."""
         strings = []
-        while not self.isEmpty():
-            s = self.readString()
-            strings.append(s)
+        for chunk in self._remainingChunks():
+            strings.extend(chunk.split())
         return strings
 
     # -------------------------------------------------------------------
 
     def hasNextLine(self):
         """Return True iff the stream wrapped by self has a next line."""
-        if self._buffer != "":
-            return True
-        else:
-            self._buffer = self._stream.readline()
-            if sys.hexversion < 0x03000000 or self._readingWebPage:
-                self._buffer = self._buffer.decode("utf-8")
-            if self._buffer == "":
-                return False
+        if self._pos < len(self._buffer):
             return True
+        self._buffer = self._decode(self._stream.readline())
+        self._pos = 0
+        return self._buffer != ""
 
     # -------------------------------------------------------------------
 
@@ -273,9 +357,12 @@ class InStream:
         """
         if not self.hasNextLine():
             raise EOFError()
-        s = self._buffer
-        self._buffer = ""
-        return s.rstrip("\n")
+        end = self._buffer.find("\n", self._pos)
+        if end == -1:
+            end = len(self._buffer)
+        s = self._buffer[self._pos : end]
+        self._pos = end + 1
+        return s
 
     # -------------------------------------------------------------------
 
@@ -293,13 +380,7 @@ class InStream:
     def readAll(self):
         """Read and return as a string all remaining lines of the stream
         wrapped by self."""
-        s = self._buffer
-        self._buffer = ""
-        for line in self._stream:
-            if sys.hexversion < 0x03000000 or self._readingWebPage:
-                line = line.decode("utf-8")
-            s += line
-        return s
+        return "".join(self._remainingChunks())
 
     # -------------------------------------------------------------------
 
@@ -35,35 +35,50 @@ class _Node:
         return self.freq > that.freq
 
 
-def compress():
+def compress(binary_in=None, binary_out=None):
     """Reads a sequence of 8-bit bytes from standard input; compresses them using
     Huffman codes with an 8-bit alphabet; and writes the results to standard
-    input."""
-    s = BinaryStdIn.read_string()
+    output.
+
+    :param binary_in: the BinaryIn to read from instead of standard input
+    :param binary_out: the BinaryOut to write to instead of standard output;
+                       it is flushed, but not closed, when done
+
+    """
+    ins = BinaryStdIn if binary_in is None else binary_in
+    out = BinaryStdOut if binary_out is None else binary_out
+    s = ins.read_string()
     # Tabulate frequency counts
     freq = [0 for i in range(0, _R)]
-    for i in range(0, len(s)):
-        freq[ord(s[i])] += 1
+    for c in s:
+        freq[ord(c)] += 1
     # Build Huffman trie
     root = _build_trie(freq)
     # Build code table
     st = [None for i in range(0, _R)]
     _build_code(st, root, "")
     # Print trie for decoder
-    _write_trie(root)
+    _write_trie(out, root)
     # Print number of bytes in original uncompressed message
-    BinaryStdOut.write_int(len(s))
-    # Use Huffman code to encode input
-    for i in range(0, len(s)):
-        code = st[ord(s[i])]
-        for j in range(0, len(code)):
-            if code[j] == "0":
-                BinaryStdOut.write_bool(False)
-            elif code[j] == "1":
-                BinaryStdOut.write_bool(True)
-            else:
-                raise ValueError("Illegal state")
-    BinaryStdOut.close()
+    out.write_int(len(s))
+    # Use Huffman code to encode input, writing each codeword as a few
+    # fields of at most 32 bits instead of one bit at a time
+    fields = [None for i in range(0, _R)]
+    for c in range(0, _R):
+        if st[c] is not None:
+            code = st[c]
+            fields[c] = [
+                (int(code[j : j + 32], 2), len(code[j : j + 32]))
+                for j in range(0, len(code), 32)
+            ]
+    write_int = out.write_int
+    for c in s:
+        for x, r in fields[ord(c)]:
+            write_int(x, r)
+    if binary_out is None:
+        BinaryStdOut.close()
+    else:
+        binary_out.flush()
 
 
 # Build the Huffman trie given frequencies
@@ -87,15 +102,15 @@ def _build_trie(freq):
     return pq.del_min()
 
 
-# Write bitstring-encoded trie to standard output
-def _write_trie(x):
+# Write bitstring-encoded trie to the output stream
+def _write_trie(out, x):
     if x.is_leaf():
-        BinaryStdOut.write_bool(True)
-        BinaryStdOut.write_char(x.ch)
+        out.write_bool(True)
+        out.write_char(x.ch)
         return
-    BinaryStdOut.write_bool(False)
-    _write_trie(x.left)
-    _write_trie(x.right)
+    out.write_bool(False)
+    _write_trie(out, x.left)
+    _write_trie(out, x.right)
 
 
 # Make a lookup table from symbols and their encodings
@@ -107,30 +122,43 @@ def _build_code(st, x, s):
         st[ord(x.ch)] = s
 
 
-def expand():
+def expand(binary_in=None, binary_out=None):
     """Reads a sequence of bits that represents a Huffman-compressed message from
-    standard input; expands them; and writes the results to standard output."""
-    BinaryStdIn.is_empty()
-    root = _read_trie()
-    length = BinaryStdIn.read_int()
+    standard input; expands them; and writes the results to standard output.
+
+    :param binary_in: the BinaryIn to read from instead of standard input
+    :param binary_out: the BinaryOut to write to instead of standard output;
+                       it is flushed, but not closed, when done
+
+    """
+    ins = BinaryStdIn if binary_in is None else binary_in
+    out = BinaryStdOut if binary_out is None else binary_out
+    ins.is_empty()
+    root = _read_trie(ins)
+    length = ins.read_int()
+    read_bool = ins.read_bool
+    chars = []
     for _ in range(0, length):
         x = root
-        while not x.is_leaf():
-            bit = BinaryStdIn.read_bool()
-            if bit:
+        while x.left is not None:
+            if read_bool():
                 x = x.right
             else:
                 x = x.left
-        BinaryStdOut.write_char(x.ch)
-    BinaryStdOut.close()
+        chars.append(x.ch)
+    out.write_string("".join(chars))
+    if binary_out is None:
+        BinaryStdOut.close()
+    else:
+        binary_out.flush()
 
 
-def _read_trie():
-    isLeaf = BinaryStdIn.read_bool()
+def _read_trie(ins):
+    isLeaf = ins.read_bool()
     if isLeaf:
-        return _Node(BinaryStdIn.read_char(), -1, None, None)
+        return _Node(ins.read_char(), -1, None, None)
     else:
-        return _Node("\0", -1, _read_trie(), _read_trie())
+        return _Node("\0", -1, _read_trie(ins), _read_trie(ins))
 
 
 def main():
@@ -20,31 +20,65 @@ _L = 4096
 _W = 12
 
 
-def compress():
+def compress(binary_in=None, binary_out=None):
     """Reads a sequence of 8-bit bytes from standard input; compresses them using
     LZW compression with 12-bit codewords; and writes the results to standard
-    output."""
-    input_ = BinaryStdIn.read_string()
+    output.
+
+    :param binary_in: the BinaryIn to read from instead of standard input
+    :param binary_out: the BinaryOut to write to instead of standard output;
+                       it is flushed, but not closed, when done
+
+    """
+    ins = BinaryStdIn if binary_in is None else binary_in
+    out = BinaryStdOut if binary_out is None else binary_out
+    input_ = ins.read_string()
     st = TST()
-    for i in range(0, _R):
-        st.put("" + chr(i), i)
+    _put_balanced(st, 0, _R - 1)
     code = _R + 1
-    while len(input_) > 0:
-        s = st.longest_prefix_of(input_)
-        BinaryStdOut.write_int(st.get(s), _W)
+    # only a window as long as the longest key is searched, starting at
+    # position i, instead of copying the whole remainder of the input
+    longest = 1
+    i = 0
+    while i < len(input_):
+        s = st.longest_prefix_of(input_[i : i + longest])
+        out.write_int(st.get(s), _W)
         t = len(s)
-        if t < len(input_) and code < _L:
-            st.put(input_[0 : t + 1], code)
+        if i + t < len(input_) and code < _L:
+            st.put(input_[i : i + t + 1], code)
             code += 1
-        input_ = input_[t:]
-    BinaryStdOut.write_int(_R, _W)
-    BinaryStdOut.close()
+            longest = max(longest, t + 1)
+        i += t
+    out.write_int(_R, _W)
+    if binary_out is None:
+        BinaryStdOut.close()
+    else:
+        binary_out.flush()
+
+
+# Puts the single characters lo..hi into the TST, middle one first, so that
+# the first level of the trie is a balanced search tree rather than a list
+def _put_balanced(st, lo, hi):
+    if lo > hi:
+        return
+    mid = (lo + hi) // 2
+    st.put(chr(mid), mid)
+    _put_balanced(st, lo, mid - 1)
+    _put_balanced(st, mid + 1, hi)
 
 
-def expand():
+def expand(binary_in=None, binary_out=None):
     """Reads a sequence of bit encoded using LZW compression with 12-bit codewords
     from standard input; expands them; and writes the results to standard
-    output."""
+    output.
+
+    :param binary_in: the BinaryIn to read from instead of standard input
+    :param binary_out: the BinaryOut to write to instead of standard output;
+                       it is flushed, but not closed, when done
+
+    """
+    ins = BinaryStdIn if binary_in is None else binary_in
+    out = BinaryStdOut if binary_out is None else binary_out
     st = ["" for i in range(0, _L)]
     i = 0
     while i < _R:
@@ -53,13 +87,14 @@ def expand():
     st[i] = ""
     i += 1
 
-    codeword = BinaryStdIn.read_int(_W)
+    codeword = ins.read_int(_W)
     if codeword == _R:
         return
     val = st[codeword]
+    chunks = []
     while True:
-        BinaryStdOut.write_string(val)
-        codeword = BinaryStdIn.read_int(_W)
+        chunks.append(val)
+        codeword = ins.read_int(_W)
         if codeword == _R:
             break
         s = st[codeword]
@@ -69,7 +104,11 @@ def expand():
             st[i] = val + s[0]
             i += 1
         val = s
-    BinaryStdOut.close()
+    out.write_string("".join(chunks))
+    if binary_out is None:
+        BinaryStdOut.close()
+    else:
+        binary_out.flush()
 
 
 def main():
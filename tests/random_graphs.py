@@ -0,0 +1,41 @@
+"""Random graphs shared by the graph tests. Every helper seeds the random
+module, so a test can build the same graph at collection time and again in
+its body."""
+
+import random
+
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.graph import Graph
+
+
+def random_graph(V, E, seed, weighted=False):
+    # E random edges, with weights between -1 and 1 if weighted
+    random.seed(seed)
+    G = EdgeWeightedGraph(V) if weighted else Graph(V)
+    for _ in range(E):
+        v, w = random.randrange(V), random.randrange(V)
+        if weighted:
+            G.add_edge(Edge(v, w, round(random.uniform(-1.0, 1.0), 2)))
+        else:
+            G.add_edge(v, w)
+    return G
+
+
+def random_digraph(V, E, seed, acyclic=False, weighted=False):
+    # E random edges, without those from v to w >= v if acyclic, with
+    # weights between 0 and 1 if weighted
+    random.seed(seed)
+    G = EdgeWeightedDigraph(V) if weighted else Digraph(V)
+    for _ in range(E):
+        v, w = random.randrange(V), random.randrange(V)
+        if acyclic and v >= w:
+            continue
+        if weighted:
+            G.add_edge(DirectedEdge(v, w, round(random.uniform(0.0, 1.0), 2)))
+        else:
+            G.add_edge(v, w)
+    return G
@@ -0,0 +1,52 @@
+import pytest
+
+from itu.algs4.graphs.breadth_first_paths import BreadthFirstPaths
+from itu.algs4.graphs.direction_optimizing_bfs import DirectionOptimizingBFS
+from itu.algs4.graphs.graph import Graph
+from random_graphs import random_digraph, random_graph
+
+
+def assert_path(G, path, sources, v, dist):
+    path = list(path)
+    assert len(path) == dist + 1
+    assert path[0] in sources and path[-1] == v
+    for a, b in zip(path, path[1:]):
+        assert b in G.adj(a)
+
+
+# dense graphs take bottom-up steps, sparse ones stay top-down
+@pytest.mark.parametrize(
+    "G",
+    [
+        random_graph(60, 50, 1),
+        random_graph(200, 3000, 2),
+        random_digraph(60, 120, 3),
+        random_digraph(200, 3000, 4),
+    ],
+)
+@pytest.mark.parametrize("sources", [[0], [3, 7, 3, 11]])
+def test_direction_optimizing_bfs(G, sources):
+    if len(sources) == 1:
+        bfs = BreadthFirstPaths(G, sources[0])
+    else:
+        bfs = BreadthFirstPaths.from_multiple_sources(G, sources)
+    do = DirectionOptimizingBFS(G, iter(sources))
+    for v in range(G.V()):
+        assert do.has_path_to(v) == bfs.has_path_to(v)
+        assert do.dist_to(v) == bfs.dist_to(v)
+        if bfs.has_path_to(v):
+            assert_path(G, bfs.path_to(v), sources, v, bfs.dist_to(v))
+            assert_path(G, do.path_to(v), sources, v, do.dist_to(v))
+        else:
+            assert do.path_to(v) is None
+    distances = [do.dist_to(v) if do.has_path_to(v) else -1 for v in range(G.V())]
+    assert list(do.distances()) == distances
+
+
+def test_bfs_rejects_bad_sources():
+    G = Graph(3)
+    for bad in ([], [0, 3], [-1]):
+        with pytest.raises(ValueError):
+            DirectionOptimizingBFS(G, bad)
+        with pytest.raises(ValueError):
+            BreadthFirstPaths.from_multiple_sources(G, bad)
@@ -0,0 +1,109 @@
+import io
+import random
+import subprocess
+import sys
+
+import pytest
+
+from itu.algs4.stdlib import binary_in, binary_out
+from itu.algs4.stdlib.binary_in import BinaryIn
+from itu.algs4.stdlib.binary_out import BinaryOut
+
+
+def written(write):
+    buffer = io.BytesIO()
+    out = BinaryOut(buffer)
+    write(out)
+    out.flush()
+    return buffer.getvalue()
+
+
+def test_fields_roundtrip():
+    random.seed(4)
+    fields = [(random.randrange(1 << r), r) for r in range(1, 33) for _ in range(20)]
+
+    def write(out):
+        for x, r in fields:
+            out.write_int(x, r)
+        out.write_bool(True)
+        out.write_char("A")
+        out.write_int(-2)
+
+    ins = BinaryIn(written(write))
+    assert [ins.read_int(r) for _, r in fields] == [x for x, _ in fields]
+    assert ins.read_bool() is True
+    assert ins.read_char() == "A"
+    assert ins.read_int() == (1 << 32) - 2
+    # the last byte is padded with zeros
+    while not ins.is_empty():
+        assert ins.read_bool() is False
+    with pytest.raises(EOFError):
+        ins.read_bool()
+
+
+def test_big_endian_layout():
+    data = written(lambda out: (out.write_int(0x01020304), out.write_int(5, 3)))
+    assert data == b"\x01\x02\x03\x04\xa0"
+
+
+def test_strings():
+    text = "".join(chr(i) for i in range(256)) * 3
+    assert written(lambda out: out.write_string(text)) == text.encode("latin-1")
+
+    data = written(lambda out: (out.write_bool(True), out.write_string("ab")))
+    assert data[0] == 0x80 | (ord("a") >> 1)
+    ins = BinaryIn(data)
+    assert ins.read_bool() is True
+    assert ins.read_char() == "a"
+    assert ins.read_char() == "b"
+    with pytest.raises(ValueError):
+        written(lambda out: out.write_string("€"))
+
+    ins = BinaryIn(b"xyz")
+    assert ins.read_char() == "x"
+    assert ins.read_string() == "yz"
+    assert ins.is_empty()
+
+
+def test_small_blocks(monkeypatch):
+    monkeypatch.setattr(binary_in, "_BLOCK_SIZE", 3)
+    monkeypatch.setattr(binary_out, "_BLOCK_SIZE", 3)
+    values = list(range(0, 1 << 12, 37))
+    data = written(lambda out: [out.write_int(x, 12) for x in values])
+    ins = BinaryIn(io.BytesIO(data))
+    assert [ins.read_int(12) for _ in values] == values
+
+
+def test_independent_streams():
+    first, second = BinaryIn(b"\xff\x00"), BinaryIn(b"\x0f")
+    assert first.read_int(4) == 0xF
+    assert second.read_int(4) == 0
+    assert first.read_int(8) == 0xF0
+    assert second.read_int(4) == 0xF
+
+
+def test_illegal_arguments():
+    out = BinaryOut(io.BytesIO())
+    with pytest.raises(ValueError):
+        out.write_int(8, 3)
+    with pytest.raises(ValueError):
+        out.write_int(1, 33)
+    with pytest.raises(ValueError):
+        BinaryIn(b"abcd").read_int(0)
+
+
+def run(module, flag, data):
+    # the compression clients import stdio, which replaces sys.stdin, so they
+    # are run in a separate process on real standard streams
+    command = [sys.executable, "-m", "itu.algs4.strings." + module, flag]
+    return subprocess.run(command, input=data, stdout=subprocess.PIPE, check=True).stdout
+
+
+@pytest.mark.parametrize("module", ["huffman_compression", "lzw"])
+def test_compression_roundtrip(module):
+    random.seed(5)
+    words = ["it", "was", "the", "best", "of", "times", "\xe9t\xe9", "\n"]
+    data = " ".join(random.choice(words) for _ in range(20000)).encode("latin-1")
+    compressed = run(module, "-", data)
+    assert len(compressed) < len(data)
+    assert run(module, "+", compressed) == data
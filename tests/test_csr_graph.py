@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from itu.algs4.graphs.breadth_first_paths import BreadthFirstPaths
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.csr_graph import CSRDigraph, CSRGraph
+from itu.algs4.graphs.depth_first_paths import DepthFirstPaths
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.kosaraju_sharir_scc import KosarajuSharirSCC
+from itu.algs4.graphs.topological import Topological
+from itu.algs4.stdlib.instream import InStream
+
+
+def random_edges(V, E, seed):
+    random.seed(seed)
+    return [(random.randrange(V), random.randrange(V)) for _ in range(E)]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_graph_adjacency(seed):
+    edges = random_edges(30, 60, seed)
+    G = Graph(30)
+    for v, w in edges:
+        G.add_edge(v, w)
+    csr = CSRGraph(30, edges)
+    assert csr.V() == G.V()
+    assert csr.E() == G.E()
+    for v in range(G.V()):
+        assert sorted(csr.adj(v)) == sorted(G.adj(v))
+        assert csr.degree(v) == G.degree(v)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_graph_clients(seed):
+    G = Graph(40)
+    for v, w in random_edges(40, 35, seed):
+        G.add_edge(v, w)
+    csr = CSRGraph.from_graph(G)
+    cc, csr_cc = CC(G), CC(csr)
+    assert cc.count() == csr_cc.count()
+    bfs, csr_bfs = BreadthFirstPaths(G, 0), BreadthFirstPaths(csr, 0)
+    dfs, csr_dfs = DepthFirstPaths(G, 0), DepthFirstPaths(csr, 0)
+    for v in range(G.V()):
+        assert cc.id(v) == csr_cc.id(v)
+        assert bfs.dist_to(v) == csr_bfs.dist_to(v)
+        assert dfs.has_path_to(v) == csr_dfs.has_path_to(v)
+        if dfs.has_path_to(v):
+            assert list(dfs.path_to(v)) == list(csr_dfs.path_to(v))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_digraph_clients(seed):
+    edges = random_edges(25, 50, seed)
+    G = Digraph(25)
+    for v, w in edges:
+        G.add_edge(v, w)
+    csr = CSRDigraph(25, edges)
+    rev, csr_rev = G.reverse(), csr.reverse()
+    for v in range(G.V()):
+        assert sorted(csr.adj(v)) == sorted(G.adj(v))
+        assert sorted(csr_rev.adj(v)) == sorted(rev.adj(v))
+    scc, csr_scc = KosarajuSharirSCC(G), KosarajuSharirSCC(csr)
+    assert scc.count() == csr_scc.count()
+    for v in range(G.V()):
+        for w in range(G.V()):
+            assert scc.strongly_connected(v, w) == csr_scc.strongly_connected(v, w)
+
+
+def test_topological_order():
+    dag = CSRDigraph(5, [(0, 1), (1, 2), (0, 3), (3, 2), (2, 4)])
+    order = list(Topological(dag).order())
+    for v in range(dag.V()):
+        for w in dag.adj(v):
+            assert order.index(v) < order.index(w)
+
+
+def test_self_loop_counts_twice():
+    G = CSRGraph(2, [(0, 0), (0, 1)])
+    assert G.degree(0) == 3
+    assert list(G.adj(1)) == [0]
+
+
+def test_invalid_vertex():
+    with pytest.raises(ValueError):
+        CSRGraph(3, [(0, 3)])
+    with pytest.raises(ValueError):
+        CSRDigraph(3).adj(-1)
+
+
+def test_from_stream(tmp_path):
+    path = tmp_path / "tinyG.txt"
+    path.write_text("4\n3\n0 1\n1 2\n3 3\n")
+    G = CSRGraph.from_stream(InStream(str(path)))
+    assert G.V() == 4
+    assert G.E() == 3
+    assert sorted(G.adj(1)) == [0, 2]
+    assert list(G.adj(3)) == [3, 3]
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.dynamic_cc import DynamicCC, offline_dynamic_cc
+from itu.algs4.graphs.graph import Graph
+
+
+def static_cc(V, edges):
+    G = Graph(V)
+    for v, w in edges:
+        G.add_edge(v, w)
+    return CC(G)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_dynamic_cc_matches_cc(seed):
+    random.seed(seed)
+    V = 30
+    dcc = DynamicCC(V)
+    edges = []
+    for _ in range(300):
+        if edges and random.random() < 0.45:
+            dcc.remove_edge(*edges.pop(random.randrange(len(edges))))
+        else:
+            # parallel edges and self-loops included
+            edge = (random.randrange(V), random.randrange(V))
+            edges.append(edge)
+            dcc.add_edge(*edge)
+        cc = static_cc(V, edges)
+        assert dcc.count() == cc.count()
+        for v in range(V):
+            assert dcc.size(v) == cc.size(v)
+            for w in range(V):
+                assert dcc.connected(v, w) == cc.connected(v, w)
+                assert (dcc.id(v) == dcc.id(w)) == cc.connected(v, w)
+
+
+def test_dynamic_cc_replacement_edge():
+    dcc = DynamicCC(4)
+    for v, w in [(0, 1), (1, 2), (2, 3), (3, 0)]:
+        dcc.add_edge(v, w)
+    assert dcc.count() == 1
+    dcc.remove_edge(1, 2)
+    assert dcc.count() == 1 and dcc.connected(1, 2)
+    dcc.remove_edge(3, 0)
+    assert dcc.count() == 2 and not dcc.connected(0, 3)
+    assert dcc.size(0) == 2 and dcc.id(3) in (2, 3)
+
+
+def test_dynamic_cc_errors():
+    dcc = DynamicCC(3)
+    with pytest.raises(ValueError):
+        dcc.remove_edge(0, 1)
+    with pytest.raises(ValueError):
+        dcc.add_edge(0, 3)
+    with pytest.raises(ValueError):
+        DynamicCC(-1)
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_offline_dynamic_cc(seed):
+    random.seed(seed)
+    V = 25
+    edges = []
+    operations = []
+    expected = []
+    for _ in range(400):
+        if edges and random.random() < 0.4:
+            operations.append(("remove",) + edges.pop(random.randrange(len(edges))))
+        else:
+            edge = (random.randrange(V), random.randrange(V))
+            edges.append(edge)
+            operations.append(("add",) + edge)
+        cc = static_cc(V, edges)
+        v, w = random.randrange(V), random.randrange(V)
+        operations.append(("connected", v, w))
+        expected.append(cc.connected(v, w))
+        operations.append(("count",))
+        expected.append(cc.count())
+    assert offline_dynamic_cc(V, operations) == expected
+
+
+def test_offline_dynamic_cc_errors():
+    assert offline_dynamic_cc(2, []) == []
+    with pytest.raises(ValueError):
+        offline_dynamic_cc(2, [("remove", 0, 1)])
+    with pytest.raises(ValueError):
+        offline_dynamic_cc(2, [("split", 0, 1)])
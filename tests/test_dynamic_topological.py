@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_cycle import DirectedCycle
+from itu.algs4.graphs.dynamic_topological import DynamicTopological
+
+
+def assert_topological(dag):
+    order = dag.order()
+    assert sorted(order) == list(range(dag.V()))
+    for i, v in enumerate(order):
+        assert dag.rank(v) == i
+    for v in range(dag.V()):
+        for w in dag.adj(v):
+            assert dag.rank(v) < dag.rank(w)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_dynamic_topological(seed):
+    random.seed(seed)
+    V = 60
+    dag = DynamicTopological(V)
+    G = Digraph(V)
+    for _ in range(300):
+        v, w = random.randrange(V), random.randrange(V)
+        G.add_edge(v, w)
+        if DirectedCycle(G).has_cycle():
+            # the edge closes a cycle, so it is rejected and G drops it again
+            assert not dag.add_edge(v, w)
+            cycle = list(dag.cycle())
+            assert cycle[0] == cycle[-1] == v and cycle[1] == w
+            for x, y in zip(cycle[1:-1], cycle[2:]):
+                assert y in dag.adj(x)
+            G = Digraph(V)
+            for x in range(V):
+                for y in dag.adj(x):
+                    G.add_edge(x, y)
+        else:
+            assert dag.add_edge(v, w)
+            assert dag.cycle() is None
+        assert_topological(dag)
+    assert dag.E() == G.E()
+
+
+def test_dynamic_topological_rejects_bad_input():
+    dag = DynamicTopological(3)
+    assert not dag.add_edge(1, 1)
+    assert list(dag.cycle()) == [1, 1]
+    assert dag.add_edge(2, 0) and dag.add_edge(0, 1)
+    assert dag.order() == [2, 0, 1]
+    assert not dag.add_edge(1, 2)
+    assert list(dag.cycle()) == [1, 2, 0, 1]
+    with pytest.raises(ValueError):
+        dag.add_edge(0, 3)
+    with pytest.raises(ValueError):
+        DynamicTopological(-1)
@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException, NoSuchElementException
+from itu.algs4.sorting.index_multiway_min_pq import IndexMultiwayMinPQ
+
+
+@pytest.mark.parametrize("d", [2, 3, 4, 8])
+def test_random_operations(d):
+    random.seed(d)
+    N = 300
+    pq = IndexMultiwayMinPQ(N, d)
+    keys = {}
+    for _ in range(5000):
+        op = random.randrange(6)
+        i = random.randrange(N)
+        if op == 0 and i not in keys:
+            keys[i] = random.random()
+            pq.insert(i, keys[i])
+        elif op == 1 and i in keys:
+            keys[i] = random.random()
+            pq.change_key(i, keys[i])
+        elif op == 2 and i in keys:
+            keys[i] /= 2
+            pq.decrease_key(i, keys[i])
+        elif op == 3 and i in keys:
+            del keys[i]
+            pq.delete(i)
+        elif op == 4 and keys:
+            assert pq.min_key() == min(keys.values())
+            del keys[pq.del_min()]
+        elif op == 5:
+            chosen = random.sample(sorted(keys), min(len(keys), random.randrange(40)))
+            for j in chosen:
+                keys[j] *= random.random()
+            pq.decrease_many(chosen, [keys[j] for j in chosen])
+        assert len(pq) == len(keys)
+        for j in random.sample(sorted(keys), min(len(keys), 3)):
+            assert pq.contains(j) and pq.key_of(j) == keys[j]
+    expected = sorted(keys.values())
+    assert [keys[i] for i in pq] == expected
+    assert [keys[pq.del_min()] for _ in range(len(keys))] == expected
+    assert pq.is_empty()
+
+
+def test_insert_many():
+    random.seed(1)
+    keys = [random.random() for _ in range(1000)]
+    pq = IndexMultiwayMinPQ(2000)
+    pq.insert_many(range(1000), keys)
+    pq.insert_many(range(1000, 1010), [0.5] * 10)
+    order = [pq.del_min() for _ in range(1010)]
+    merged = keys + [0.5] * 10
+    assert [merged[i] for i in order] == sorted(merged)
+
+
+def test_errors():
+    pq = IndexMultiwayMinPQ(3)
+    with pytest.raises(NoSuchElementException):
+        pq.del_min()
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(3, 1.0)
+    pq.insert(0, 1.0)
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(0, 2.0)
+    with pytest.raises(IllegalArgumentException):
+        pq.decrease_key(0, 1.0)
+    with pytest.raises(IllegalArgumentException):
+        pq.decrease_many([0, 1], [0.5, 0.5])
+    with pytest.raises(IllegalArgumentException):
+        IndexMultiwayMinPQ(3, 1)
@@ -0,0 +1,73 @@
+from array import array
+
+import pytest
+
+from itu.algs4.stdlib import instream
+from itu.algs4.stdlib.instream import InStream
+
+
+def stream_of(tmp_path, text):
+    path = tmp_path / "input.txt"
+    path.write_text(text)
+    return InStream(str(path))
+
+
+def test_read_tokens(tmp_path):
+    stream = stream_of(tmp_path, "  12 -7 0x1F 017\n3.5 -.25e1 word True 0\n")
+    assert stream.readInt() == 12
+    assert stream.readInt() == -7
+    assert stream.readInt() == 31
+    assert stream.readInt() == 15
+    assert stream.readFloat() == 3.5
+    assert stream.readFloat() == -2.5
+    assert stream.readString() == "word"
+    assert stream.readBool() is True
+    assert stream.readBool() is False
+    assert stream.isEmpty()
+    with pytest.raises(EOFError):
+        stream.readInt()
+
+
+def test_wrong_format(tmp_path):
+    stream = stream_of(tmp_path, "abc 5\n")
+    with pytest.raises(ValueError):
+        stream.readInt()
+    assert stream.readString() == "abc"
+    assert stream.readInt() == 5
+
+
+def test_lines(tmp_path):
+    stream = stream_of(tmp_path, "3 first\nsecond line\n\nlast")
+    assert stream.readInt() == 3
+    assert stream.readLine() == " first"
+    assert stream.readLine() == "second line"
+    assert stream.hasNextLine()
+    assert stream.readLine() == ""
+    assert stream.readAllLines() == ["last"]
+    assert not stream.hasNextLine()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1 << 16])
+def test_tokens_across_chunks(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(instream, "_CHUNK_SIZE", chunk_size)
+    numbers = list(range(-500, 500, 7))
+    lines = [numbers[k : k + 9] for k in range(0, len(numbers), 9)]
+    text = "\n".join(" ".join(str(i) for i in line) for line in lines)
+    stream = stream_of(tmp_path, text)
+    assert [stream.readInt() for _ in range(10)] == numbers[:10]
+    assert stream.readAllInts() == numbers[10:]
+
+
+def test_read_all_typed(tmp_path):
+    stream = stream_of(tmp_path, "1 2\n3\n4.5 6e-1\n")
+    assert stream.readInt() == 1
+    assert stream.readAllFloats("d") == array("d", [2.0, 3.0, 4.5, 0.6])
+    stream = stream_of(tmp_path, "1 2\n3\n")
+    assert stream.readAllInts("i") == array("i", [1, 2, 3])
+
+
+def test_read_all(tmp_path):
+    stream = stream_of(tmp_path, "a b\nc d\n")
+    assert stream.readString() == "a"
+    assert stream.readAll() == " b\nc d\n"
+    assert stream.readAllStrings() == []
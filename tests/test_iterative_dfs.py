@@ -0,0 +1,106 @@
+import random
+
+from itu.algs4.graphs.bipartite import Bipartite
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.cycle import Cycle
+from itu.algs4.graphs.depth_first_order import DepthFirstOrder
+from itu.algs4.graphs.depth_first_paths import DepthFirstPaths
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.directed_cycle import DirectedCycle
+from itu.algs4.graphs.directed_dfs import DirectedDFS
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_directed_cycle import EdgeWeightedDirectedCycle
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.iterative_dfs import iterative_dfs
+from itu.algs4.graphs.kosaraju_sharir_scc import KosarajuSharirSCC
+
+LONG = 20000  # far deeper than the recursion limit
+
+
+def path_graph(G, V, closed=False):
+    for v in range(V - 1):
+        G.add_edge(v, v + 1)
+    if closed:
+        G.add_edge(V - 1, 0)
+    return G
+
+
+def recursive_order(G):
+    # the textbook's recursive depth-first order, as a reference
+    marked = [False] * G.V()
+    pre, post = [], []
+
+    def dfs(v):
+        marked[v] = True
+        pre.append(v)
+        for w in G.adj(v):
+            if not marked[w]:
+                dfs(w)
+        post.append(v)
+
+    for v in range(G.V()):
+        if not marked[v]:
+            dfs(v)
+    return pre, post
+
+
+def test_same_order_as_recursion():
+    random.seed(6)
+    G = Digraph(60)
+    for _ in range(150):
+        G.add_edge(random.randrange(60), random.randrange(60))
+    order = DepthFirstOrder(G)
+    pre, post = recursive_order(G)
+    assert list(order.pre()) == pre
+    assert list(order.post()) == post
+    assert [order.pre(v) for v in pre] == list(range(60))
+
+
+def test_hooks_and_stop():
+    G = path_graph(Digraph(5), 5)
+    G.add_edge(3, 1)
+    events = []
+    stopped = iterative_dfs(
+        G,
+        0,
+        [False] * 5,
+        pre=lambda v: events.append(("pre", v)),
+        post=lambda v: events.append(("post", v)),
+        non_tree_edge=lambda v, w, e: events.append(("back", v, w)) or True,
+    )
+    assert stopped
+    assert events == [("pre", 0), ("pre", 1), ("pre", 2), ("pre", 3), ("back", 3, 1)]
+
+
+def test_long_undirected_path():
+    G = path_graph(Graph(LONG), LONG)
+    paths = DepthFirstPaths(G, 0)
+    assert len(list(paths.path_to(LONG - 1))) == LONG
+    assert CC(G).count() == 1
+    assert not Cycle(G).has_cycle()
+    assert Bipartite(G).is_bipartite()
+
+    G.add_edge(LONG - 1, 0)
+    assert len(list(Cycle(G).cycle())) == LONG + 1
+    assert not Bipartite(path_graph(Graph(LONG + 1), LONG + 1, True)).is_bipartite()
+
+
+def test_long_directed_path():
+    G = path_graph(Digraph(LONG), LONG)
+    assert not DirectedCycle(G).has_cycle()
+    assert list(DepthFirstOrder(G).reverse_post()) == list(range(LONG))
+    assert DirectedDFS(G, LONG // 2, LONG // 2).count() == LONG - LONG // 2
+    assert KosarajuSharirSCC(G).count() == LONG
+
+    G.add_edge(LONG - 1, 0)
+    assert len(list(DirectedCycle(G).cycle())) == LONG + 1
+    assert KosarajuSharirSCC(G).count() == 1
+
+
+def test_long_weighted_cycle():
+    G = EdgeWeightedDigraph(LONG)
+    for v in range(LONG):
+        G.add_edge(DirectedEdge(v, (v + 1) % LONG, 1.0))
+    cycle = list(EdgeWeightedDirectedCycle(G).cycle())
+    assert len(cycle) == LONG
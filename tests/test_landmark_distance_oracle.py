@@ -0,0 +1,52 @@
+import math
+
+import pytest
+
+from itu.algs4.graphs.breadth_first_paths import BreadthFirstPaths
+from itu.algs4.graphs.csr_graph import CSRGraph
+from itu.algs4.graphs.graph import Graph
+from itu.algs4.graphs.landmark_distance_oracle import LandmarkDistanceOracle
+from random_graphs import random_graph
+
+
+def assert_exact(G, oracle):
+    for v in range(0, G.V(), 3):
+        bfs = BreadthFirstPaths(G, v)
+        for w in range(G.V()):
+            lower, upper = oracle.lower_bound(v, w), oracle.upper_bound(v, w)
+            if bfs.has_path_to(w):
+                d = bfs.dist_to(w)
+                assert lower <= d <= upper
+                assert oracle.dist(v, w) == d
+                path = list(oracle.path(v, w))
+                assert len(path) == d + 1 and path[0] == v and path[-1] == w
+                for a, b in zip(path, path[1:]):
+                    assert b in G.adj(a)
+            else:
+                assert upper == math.inf
+                assert oracle.dist(v, w) == math.inf
+                assert not oracle.has_path(v, w) and oracle.path(v, w) is None
+
+
+@pytest.mark.parametrize("V,E,k,seed", [(80, 60, 4, 1), (120, 300, 3, 2), (60, 200, 8, 3)])
+def test_landmark_distance_oracle(V, E, k, seed):
+    G = random_graph(V, E, seed)
+    assert_exact(G, LandmarkDistanceOracle(G, k))
+    assert_exact(G, LandmarkDistanceOracle(CSRGraph.from_graph(G), landmarks=[0]))
+
+
+def test_landmark_distance_oracle_save_load(tmp_path):
+    G = random_graph(100, 150, 4)
+    oracle = LandmarkDistanceOracle(G, 5)
+    path = str(tmp_path / "oracle.bin")
+    oracle.save(path)
+    loaded = LandmarkDistanceOracle.load(path, G)
+    assert loaded.landmarks() == oracle.landmarks()
+    assert_exact(G, loaded)
+    with pytest.raises(ValueError):
+        LandmarkDistanceOracle.load(path, Graph(99))
+    (tmp_path / "other.bin").write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        LandmarkDistanceOracle.load(str(tmp_path / "other.bin"), G)
+    with pytest.raises(ValueError):
+        oracle.dist(0, 100)
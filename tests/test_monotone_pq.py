@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException, NoSuchElementException
+from itu.algs4.sorting.index_bucket_queue import IndexBucketQueue
+from itu.algs4.sorting.index_radix_heap import IndexRadixHeap
+
+STEP = 50
+
+
+@pytest.mark.parametrize(
+    "make", [IndexRadixHeap, lambda n: IndexBucketQueue(n, STEP)], ids=["radix", "bucket"]
+)
+def test_dijkstra_like_operations(make):
+    # keys are always within STEP of the last deleted minimum, as in Dijkstra
+    random.seed(2)
+    N = 400
+    pq = make(N)
+    keys = {}
+    last = 0
+    done = set()
+    for _ in range(6000):
+        i = random.randrange(N)
+        op = random.randrange(3)
+        if op == 0 and i not in keys and i not in done:
+            keys[i] = last + random.randint(0, STEP)
+            pq.insert(i, keys[i])
+        elif op == 1 and i in keys and keys[i] > last:
+            keys[i] = random.randint(last, keys[i] - 1)
+            pq.decrease_key(i, keys[i])
+        elif op == 2 and keys:
+            assert pq.min_key() == min(keys.values())
+            j = pq.del_min()
+            last = keys.pop(j)
+            assert last <= min(keys.values(), default=last)
+            done.add(j)
+        assert len(pq) == len(keys)
+        for j in random.sample(sorted(keys), min(len(keys), 3)):
+            assert pq.contains(j) and pq.key_of(j) == keys[j]
+    while not pq.is_empty():
+        j = pq.del_min()
+        assert keys.pop(j) >= last
+    with pytest.raises(NoSuchElementException):
+        pq.del_min()
+
+
+@pytest.mark.parametrize(
+    "make", [IndexRadixHeap, lambda n: IndexBucketQueue(n, STEP)], ids=["radix", "bucket"]
+)
+def test_monotone_errors(make):
+    pq = make(3)
+    pq.insert_many([0, 1], [10, 20])
+    assert pq.del_min() == 0
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(2, 9)
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(2, 10.5)
+    with pytest.raises(IllegalArgumentException):
+        pq.decrease_key(1, 20)
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(3, 10)
+    pq.decrease_many([1], [10])
+    assert pq.key_of(1) == 10
+
+
+def test_bucket_queue_window():
+    pq = IndexBucketQueue(2, 5)
+    pq.insert(0, 5)
+    with pytest.raises(IllegalArgumentException):
+        pq.insert(1, 6)
@@ -0,0 +1,92 @@
+import subprocess
+import sys
+
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs import kruskal_array_mst
+from itu.algs4.graphs.boruvka_mst import BoruvkaMST
+from itu.algs4.graphs.kruskal_array_mst import KruskalArrayMST
+from random_graphs import random_graph
+
+
+def run_mst(module, G, tmp_path):
+    # KruskalMST and the Prim clients import stdio, through MinPQ or directly,
+    # which replaces sys.stdin, so they are run in a separate process
+    path = tmp_path / "graph.txt"
+    lines = ["{}".format(G.V()), "{}".format(G.E())]
+    for e in G.edges():
+        v = e.either()
+        lines.append("{} {} {}".format(v, e.other(v), e.weight()))
+    path.write_text("\n".join(lines) + "\n")
+    command = [sys.executable, "-m", "itu.algs4.graphs." + module, str(path)]
+    output = subprocess.run(command, stdout=subprocess.PIPE, check=True).stdout
+    return float(output.split()[-1])
+
+
+def assert_spanning_forest(G, mst):
+    # the edges form a forest with one tree per connected component of G
+    parent = list(range(G.V()))
+
+    def find(v):
+        while parent[v] != v:
+            v = parent[v]
+        return v
+
+    count = 0
+    for e in mst.edges():
+        v = e.either()
+        root_v, root_w = find(v), find(e.other(v))
+        assert root_v != root_w
+        parent[root_v] = root_w
+        count += 1
+    for e in G.edges():
+        v = e.either()
+        assert find(v) == find(e.other(v))
+    assert mst.weight() == pytest.approx(sum(e.weight() for e in mst.edges()))
+    return count
+
+
+@pytest.mark.parametrize("V,E,seed", [(50, 200, 1), (60, 50, 2), (30, 400, 3)])
+def test_kruskal_array(V, E, seed, tmp_path):
+    G = random_graph(V, E, seed, weighted=True)
+    mst = KruskalArrayMST(G)
+    assert_spanning_forest(G, mst)
+    assert mst.weight() == pytest.approx(run_mst("kruskal_mst", G, tmp_path), abs=1e-5)
+
+
+def test_kruskal_array_batches(monkeypatch):
+    G = random_graph(40, 300, 8, weighted=True)
+    expected = KruskalArrayMST(G)
+    monkeypatch.setattr(kruskal_array_mst, "_BATCH_SIZE", 7)
+    mst = KruskalArrayMST(G)
+    assert assert_spanning_forest(G, mst) == expected.edges().size()
+    assert mst.weight() == pytest.approx(expected.weight())
+
+
+def test_kruskal_array_from_arrays():
+    G = random_graph(40, 150, 4, weighted=True)
+    either, other, weights = [], [], []
+    for e in G.edges():
+        v = e.either()
+        either.append(v)
+        other.append(e.other(v))
+        weights.append(e.weight())
+    mst = KruskalArrayMST.from_arrays(G.V(), either, other, weights)
+    assert assert_spanning_forest(G, mst) == mst.edges().size()
+    assert mst.weight() == pytest.approx(KruskalArrayMST(G).weight())
+    with pytest.raises(IllegalArgumentException):
+        KruskalArrayMST.from_arrays(2, [0], [1, 0], [1.0])
+    with pytest.raises(IllegalArgumentException):
+        KruskalArrayMST.from_arrays(2, [0], [2], [1.0])
+    assert KruskalArrayMST.from_arrays(0, [], [], []).edges().is_empty()
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+@pytest.mark.parametrize("V,E,seed", [(50, 200, 5), (60, 50, 6), (30, 400, 7)])
+def test_boruvka(V, E, seed, processes):
+    G = random_graph(V, E, seed, weighted=True)
+    mst = BoruvkaMST(G, processes=processes, chunk_size=40, cutoff=1)
+    count = assert_spanning_forest(G, mst)
+    assert count == KruskalArrayMST(G).edges().size()
+    assert mst.weight() == pytest.approx(KruskalArrayMST(G).weight())
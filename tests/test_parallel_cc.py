@@ -0,0 +1,39 @@
+import pytest
+
+from itu.algs4.graphs.cc import CC
+from itu.algs4.graphs.csr_graph import CSRGraph
+from itu.algs4.graphs.parallel_cc import ParallelCC
+from random_graphs import random_graph
+
+
+def assert_same_components(cc, expected, V):
+    assert cc.count() == expected.count()
+    for v in range(V):
+        assert cc.id(v) == expected.id(v)
+        assert cc.size(v) == expected.size(v)
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("processes", [1, 2])
+def test_parallel_cc_matches_cc(seed, processes):
+    G = random_graph(200, 150, seed)
+    cc = ParallelCC(G, processes=processes, chunk_size=40, cutoff=1)
+    assert_same_components(cc, CC(G), G.V())
+    assert_same_components(ParallelCC(CSRGraph.from_graph(G), 1), CC(G), G.V())
+
+
+def test_parallel_cc_from_arrays():
+    G = random_graph(100, 80, 4)
+    tails = [v for v in range(G.V()) for w in G.adj(v)]
+    heads = [w for v in range(G.V()) for w in G.adj(v)]
+    cc = ParallelCC.from_arrays(
+        G.V(), tails, heads, processes=2, chunk_size=25, cutoff=1
+    )
+    assert_same_components(cc, CC(G), G.V())
+    assert cc.connected(tails[0], heads[0])
+    with pytest.raises(ValueError):
+        ParallelCC.from_arrays(3, [0, 1], [2])
+    with pytest.raises(ValueError):
+        ParallelCC.from_arrays(3, [0], [3])
+    with pytest.raises(ValueError):
+        cc.id(100)
@@ -0,0 +1,46 @@
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs.csr_graph import CSRDigraph
+from itu.algs4.graphs.digraph import Digraph
+from itu.algs4.graphs.kosaraju_sharir_scc import KosarajuSharirSCC
+from itu.algs4.graphs.tarjan_scc import TarjanSCC, strong_components
+from random_graphs import random_digraph
+
+
+@pytest.mark.parametrize("V,E,seed", [(50, 40, 1), (50, 80, 2), (200, 300, 3)])
+def test_tarjan_scc(V, E, seed):
+    G = random_digraph(V, E, seed)
+    scc = TarjanSCC(G)
+    other = KosarajuSharirSCC(G)
+    assert scc.count() == other.count()
+    for v in range(V):
+        for w in range(V):
+            assert scc.strongly_connected(v, w) == other.strongly_connected(v, w)
+    assert TarjanSCC(CSRDigraph.from_graph(G)).count() == scc.count()
+    with pytest.raises(IllegalArgumentException):
+        scc.id(V)
+
+
+def test_strong_components_in_reverse_topological_order():
+    G = random_digraph(300, 400, 4)
+    components = list(strong_components(G))
+    assert sorted(v for c in components for v in c) == list(range(300))
+    order = {v: i for i, c in enumerate(components) for v in c}
+    for v in range(G.V()):
+        for w in G.adj(v):
+            assert order[w] <= order[v]
+
+
+def test_tarjan_scc_long_cycle():
+    # far deeper than the recursion limit
+    V = 100000
+    G = Digraph(V)
+    for v in range(V):
+        G.add_edge(v, (v + 1) % V)
+    G.add_edge(0, V // 2)
+    assert TarjanSCC(G).count() == 1
+    G = Digraph(V)
+    for v in range(V - 1):
+        G.add_edge(v, v + 1)
+    assert TarjanSCC(G).count() == V
@@ -0,0 +1,406 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import (
+    IllegalArgumentException,
+    UnsupportedOperationException,
+)
+from itu.algs4.graphs.acyclic_sp import AcyclicSP
+from itu.algs4.graphs.bellman_ford_array_sp import BellmanFordArraySP
+from itu.algs4.graphs.bellman_ford_sp import BellmanFordSP
+from itu.algs4.graphs.bidirectional_dijkstra_sp import BidirectionalDijkstraSP
+from itu.algs4.graphs.contraction_hierarchy_sp import ContractionHierarchySP
+from itu.algs4.graphs.csr_edge_weighted_digraph import CSREdgeWeightedDigraph
+from itu.algs4.graphs.delta_stepping_sp import DeltaSteppingSP
+from itu.algs4.graphs.dijkstra_sp import DijkstraSP
+from itu.algs4.graphs.dijkstra_undirected_sp import DijkstraUndirectedSP
+from itu.algs4.graphs.directed_edge import DirectedEdge
+from itu.algs4.graphs.edge import Edge
+from itu.algs4.graphs.edge_weighted_digraph import EdgeWeightedDigraph
+from itu.algs4.graphs.edge_weighted_graph import EdgeWeightedGraph
+from itu.algs4.graphs.floyd_warshall import FloydWarshall
+from itu.algs4.graphs.johnson_all_pairs_sp import JohnsonAllPairsSP
+from itu.algs4.graphs.parallel_dijkstra_all_pairs_sp import ParallelDijkstraAllPairsSP
+from random_graphs import random_digraph
+
+
+def grid_digraph(n, seed):
+    # an n-by-n grid with edges both ways between neighbours, weighted between
+    # 1 and 2, so that the Manhattan distance is a consistent potential
+    random.seed(seed)
+    G = EdgeWeightedDigraph(n * n)
+    for v in range(n * n):
+        for w in (v + 1, v + n):
+            if (w == v + 1 and w % n == 0) or w >= n * n:
+                continue
+            G.add_edge(DirectedEdge(v, w, round(random.uniform(1.0, 2.0), 2)))
+            G.add_edge(DirectedEdge(w, v, round(random.uniform(1.0, 2.0), 2)))
+    return G
+
+
+def assert_path(G, path, s, t, dist):
+    v = s
+    for e in path:
+        assert e.from_vertex() == v
+        v = e.to_vertex()
+    assert v == t
+    assert sum(e.weight() for e in path) == pytest.approx(dist)
+
+
+def assert_same_distances(sp, other, V):
+    for v in range(V):
+        assert sp.has_path_to(v) == other.has_path_to(v)
+        if sp.has_path_to(v):
+            assert sp.dist_to(v) == pytest.approx(other.dist_to(v))
+            assert sum(e.weight() for e in other.path_to(v)) == pytest.approx(
+                other.dist_to(v)
+            )
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_csr_digraph_roundtrip(tmp_path, seed):
+    G = random_digraph(30, 90, seed, weighted=True)
+    path = str(tmp_path / "graph.bin")
+    CSREdgeWeightedDigraph.from_graph(G).save(path)
+    loaded = CSREdgeWeightedDigraph.load(path)
+    assert loaded.V() == G.V()
+    assert loaded.E() == G.E()
+    for v in range(G.V()):
+        assert loaded.outdegree(v) == G.outdegree(v)
+        assert loaded.indegree(v) == G.indegree(v)
+        expected = [(e.to_vertex(), e.weight()) for e in G.adj(v)]
+        assert [(e.to_vertex(), e.weight()) for e in loaded.adj(v)] == expected
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_csr_digraph_with_sp_clients(tmp_path, seed):
+    G = random_digraph(30, 90, seed, weighted=True)
+    path = str(tmp_path / "graph.bin")
+    CSREdgeWeightedDigraph(G.V(), G.edges()).save(path)
+    loaded = CSREdgeWeightedDigraph.load(path)
+    assert_same_distances(DijkstraSP(G, 0), DijkstraSP(loaded, 0), G.V())
+    assert_same_distances(DijkstraSP(G, 0), BellmanFordSP(loaded, 0), G.V())
+
+    dag = random_digraph(30, 90, seed, acyclic=True, weighted=True)
+    CSREdgeWeightedDigraph.from_graph(dag).save(path)
+    loaded = CSREdgeWeightedDigraph.load(path)
+    assert_same_distances(AcyclicSP(dag, 0), AcyclicSP(loaded, 0), dag.V())
+
+
+def test_csr_digraph_rejects_other_files(tmp_path):
+    path = tmp_path / "graph.bin"
+    path.write_bytes(b"not a graph file at all, just some bytes")
+    with pytest.raises(ValueError):
+        CSREdgeWeightedDigraph.load(str(path))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_bidirectional_dijkstra(seed):
+    G = random_digraph(25, 60, seed, weighted=True)
+    p2p = BidirectionalDijkstraSP(G)
+    for s in range(G.V()):
+        sp = DijkstraSP(G, s)
+        for t in range(G.V()):
+            assert p2p.has_path(s, t) == sp.has_path_to(t)
+            if sp.has_path_to(t):
+                assert p2p.dist(s, t) == pytest.approx(sp.dist_to(t))
+                assert_path(G, p2p.path(s, t), s, t, sp.dist_to(t))
+            else:
+                assert p2p.path(s, t) is None
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_a_star(seed):
+    n = 12
+    G = grid_digraph(n, seed)
+
+    def manhattan(v, t):
+        return abs(v // n - t // n) + abs(v % n - t % n)
+
+    p2p = BidirectionalDijkstraSP(G, manhattan)
+    random.seed(seed)
+    for _ in range(20):
+        s, t = random.randrange(n * n), random.randrange(n * n)
+        dist = DijkstraSP(G, s).dist_to(t)
+        assert p2p.dist(s, t) == pytest.approx(dist)
+        assert_path(G, p2p.path(s, t), s, t, dist)
+
+
+def test_point_to_point_rejects_negative_weights():
+    G = EdgeWeightedDigraph(2)
+    G.add_edge(DirectedEdge(0, 1, -1.0))
+    with pytest.raises(IllegalArgumentException):
+        BidirectionalDijkstraSP(G)
+
+
+@pytest.mark.parametrize(
+    "G", [random_digraph(30, 90, 4, weighted=True), grid_digraph(8, 4)]
+)
+def test_contraction_hierarchy(tmp_path, G):
+    path = str(tmp_path / "graph.ch")
+    ContractionHierarchySP(G).save(path)
+    ch = ContractionHierarchySP.load(path)
+    for s in range(G.V()):
+        sp = DijkstraSP(G, s)
+        for t in range(G.V()):
+            assert ch.has_path(s, t) == sp.has_path_to(t)
+            if sp.has_path_to(t):
+                assert ch.dist(s, t) == pytest.approx(sp.dist_to(t))
+                assert_path(G, ch.path(s, t), s, t, sp.dist_to(t))
+            else:
+                assert ch.path(s, t) is None
+
+
+def test_contraction_hierarchy_rejects_other_files(tmp_path):
+    path = tmp_path / "graph.ch"
+    path.write_bytes(b"ALGS4EWD and then some more bytes")
+    with pytest.raises(ValueError):
+        ContractionHierarchySP.load(str(path))
+    with pytest.raises(ValueError):
+        ContractionHierarchySP(random_digraph(3, 3, 1, weighted=True)).dist(0, 3)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_parallel_dijkstra_all_pairs(processes):
+    G = random_digraph(40, 120, 5, weighted=True)
+    apsp = ParallelDijkstraAllPairsSP(G, processes=processes, chunk_size=3)
+    for s in range(G.V()):
+        sp = DijkstraSP(G, s)
+        for t in range(G.V()):
+            assert apsp.has_path(s, t) == sp.has_path_to(t)
+            if sp.has_path_to(t):
+                assert apsp.dist(s, t) == pytest.approx(sp.dist_to(t))
+                assert_path(G, apsp.path(s, t), s, t, sp.dist_to(t))
+            else:
+                assert apsp.path(s, t) is None
+    with pytest.raises(ValueError):
+        apsp.dist(0, 40)
+
+
+def test_parallel_dijkstra_all_pairs_rejects_negative_weights():
+    G = EdgeWeightedDigraph(2)
+    G.add_edge(DirectedEdge(0, 1, -1.0))
+    with pytest.raises(IllegalArgumentException):
+        ParallelDijkstraAllPairsSP(G)
+
+
+@pytest.mark.parametrize("seed", [1, 2])
+def test_dijkstra_undirected(seed):
+    random.seed(seed)
+    V = 50
+    G = EdgeWeightedGraph(V)
+    D = EdgeWeightedDigraph(V)
+    for _ in range(150):
+        v, w, weight = random.randrange(V), random.randrange(V), random.random()
+        G.add_edge(Edge(v, w, weight))
+        D.add_edge(DirectedEdge(v, w, weight))
+        D.add_edge(DirectedEdge(w, v, weight))
+    sp = DijkstraUndirectedSP(G, 0)
+    other = DijkstraSP(D, 0)
+    for v in range(V):
+        assert sp.has_path_to(v) == other.has_path_to(v)
+        if sp.has_path_to(v):
+            assert sp.dist_to(v) == pytest.approx(other.dist_to(v))
+            assert sum(e.weight() for e in sp.path_to(v)) == pytest.approx(
+                sp.dist_to(v)
+            )
+
+
+@pytest.mark.parametrize("max_weight", [0, 1, 9, 5000])
+def test_dijkstra_integer_weights(max_weight):
+    random.seed(max_weight)
+    V = 60
+    G = EdgeWeightedDigraph(V)
+    for _ in range(240):
+        v, w = random.randrange(V), random.randrange(V)
+        G.add_edge(DirectedEdge(v, w, random.randint(0, max_weight)))
+    for s in range(0, V, 7):
+        assert_same_distances(BellmanFordSP(G, s), DijkstraSP(G, s), V)
+
+
+@pytest.mark.parametrize("weight", [1e19, 2**62])
+def test_dijkstra_large_integer_weights(weight):
+    # weights whose distances do not fit the 64-bit keys of the integer queues
+    G = EdgeWeightedDigraph(4)
+    for v in range(3):
+        G.add_edge(DirectedEdge(v, v + 1, weight))
+    G.add_edge(DirectedEdge(0, 3, 4 * weight))
+    sp = DijkstraSP(G, 0)
+    assert sp.dist_to(3) == pytest.approx(3 * weight)
+    assert [e.to_vertex() for e in sp.path_to(3)] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "G", [random_digraph(50, 200, 6, weighted=True), grid_digraph(9, 6)]
+)
+@pytest.mark.parametrize("delta", [None, 0.05, 1.0, 100.0])
+def test_delta_stepping(G, delta):
+    for s in (0, 17, 40):
+        sp = DeltaSteppingSP(G, s, delta)
+        assert_same_distances(DijkstraSP(G, s), sp, G.V())
+        for v in range(G.V()):
+            if sp.has_path_to(v):
+                assert_path(G, sp.path_to(v), s, v, sp.dist_to(v))
+
+
+@pytest.mark.parametrize(
+    "G", [random_digraph(50, 200, 7, weighted=True), grid_digraph(9, 7)]
+)
+@pytest.mark.parametrize("cutoff", [1, 20])
+def test_delta_stepping_parallel(G, cutoff):
+    # a small cutoff sends the phases to the pool of workers
+    for s in (0, 40):
+        sp = DeltaSteppingSP(G, s, 0.5, processes=2, cutoff=cutoff)
+        assert_same_distances(DijkstraSP(G, s), sp, G.V())
+        for v in range(G.V()):
+            if sp.has_path_to(v):
+                assert_path(G, sp.path_to(v), s, v, sp.dist_to(v))
+
+
+def test_delta_stepping_rejects_bad_input():
+    G = EdgeWeightedDigraph(2)
+    G.add_edge(DirectedEdge(0, 1, -1.0))
+    with pytest.raises(IllegalArgumentException):
+        DeltaSteppingSP(G, 0)
+    with pytest.raises(IllegalArgumentException):
+        DeltaSteppingSP(random_digraph(3, 3, 1, weighted=True), 3)
+    with pytest.raises(IllegalArgumentException):
+        DeltaSteppingSP(random_digraph(3, 3, 1, weighted=True), 0, 0.0)
+
+
+def reweighted_digraph(V, E, seed):
+    # a digraph with negative weights but no negative cycle: every weight is
+    # nonnegative after adding the potential of its tail and subtracting
+    # that of its head
+    random.seed(seed)
+    potential = [random.uniform(0.0, 5.0) for _ in range(V)]
+    G = EdgeWeightedDigraph(V)
+    for _ in range(E):
+        v, w = random.randrange(V), random.randrange(V)
+        weight = random.uniform(0.0, 1.0) - potential[v] + potential[w]
+        G.add_edge(DirectedEdge(v, w, weight))
+    return G
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_bellman_ford_array(seed):
+    G = reweighted_digraph(40, 160, seed)
+    for s in (0, 13):
+        sp = BellmanFordArraySP(G, s)
+        other = BellmanFordSP(G, s)
+        assert not sp.has_negative_cycle() and sp.negative_cycle() is None
+        for v in range(G.V()):
+            assert sp.has_path_to(v) == other.has_path_to(v)
+            if sp.has_path_to(v):
+                assert sp.dist_to(v) == pytest.approx(other.dist_to(v))
+                assert_path(G, sp.path_to(v), s, v, sp.dist_to(v))
+
+
+@pytest.mark.parametrize("seed", [4, 5, 6, 7])
+def test_bellman_ford_array_negative_cycle(seed):
+    G = random_digraph(40, 160, seed, weighted=True)
+    random.seed(seed)
+    for _ in range(3):
+        v, w = random.randrange(40), random.randrange(40)
+        G.add_edge(DirectedEdge(v, w, -random.uniform(0.5, 3.0)))
+    sp = BellmanFordArraySP(G, 0)
+    assert sp.has_negative_cycle() == BellmanFordSP(G, 0).has_negative_cycle()
+    if sp.has_negative_cycle():
+        cycle = list(sp.negative_cycle())
+        assert sum(e.weight() for e in cycle) < 0
+        for e, f in zip(cycle, cycle[1:] + cycle[:1]):
+            assert e.to_vertex() == f.from_vertex()
+        with pytest.raises(UnsupportedOperationException):
+            sp.dist_to(0)
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_johnson_all_pairs(processes):
+    G = reweighted_digraph(30, 90, 8)
+    apsp = JohnsonAllPairsSP(G, processes=processes, chunk_size=4)
+    assert not apsp.has_negative_cycle()
+    for s in range(G.V()):
+        sp = BellmanFordSP(G, s)
+        for t in range(G.V()):
+            assert apsp.has_path(s, t) == sp.has_path_to(t)
+            if sp.has_path_to(t):
+                assert apsp.dist(s, t) == pytest.approx(sp.dist_to(t))
+                assert_path(G, apsp.path(s, t), s, t, sp.dist_to(t))
+            else:
+                assert apsp.path(s, t) is None
+    with pytest.raises(ValueError):
+        apsp.dist(0, 30)
+
+
+def test_johnson_all_pairs_on_loaded_digraph(tmp_path):
+    G = reweighted_digraph(20, 60, 9)
+    filename = str(tmp_path / "g.bin")
+    CSREdgeWeightedDigraph.from_graph(G).save(filename)
+    apsp = JohnsonAllPairsSP(CSREdgeWeightedDigraph.load(filename), processes=1)
+    expected = JohnsonAllPairsSP(G, processes=1)
+    for s in range(G.V()):
+        for t in range(G.V()):
+            assert apsp.dist(s, t) == pytest.approx(expected.dist(s, t))
+            if apsp.has_path(s, t):
+                assert_path(G, apsp.path(s, t), s, t, expected.dist(s, t))
+
+
+def test_csr_digraph_arrays(tmp_path):
+    G = CSREdgeWeightedDigraph(
+        3, [DirectedEdge(0, 1, 2.0), DirectedEdge(0, 1, 0.5), DirectedEdge(1, 2, 1.0)]
+    )
+    filename = str(tmp_path / "g.bin")
+    G.save(filename)
+    loaded = CSREdgeWeightedDigraph.load(filename)
+    copy = CSREdgeWeightedDigraph.from_arrays(3, *loaded.arrays())
+    assert [list(a) for a in copy.arrays()] == [list(a) for a in G.arrays()]
+    assert loaded.lightest_edge(0, 1).weight() == 0.5
+    assert loaded.lightest_edge(1, 0) is None
+    with pytest.raises(IllegalArgumentException):
+        CSREdgeWeightedDigraph.from_arrays(3, [0, 1, 1], [1], [1.0])
+    with pytest.raises(IllegalArgumentException):
+        CSREdgeWeightedDigraph.from_arrays(2, [0, 1, 1], [2], [1.0])
+
+
+def test_johnson_all_pairs_negative_cycle():
+    G = random_digraph(10, 30, 2, weighted=True)
+    G.add_edge(DirectedEdge(7, 8, -2.0))
+    G.add_edge(DirectedEdge(8, 7, -1.0))
+    apsp = JohnsonAllPairsSP(G, processes=1)
+    assert apsp.has_negative_cycle()
+    assert sum(e.weight() for e in apsp.negative_cycle()) < 0
+    with pytest.raises(UnsupportedOperationException):
+        apsp.dist(0, 1)
+
+
+@pytest.mark.parametrize("V,E", [(30, 90), (15, 225)])
+def test_floyd_warshall(V, E):
+    G = reweighted_digraph(V, E, 9)
+    apsp = FloydWarshall(G)
+    assert not apsp.has_negative_cycle()
+    for s in range(G.V()):
+        sp = BellmanFordSP(G, s)
+        for t in range(G.V()):
+            assert apsp.has_path(s, t) == sp.has_path_to(t)
+            if sp.has_path_to(t):
+                assert apsp.dist(s, t) == pytest.approx(sp.dist_to(t))
+                assert_path(G, apsp.path(s, t), s, t, sp.dist_to(t))
+            else:
+                assert apsp.path(s, t) is None
+    with pytest.raises(ValueError):
+        apsp.dist(0, V)
+
+
+def test_floyd_warshall_negative_cycle():
+    G = random_digraph(10, 30, 2, weighted=True)
+    G.add_edge(DirectedEdge(7, 8, -2.0))
+    G.add_edge(DirectedEdge(8, 7, -1.0))
+    apsp = FloydWarshall(G)
+    assert apsp.has_negative_cycle()
+    cycle = list(apsp.negative_cycle())
+    assert sum(e.weight() for e in cycle) < 0
+    for e, f in zip(cycle, cycle[1:] + cycle[:1]):
+        assert e.to_vertex() == f.from_vertex()
+    with pytest.raises(UnsupportedOperationException):
+        apsp.dist(0, 1)
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+
+import pytest
+
+from itu.algs4.graphs.symbol_graph_builder import SymbolGraphBuilder
+
+ROUTES = """JFK MCO
+ORD DEN
+ORD HOU
+DFW PHX
+JFK ATL
+ORD DFW
+ORD PHX
+ATL HOU
+DEN PHX
+PHX LAX
+JFK ORD
+DEN LAS
+DFW HOU
+ORD ATL
+LAS LAX
+ATL MCO
+HOU MCO
+LAS PHX
+"""
+
+
+@pytest.fixture
+def routes(tmp_path):
+    path = tmp_path / "routes.txt"
+    path.write_text(ROUTES)
+    return str(path)
+
+
+def adjacency(builder, G):
+    names = builder.names()
+    return {names[v]: sorted(names[w] for w in G.adj(v)) for v in range(G.V())}
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_symbol_graph_builder(routes, directed, tmp_path):
+    builder = SymbolGraphBuilder(directed).read(routes, " ")
+    assert builder.V() == 10 and builder.E() == 18
+    assert builder.names()[:3] == ["JFK", "MCO", "ORD"]
+    assert builder.index()["ORD"] == 2
+    G = builder.graph()
+    expected = {name: [] for name in builder.names()}
+    for line in ROUTES.split("\n")[:-1]:
+        v, w = line.split(" ")
+        expected[v].append(w)
+        if not directed:
+            expected[w].append(v)
+    assert adjacency(builder, G) == {v: sorted(ws) for v, ws in expected.items()}
+    assert adjacency(builder, builder.csr()) == adjacency(builder, G)
+
+    path = str(tmp_path / "routes.bin")
+    builder.save(path)
+    loaded = SymbolGraphBuilder.load(path)
+    assert loaded.is_directed() == directed
+    assert loaded.names() == builder.names()
+    assert loaded.index() == builder.index()
+    assert adjacency(loaded, loaded.graph()) == adjacency(builder, G)
+
+
+def test_symbol_graph_builder_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a symbol graph file at all, but long enough" * 2)
+    with pytest.raises(ValueError):
+        SymbolGraphBuilder.load(str(path))
+    builder = SymbolGraphBuilder()
+    builder.add_edge("a", "\xe9")
+    builder.save(str(path))
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        SymbolGraphBuilder.load(str(path))
+    builder.add_edge("a", "b\nc")
+    with pytest.raises(ValueError):
+        builder.save(str(path))
+
+
+def test_symbol_graph_builder_blank_line(tmp_path):
+    path = tmp_path / "blank.txt"
+    path.write_text("a b\n\nb c\n")
+    builder = SymbolGraphBuilder().read(str(path), " ")
+    assert builder.names() == ["a", "b", "", "c"] and builder.E() == 2
+
+
+def test_symbol_graph_client(routes):
+    # SymbolGraph imports stdio, which replaces sys.stdin, so its client is
+    # run in a separate process
+    command = [sys.executable, "-m", "itu.algs4.graphs.symbol_graph", routes, " "]
+    output = subprocess.run(
+        command, input=b"JFK\n", stdout=subprocess.PIPE, check=True
+    ).stdout.decode()
+    lines = output.split("\n")
+    assert lines[0] == "Done reading {}".format(routes)
+    assert sorted(line.strip() for line in lines[1:] if line) == ["ATL", "MCO", "ORD"]
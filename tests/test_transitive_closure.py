@@ -0,0 +1,25 @@
+import pytest
+
+from itu.algs4.errors.errors import IllegalArgumentException
+from itu.algs4.graphs.bitset_transitive_closure import BitsetTransitiveClosure
+from itu.algs4.graphs.transitive_closure import TransitiveClosure
+from random_graphs import random_digraph
+
+
+@pytest.mark.parametrize(
+    "G",
+    [
+        random_digraph(1, 0, 1),
+        random_digraph(40, 50, 2),
+        random_digraph(40, 120, 3),
+        random_digraph(70, 300, 4, acyclic=True),
+    ],
+)
+def test_bitset_transitive_closure(G):
+    tc = TransitiveClosure(G)
+    bitset = BitsetTransitiveClosure(G)
+    for v in range(G.V()):
+        for w in range(G.V()):
+            assert bitset.reachable(v, w) == tc.reachable(v, w)
+    with pytest.raises(IllegalArgumentException):
+        bitset.reachable(0, G.V())
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from itu.algs4.errors.errors import UnsupportedOperationException
+from itu.algs4.fundamentals.uf import UF, WeightedQuickUnionUF
+
+
+def components(uf, n):
+    return [uf.find(p) == uf.find(q) for p in range(n) for q in range(n)]
+
+
+@pytest.mark.parametrize("typecode", [None, "i", "q"])
+@pytest.mark.parametrize("undoable", [False, True])
+def test_union_many_matches_union(typecode, undoable):
+    random.seed(7)
+    n = 50
+    ps = [random.randrange(n) for _ in range(60)]
+    qs = [random.randrange(n) for _ in range(60)]
+    uf = UF(n, typecode, undoable)
+    reference = WeightedQuickUnionUF(n)
+    merged = uf.union_many(ps, qs)
+    for i, (p, q) in enumerate(zip(ps, qs)):
+        assert merged[i] == (not reference.connected(p, q))
+        reference.union(p, q)
+    assert uf.count() == reference.count()
+    assert components(uf, n) == components(reference, n)
+    assert uf.find_many(range(n)) == [uf.find(p) for p in range(n)]
+
+
+def test_union_many_stop_at():
+    uf = UF(5, "i")
+    merged = uf.union_many([0, 1, 0, 2, 3, 0], [1, 0, 2, 3, 4, 4], stop_at=2)
+    assert list(merged) == [1, 0, 1, 1, 0, 0]
+    assert uf.count() == 2 and not uf.connected(3, 4)
+    merged = uf.union_many([3, 0], [4, 4], stop_at=2)
+    assert list(merged) == [0, 0]
+    assert uf.count() == 2 and not uf.connected(3, 4)
+
+
+def test_rollback():
+    random.seed(3)
+    n = 40
+    uf = UF(n, "i", undoable=True)
+    uf.union_many([0, 1, 2], [1, 2, 3])
+    start = uf.checkpoint()
+    before = components(uf, n)
+    for _ in range(30):
+        uf.union(random.randrange(n), random.randrange(n))
+    middle = uf.checkpoint()
+    after = components(uf, n)
+    count = uf.count()
+    uf.union_many([random.randrange(n) for _ in range(30)], list(range(30)))
+    uf.rollback(middle)
+    assert uf.count() == count and components(uf, n) == after
+    uf.rollback(start)
+    assert uf.count() == n - 3 and components(uf, n) == before
+    uf.rollback(0)
+    assert uf.count() == n
+
+
+def test_errors():
+    uf = UF(3)
+    with pytest.raises(UnsupportedOperationException):
+        uf.checkpoint()
+    with pytest.raises(ValueError):
+        uf.union_many([0, 1], [2])
+    with pytest.raises(ValueError):
+        uf.find_many([0, 3])
+    with pytest.raises(ValueError):
+        UF(3, undoable=True).rollback(1)